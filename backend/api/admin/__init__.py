@@ -5,13 +5,15 @@ from .tax_admin import TaxAdmin
 from .customer_admin import CustomerAdmin
 # Registrar no admin.py principal
 # apps/assets/admin/__init__.py
-from .assets_admin import AssetAdmin, AssetGroupAdmin, AssetCategoryAdmin, AssetMovementAdmin, Asset
+from .assets_admin import AssetAdmin, AssetGroupAdmin, AssetCategoryAdmin, AssetMovementAdmin, Asset, StockLedgerEntryAdmin, StockBalanceSnapshotAdmin, AssetStockAdmin, MaintenancePlanAdmin, MaintenanceRecordAdmin, MovementRollupAdmin
 from .company_admin import CompanyAdmin
 from .user_admin import UserAdmin
 from .location_admin import LocationAdmin
 from .asset_location_admin import AssetLocationAdmin, AssetLocation
 from .usersession_admin import UserSessionAdmin
-from .supplies_price_list_admin import SuppliesPriceListAdmin
+from .supplies_price_list_admin import SuppliesPriceListAdmin, CustomerPriceListAdmin
+from .work_schedule_admin import WorkScheduleAdmin, HolidayAdmin
+from .contract_admin import ContractAdmin
 
 all__ = [
     'BaseAdmin', 
@@ -26,6 +28,11 @@ all__ = [
     
     'SupplyAdmin',
     'SuppliesPriceListAdmin',
+
+    'WorkScheduleAdmin',
+    'HolidayAdmin',
+
+    'ContractAdmin',
     
     'LocationAdmin', 
 
@@ -34,4 +41,10 @@ all__ = [
     'AssetCategoryAdmin',
     'AssetMovementAdmin',
     'AssetLocationAdmin',
+    'StockLedgerEntryAdmin',
+    'StockBalanceSnapshotAdmin',
+    'AssetStockAdmin',
+    'MaintenancePlanAdmin',
+    'MaintenanceRecordAdmin',
+    'MovementRollupAdmin',
     ]
\ No newline at end of file
@@ -2,7 +2,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 from django.db.models import F, Sum
-from ..models import Asset, AssetGroup, AssetCategory, AssetMovement, Location
+from ..models import Asset, AssetGroup, AssetCategory, AssetMovement, Location, StockLedgerEntry, StockBalanceSnapshot, AssetStock, MaintenancePlan, MaintenanceRecord, MovementRollup, AssetCodeSequence
 
 
 @admin.register(AssetGroup)
@@ -26,8 +26,8 @@ class AssetGroupAdmin(admin.ModelAdmin):
 
 @admin.register(AssetCategory)
 class AssetCategoryAdmin(admin.ModelAdmin):
-    list_display = ('code', 'name', 'asset_group', 'enabled', 'created')
-    list_filter = ('enabled', 'asset_group', 'created')
+    list_display = ('code', 'name', 'asset_group', 'depreciation_method', 'enabled', 'created')
+    list_filter = ('enabled', 'asset_group', 'depreciation_method', 'created')
     search_fields = ('name', 'code', 'description')
     ordering = ('name',)
     readonly_fields = ('created', 'updated')
@@ -37,6 +37,9 @@ class AssetCategoryAdmin(admin.ModelAdmin):
         ('Informações Básicas', {
             'fields': ('name', 'code', 'description', 'asset_group')
         }),
+        ('Depreciação', {
+            'fields': ('depreciation_method', 'useful_life_months', 'depreciation_rate', 'residual_value_percent')
+        }),
         ('Controle', {
             'fields': ('enabled', 'created', 'updated'),
             'classes': ('collapse',)
@@ -239,4 +242,99 @@ class AssetMovementAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         # Filtra para mostrar apenas registros da empresa do usuário logado
-        return super().get_queryset(request).filter(company=request.user.company)
\ No newline at end of file
+        return super().get_queryset(request).filter(company=request.user.company)
+
+@admin.register(StockLedgerEntry)
+class StockLedgerEntryAdmin(admin.ModelAdmin):
+    """Razão de estoque: somente leitura"""
+    list_display = ('movement_date', 'asset', 'entry_type', 'quantity_delta', 'balance', 'movement', 'location')
+    list_filter = ('movement_date', 'entry_type')
+    search_fields = ('asset__name', 'asset__asset_code')
+    list_select_related = ('asset', 'movement', 'location')
+    ordering = ('-stockledgerentry_id',)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(company=request.user.company)
+
+
+@admin.register(StockBalanceSnapshot)
+class StockBalanceSnapshotAdmin(admin.ModelAdmin):
+    list_display = ('snapshot_date', 'asset', 'balance')
+    list_filter = ('snapshot_date',)
+    search_fields = ('asset__name', 'asset__asset_code')
+    list_select_related = ('asset',)
+    readonly_fields = ('asset', 'snapshot_date', 'balance', 'created', 'updated')
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(company=request.user.company)
+
+
+@admin.register(AssetStock)
+class AssetStockAdmin(admin.ModelAdmin):
+    list_display = ('location', 'asset', 'quantity', 'updated')
+    list_filter = ('location',)
+    search_fields = ('asset__name', 'asset__asset_code', 'location__name')
+    list_select_related = ('asset', 'location')
+    readonly_fields = ('asset', 'location', 'quantity', 'created', 'updated')
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(company=request.user.company)
+
+
+@admin.register(MaintenancePlan)
+class MaintenancePlanAdmin(admin.ModelAdmin):
+    list_display = ('name', 'category', 'interval_days', 'enabled', 'updated')
+    list_filter = ('enabled', 'category')
+    search_fields = ('name', 'category__name')
+    list_select_related = ('category',)
+    readonly_fields = ('created', 'updated')
+
+
+@admin.register(MaintenanceRecord)
+class MaintenanceRecordAdmin(admin.ModelAdmin):
+    list_display = ('asset', 'plan', 'performed_at', 'performed_by', 'applied')
+    list_filter = ('applied', 'plan', 'performed_at')
+    search_fields = ('asset__name', 'asset__asset_code')
+    list_select_related = ('asset', 'plan', 'performed_by')
+    readonly_fields = ('applied', 'created', 'updated')
+    date_hierarchy = 'performed_at'
+
+
+@admin.register(MovementRollup)
+class MovementRollupAdmin(admin.ModelAdmin):
+    list_display = ('period', 'period_start', 'asset_group', 'location', 'movement_type', 'quantity', 'total_value', 'movement_count')
+    list_filter = ('period', 'movement_type', 'asset_group', 'location')
+    list_select_related = ('asset_group', 'location')
+    date_hierarchy = 'period_start'
+    readonly_fields = (
+        'period', 'period_start', 'asset_group', 'location', 'movement_type',
+        'quantity', 'total_value', 'movement_count', 'created', 'updated'
+    )
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).filter(company=request.user.company)
+
+
+
+@admin.register(AssetCodeSequence)
+class AssetCodeSequenceAdmin(admin.ModelAdmin):
+    list_display = ('company', 'prefix', 'pattern', 'next_value', 'block_size', 'updated')
+    readonly_fields = ('created', 'updated')
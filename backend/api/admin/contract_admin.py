@@ -0,0 +1,22 @@
+# api/admin/contract_admin.py
+from django.contrib import admin
+from ..models import Contract, ContractLine
+from .base_admin import BaseAdmin
+
+
+class ContractLineInline(admin.TabularInline):
+    model = ContractLine
+    extra = 0
+    fields = ('supply', 'work_schedule', 'quantity', 'unit_price', 'manual_price', 'total_value', 'enabled')
+    readonly_fields = ('total_value',)
+
+
+@admin.register(Contract)
+class ContractAdmin(BaseAdmin):
+    """Admin configuration for Contract model"""
+    list_display = ('number', 'customer', 'status', 'start_date', 'total_value', 'enabled')
+    list_filter = ('status', 'enabled')
+    search_fields = ('number', 'customer__name')
+    readonly_fields = ('total_value', 'created', 'updated')
+    list_select_related = ('customer',)
+    inlines = [ContractLineInline]
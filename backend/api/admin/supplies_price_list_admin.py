@@ -1,6 +1,6 @@
 # api/admin/supplies_price_list_admin.py
 from django.contrib import admin
-from ..models import SuppliesPriceList
+from ..models import SuppliesPriceList, CustomerPriceList
 from .base_admin import BaseAdmin
 
 @admin.register(SuppliesPriceList)
@@ -71,4 +71,12 @@ class SuppliesPriceListAdmin(BaseAdmin):
             kwargs["queryset"] = db_field.related_model.objects.filter(
                 company=request.user.company, enabled=True
             )
-        return super().formfield_for_foreignkey(db_field, request, **kwargs)
\ No newline at end of file
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
+@admin.register(CustomerPriceList)
+class CustomerPriceListAdmin(BaseAdmin):
+    """Admin configuration for CustomerPriceList model"""
+    list_display = ('customer', 'supply', 'value', 'enabled', 'updated')
+    list_filter = ('enabled',)
+    search_fields = ('customer__name', 'supply__name')
+    list_select_related = ('customer', 'supply')
@@ -0,0 +1,20 @@
+# api/admin/work_schedule_admin.py
+from django.contrib import admin
+from ..models import WorkSchedule, Holiday
+from .base_admin import BaseAdmin
+
+
+@admin.register(WorkSchedule)
+class WorkScheduleAdmin(BaseAdmin):
+    """Admin configuration for WorkSchedule model"""
+    list_display = ('code', 'name', 'schedule_type', 'start_time', 'works_holidays', 'enabled')
+    list_filter = ('schedule_type', 'works_holidays', 'enabled')
+    search_fields = ('code', 'name')
+
+
+@admin.register(Holiday)
+class HolidayAdmin(BaseAdmin):
+    """Admin configuration for Holiday model"""
+    list_display = ('date', 'description', 'recurring', 'enabled')
+    list_filter = ('recurring', 'enabled')
+    search_fields = ('description',)
@@ -1,11 +1,79 @@
-from rest_framework_simplejwt.authentication import JWTAuthentication
+import copy
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.utils.cache import TTLCache, bump_version, get_version, get_versions
+
+USER_VERSION_KEY = 'auth_user_version:{user_id}'
+COMPANY_VERSION_KEY = 'auth_company_version:{company_id}'
+
 
 class CustomJWTAuthentication(JWTAuthentication):
+    """
+    Autenticação JWT que carrega o usuário já com a empresa (uma consulta)
+    e mantém esse retrato em cache no processo por AUTH_USER_CACHE_TTL
+    segundos.
+
+    Cada entrada guarda as versões do usuário e da empresa vigentes quando
+    foi carregada; salvar ou excluir o usuário ou a empresa incrementa a
+    versão (ver api/signals.py) e a entrada deixa de valer. Alterações feitas
+    com QuerySet.update() não disparam sinais e valem ao fim do TTL.
+
+    As versões ficam no cache VERSION_CACHE_ALIAS: sem CACHE_REDIS_URL ele é
+    local ao processo, e desativar um usuário só invalida os outros workers
+    ao fim do TTL.
+    """
+    _users = TTLCache(
+        maxsize=getattr(settings, 'AUTH_USER_CACHE_MAX_ENTRIES', 1024),
+        ttl=getattr(settings, 'AUTH_USER_CACHE_TTL', 60)
+    )
+
+    @staticmethod
+    def invalidate_user(user_id) -> None:
+        bump_version(USER_VERSION_KEY.format(user_id=user_id))
+
+    @staticmethod
+    def invalidate_company(company_id) -> None:
+        bump_version(COMPANY_VERSION_KEY.format(company_id=company_id))
+
+    @staticmethod
+    def _versions(user_id, company_id) -> tuple:
+        return tuple(get_versions([
+            USER_VERSION_KEY.format(user_id=user_id),
+            COMPANY_VERSION_KEY.format(company_id=company_id)
+        ]))
+
+    @staticmethod
+    def _company_version(company_id) -> int:
+        return get_version(COMPANY_VERSION_KEY.format(company_id=company_id))
+
     def get_user(self, validated_token):
         try:
-            user_id = validated_token['user_id']
-            User = get_user_model()
-            return User.objects.get(id=user_id, enabled=True)
-        except User.DoesNotExist:
-            return None
\ No newline at end of file
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken('Token sem identificação do usuário')
+
+        cached = self._users.get(user_id)
+        if cached is not None:
+            versions, user = cached
+            if self._versions(user_id, user.company_id) == versions:
+                # Cópia por requisição: a instância em cache não é alterada pelas views
+                return copy.copy(user)
+
+        # Versão lida antes da consulta: uma alteração concorrente invalida a entrada
+        user_version = get_version(USER_VERSION_KEY.format(user_id=user_id))
+        User = get_user_model()
+        user = User.objects.select_related('company').filter(
+            **{api_settings.USER_ID_FIELD: user_id},
+            enabled=True
+        ).first()
+        if user is None:
+            self._users.delete(user_id)
+            raise AuthenticationFailed('Usuário não encontrado ou desativado', code='user_not_found')
+
+        self._users.set(user_id, ((user_version, self._company_version(user.company_id)), user))
+        return copy.copy(user)
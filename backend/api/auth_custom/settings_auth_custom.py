@@ -15,6 +15,6 @@ JWT_SETTINGS = {
 
 AUTH_SETTINGS = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'api.auth_custom.authentication.CustomJWTAuthentication',
+        'api.auth_custom.authentication_auth_custom.CustomJWTAuthentication',
     ),
 }
@@ -274,5 +274,5 @@ class EndSessionView(TokenObtainPairView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        session.end_session()
+        UserSessionService.end_session(session)
         return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
@@ -0,0 +1,41 @@
+# api/benchmarks/benchmark_test.py
+"""
+Cenários de benchmark executados pelo pytest-benchmark (requirements/test.txt):
+
+    pytest --ds=backend.settings api/benchmarks/benchmark_test.py
+
+Os dados sintéticos são criados uma vez por módulo no banco de testes;
+PRICING_BENCHMARK_SIZE define o tamanho da lista de preços (padrão: 1000).
+O piso de vazão das movimentações concorrentes é verificado aqui, fora da
+suíte de testes.
+"""
+import os
+
+import pytest
+
+from .pricing_benchmark import SCENARIOS, build_dataset
+from .stock_benchmark import MIN_MOVEMENTS_PER_SECOND, build_asset, concurrent_movements
+
+PRICING_SIZE = int(os.environ.get('PRICING_BENCHMARK_SIZE', 1000))
+
+
+@pytest.fixture(scope='module')
+def pricing_dataset(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        return build_dataset(PRICING_SIZE)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('scenario', list(SCENARIOS))
+def test_pricing(benchmark, pricing_dataset, scenario):
+    benchmark.group = f'pricing-{PRICING_SIZE}'
+    rows = benchmark(SCENARIOS[scenario](pricing_dataset))
+    assert rows >= 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_movements(benchmark):
+    benchmark.group = 'stock'
+    operations = benchmark.pedantic(concurrent_movements(build_asset()), rounds=3)
+    if benchmark.stats:
+        assert operations / benchmark.stats.stats.mean > MIN_MOVEMENTS_PER_SECOND
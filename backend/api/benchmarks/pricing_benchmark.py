@@ -0,0 +1,316 @@
+# api/benchmarks/pricing_benchmark.py
+"""
+Cenários de benchmark do motor de preços.
+
+Cada cenário é um callable sem argumentos criado a partir de um
+BenchmarkDataset; pode ser cronometrado pelo comando `pricing_benchmark`
+ou passado diretamente ao fixture `benchmark` do pytest-benchmark.
+"""
+import io
+import random
+from dataclasses import dataclass
+from datetime import date, time
+from decimal import Decimal
+from typing import Callable, List
+
+from django.db import connection, transaction
+
+from ..models import (
+    Company, Customer, CustomerPriceList, Supply, Tax, SuppliesPriceList,
+    WorkSchedule, Contract, ContractLine
+)
+from ..models.types_model import CalcOperator, TaxGroup, TaxType
+from ..services.contract_service import ContractService
+from ..services.price_list_service import PriceListService
+from ..services.price_resolver_service import PriceResolverService
+from ..services.pricing_service import PricingService
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+COMPONENTS_PER_SUPPLY = 4
+TAX_COUNT = 20
+QUOTE_ITEMS = 50
+LINES_PER_CONTRACT = 10
+BATCH_SIZE = 5000
+
+TAX_OPERATORS = [
+    (CalcOperator.PERCENTAGE, Decimal('5')),
+    (CalcOperator.ADDITION, Decimal('2.5')),
+    (CalcOperator.MULTIPLICATION, Decimal('1.1')),
+    (CalcOperator.SUBTRACTION, Decimal('1')),
+]
+UNIT_MEASURES = [
+    Supply.UnitMeasure.UNIT,
+    Supply.UnitMeasure.HOUR,
+    Supply.UnitMeasure.DAY,
+    Supply.UnitMeasure.MONTH,
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkDataset:
+    """Empresa sintética e ids usados pelos cenários"""
+    company_id: str
+    size: int
+    supply_ids: List[int]
+    customer_ids: List[int]
+    tax_ids: List[int]
+    schedule_id: int
+
+
+def company_code(size: int) -> str:
+    return f'BENCH{size}'
+
+
+def _purge(company_id: str) -> None:
+    """
+    Remove os dados sintéticos da empresa de benchmark com um DELETE por
+    tabela, restrito à empresa e sem carregar os objetos (com milhões de
+    linhas o delete do ORM dispararia sinais por registro). As tabelas são
+    apagadas das dependentes para as referenciadas; uma referência de fora
+    do benchmark faz o DELETE falhar em vez de ser apagada em cascata.
+    """
+    if not company_id.startswith('BENCH'):
+        raise ValueError(f'Empresa fora do benchmark: {company_id}')
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model in (ContractLine, Contract, CustomerPriceList, SuppliesPriceList, Customer, Supply, Tax, WorkSchedule):
+            cursor.execute(
+                f'DELETE FROM {connection.ops.quote_name(model._meta.db_table)} '
+                f'WHERE {connection.ops.quote_name(model._meta.get_field("company").column)} = %s',
+                [company_id]
+            )
+
+
+def _load(company_id: str, size: int) -> BenchmarkDataset:
+    return BenchmarkDataset(
+        company_id=company_id,
+        size=size,
+        supply_ids=list(Supply.objects.filter(company_id=company_id).order_by('pk').values_list('pk', flat=True)),
+        customer_ids=list(Customer.objects.filter(company_id=company_id).order_by('pk').values_list('pk', flat=True)),
+        tax_ids=list(Tax.objects.filter(company_id=company_id).order_by('pk').values_list('pk', flat=True)),
+        schedule_id=WorkSchedule.objects.filter(company_id=company_id).values_list('pk', flat=True).first(),
+    )
+
+
+def build_dataset(size: int, rebuild: bool = False, seed: int = 42) -> BenchmarkDataset:
+    """
+    Gera (ou reutiliza) uma empresa sintética com `size` linhas de lista de preços,
+    distribuídas em size / COMPONENTS_PER_SUPPLY insumos, além de clientes,
+    preços negociados e contratos em rascunho para os cenários de repricing
+    """
+    company_id = company_code(size)
+    company, _ = Company.objects.get_or_create(
+        company_id=company_id,
+        defaults={'name': f'Benchmark {size}'}
+    )
+
+    if not rebuild and SuppliesPriceList.objects.filter(company_id=company_id).count() == size:
+        return _load(company_id, size)
+
+    rng = random.Random(seed)
+    _purge(company_id)
+
+    with transaction.atomic():
+        Tax.objects.bulk_create([
+            Tax(
+                company=company,
+                description=f'Imposto {index}',
+                acronym=f'T{index}',
+                type=TaxType.TAX,
+                group=TaxGroup.OTHER,
+                calc_operator=TAX_OPERATORS[index % len(TAX_OPERATORS)][0],
+                value=TAX_OPERATORS[index % len(TAX_OPERATORS)][1],
+            )
+            for index in range(TAX_COUNT)
+        ])
+        tax_ids = list(Tax.objects.filter(company=company).order_by('pk').values_list('pk', flat=True))
+
+        supply_count = max(1, size // COMPONENTS_PER_SUPPLY)
+        Supply.objects.bulk_create([
+            Supply(
+                company=company,
+                name=f'Insumo {index:07d}',
+                unit_measure=UNIT_MEASURES[index % len(UNIT_MEASURES)],
+                type=Supply.SupplyType.MATERIAL,
+            )
+            for index in range(supply_count)
+        ], batch_size=BATCH_SIZE)
+        supply_ids = list(Supply.objects.filter(company=company).order_by('pk').values_list('pk', flat=True))
+
+        # Um componente sem imposto e os demais com impostos distintos por insumo
+        rows = []
+        for index in range(size):
+            supply_id = supply_ids[index % supply_count]
+            component = index // supply_count
+            tax_id = tax_ids[(supply_id + component) % len(tax_ids)] if component else None
+            rows.append(SuppliesPriceList(
+                company=company,
+                supply_id=supply_id,
+                tax_id=tax_id,
+                sequence=component + 1,
+                value=Decimal(rng.randint(100, 100000)) / 100,
+            ))
+            if len(rows) >= BATCH_SIZE:
+                SuppliesPriceList.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+                rows = []
+        SuppliesPriceList.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+        customer_count = max(10, size // 1000)
+        Customer.objects.bulk_create([
+            Customer(company=company, name=f'Cliente {index:05d}', celphone='0')
+            for index in range(customer_count)
+        ], batch_size=BATCH_SIZE)
+        customer_ids = list(Customer.objects.filter(company=company).order_by('pk').values_list('pk', flat=True))
+
+        schedule = WorkSchedule.objects.create(
+            company=company,
+            name='Comercial',
+            code='BENCH',
+            schedule_type=WorkSchedule.ScheduleType.WEEKLY,
+            work_days='12345',
+            daily_hours=8,
+            start_time=time(8, 0),
+        )
+
+        CustomerPriceList.objects.bulk_create([
+            CustomerPriceList(
+                company=company,
+                customer_id=customer_id,
+                supply_id=supply_id,
+                value=Decimal(rng.randint(100, 100000)) / 100,
+            )
+            for customer_id in customer_ids
+            for supply_id in rng.sample(supply_ids, min(len(supply_ids), 20))
+        ], batch_size=BATCH_SIZE)
+
+        contract_count = max(1, size // (LINES_PER_CONTRACT * 10))
+        Contract.objects.bulk_create([
+            Contract(
+                company=company,
+                number=f'B-{index:06d}',
+                customer_id=customer_ids[index % len(customer_ids)],
+                start_date=date(2026, 1, 1),
+            )
+            for index in range(contract_count)
+        ], batch_size=BATCH_SIZE)
+        contract_ids = list(Contract.objects.filter(company=company).order_by('pk').values_list('pk', flat=True))
+
+        lines = []
+        for contract_id in contract_ids:
+            for sequence in range(1, LINES_PER_CONTRACT + 1):
+                lines.append(ContractLine(
+                    company=company,
+                    contract_id=contract_id,
+                    supply_id=rng.choice(supply_ids),
+                    work_schedule=schedule,
+                    quantity=Decimal(rng.randint(1, 10)),
+                    sequence=sequence,
+                ))
+            if len(lines) >= BATCH_SIZE:
+                ContractLine.objects.bulk_create(lines, batch_size=BATCH_SIZE)
+                lines = []
+        ContractLine.objects.bulk_create(lines, batch_size=BATCH_SIZE)
+
+    return _load(company_id, size)
+
+
+def catalog_pricing(dataset: BenchmarkDataset) -> Callable[[], int]:
+    """Preço de todo o catálogo da empresa"""
+    def run():
+        return len(PricingService.get_supply_prices(dataset.company_id))
+    return run
+
+
+def quote_pricing(dataset: BenchmarkDataset, items: int = QUOTE_ITEMS) -> Callable[[], int]:
+    """Orçamento com `items` insumos para um cliente, com o cache de preços frio"""
+    rng = random.Random(dataset.size)
+    supply_ids = rng.sample(dataset.supply_ids, min(items, len(dataset.supply_ids)))
+    customer_id = rng.choice(dataset.customer_ids)
+    schedule = WorkSchedule.objects.get(pk=dataset.schedule_id)
+    units = dict(Supply.objects.filter(pk__in=supply_ids).values_list('pk', 'unit_measure'))
+
+    def run():
+        PriceResolverService.invalidate(dataset.company_id)
+        prices = PriceResolverService.resolve(dataset.company_id, supply_ids, customer_id)
+        total = Decimal('0')
+        for supply_id, resolved in prices.items():
+            total += PricingService.monthly_value(
+                resolved.value or Decimal('0'), units[supply_id], schedule, 2026, 1
+            )
+        return len(prices)
+    return run
+
+
+def what_if_repricing(dataset: BenchmarkDataset) -> Callable[[], int]:
+    """
+    Simula o aumento de um imposto e recalcula os contratos em rascunho
+    afetados; a transação é desfeita ao final
+    """
+    tax_id = dataset.tax_ids[0]
+
+    def run():
+        repriced = 0
+        try:
+            with transaction.atomic():
+                tax = Tax.objects.get(pk=tax_id)
+                Tax.objects.filter(pk=tax_id).update(value=tax.value + 1)
+                tax.value += 1
+                PriceResolverService.invalidate(dataset.company_id)
+                repriced = ContractService.reprice_for_tax(tax)
+                raise _Rollback
+        except _Rollback:
+            pass
+        PriceResolverService.invalidate(dataset.company_id)
+        return repriced
+    return run
+
+
+def _price_lists(company_id: str):
+    return SuppliesPriceList.objects.filter(company_id=company_id, enabled=True)
+
+
+def price_list_export(dataset: BenchmarkDataset) -> Callable[[], int]:
+    """Exportação CSV da lista de preços, pelo mesmo serviço do endpoint `export`"""
+    def run():
+        return PriceListService.export_csv(_price_lists(dataset.company_id), io.StringIO())
+    return run
+
+
+def price_list_import(dataset: BenchmarkDataset) -> Callable[[], int]:
+    """
+    Importação (endpoint `import_prices`) do catálogo exportado com 10% dos
+    valores reajustados; a transação é desfeita
+    """
+    stream = io.StringIO()
+    PriceListService.export_csv(_price_lists(dataset.company_id), stream)
+    lines = stream.getvalue().splitlines()
+    value_column = lines[0].split(';').index('"Valor"')
+    for index in range(1, len(lines), 10):
+        row = lines[index].split(';')
+        row[value_column] = f'"{Decimal(row[value_column].strip(chr(34))) + 1}"'
+        lines[index] = ';'.join(row)
+
+    def run():
+        imported = 0
+        try:
+            with transaction.atomic():
+                imported, _ = PriceListService.import_csv(dataset.company_id, lines)
+                raise _Rollback
+        except _Rollback:
+            pass
+        PriceResolverService.invalidate(dataset.company_id)
+        return imported
+    return run
+
+
+SCENARIOS = {
+    'catalog_pricing': catalog_pricing,
+    'quote_pricing': quote_pricing,
+    'what_if_repricing': what_if_repricing,
+    'price_list_export': price_list_export,
+    'price_list_import': price_list_import,
+}
@@ -0,0 +1,101 @@
+# api/benchmarks/stock_benchmark.py
+"""
+Cenários de benchmark das movimentações de estoque.
+
+Como em pricing_benchmark, cada cenário é um callable sem argumentos. O
+piso de vazão (MIN_MOVEMENTS_PER_SECOND) é verificado pelo benchmark, não
+pela suíte de testes: depende da máquina e do banco.
+"""
+import threading
+from contextlib import nullcontext
+from decimal import Decimal
+from typing import Callable, Dict
+
+from django.db import close_old_connections, connection
+
+from ..models import Company, AssetGroup, AssetCategory, Asset, AssetMovement
+from ..services.stock_service import StockService, InsufficientStockError
+
+THREADS = 16
+OPERATIONS = 50
+INITIAL_QUANTITY = Decimal('100')
+MIN_MOVEMENTS_PER_SECOND = 50
+
+BENCH_COMPANY = 'BENCHSTOCK'
+
+
+def writer_lock():
+    """
+    Sem bloqueio de linha no banco (SQLite), escritas simultâneas falham com
+    "database is locked": as escritas são serializadas no processo e cada
+    operação continua sendo o UPDATE condicional com F()
+    """
+    if connection.features.has_select_for_update:
+        return nullcontext()
+    return threading.Lock()
+
+
+def run_concurrent_movements(asset_id: int, threads: int = THREADS, operations: int = OPERATIONS) -> Dict[str, int]:
+    """
+    Várias threads movimentando o mesmo ativo em paralelo (1 entrada a
+    cada 4 operações, as demais saídas de uma unidade)
+
+    Returns:
+        dict: entradas, saídas e rejeições por falta de saldo
+    """
+    results = {'exits': 0, 'entries': 0, 'rejected': 0}
+    lock = threading.Lock()
+    writer = writer_lock()
+    start = threading.Barrier(threads)
+
+    def worker(index):
+        start.wait()
+        try:
+            for operation in range(operations):
+                movement_type = AssetMovement.ENTRY if (index + operation) % 4 == 0 else AssetMovement.EXIT
+                try:
+                    with writer:
+                        StockService.apply(asset_id, movement_type, Decimal('1'))
+                except InsufficientStockError:
+                    outcome = 'rejected'
+                else:
+                    outcome = 'entries' if movement_type == AssetMovement.ENTRY else 'exits'
+                with lock:
+                    results[outcome] += 1
+        finally:
+            close_old_connections()
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return results
+
+
+def build_asset(company_id: str = BENCH_COMPANY, quantity: Decimal = INITIAL_QUANTITY) -> Asset:
+    """Ativo sintético da empresa de benchmark (reutilizado se já existir)"""
+    company, _ = Company.objects.get_or_create(company_id=company_id, defaults={'name': 'Benchmark Estoque'})
+    group, _ = AssetGroup.objects.get_or_create(company=company, code='BENCH', defaults={'name': 'Benchmark'})
+    category, _ = AssetCategory.objects.get_or_create(
+        company=company, code='BENCH', defaults={'name': 'Benchmark', 'asset_group': group}
+    )
+    asset = Asset.objects.filter(company=company, asset_code='BENCH-001').first()
+    if asset is not None:
+        return asset
+    return Asset.objects.create(
+        company=company,
+        name='Benchmark',
+        asset_group=group,
+        category=category,
+        asset_code='BENCH-001',
+        unit_measure='UN',
+        quantity=quantity
+    )
+
+
+def concurrent_movements(asset: Asset, threads: int = THREADS, operations: int = OPERATIONS) -> Callable[[], int]:
+    """Movimentações concorrentes de um ativo; retorna as operações executadas"""
+    def run():
+        return sum(run_concurrent_movements(asset.pk, threads, operations).values())
+    return run
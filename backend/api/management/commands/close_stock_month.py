@@ -0,0 +1,44 @@
+# api/management/commands/close_stock_month.py
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.models import Company
+from api.services.stock_ledger_service import StockLedgerService
+
+
+class Command(BaseCommand):
+    help = 'Fechamento mensal de estoque: grava o saldo de cada ativo no último dia do mês'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--month',
+            help='Mês a fechar no formato AAAA-MM (padrão: mês anterior)'
+        )
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+
+    def handle(self, *args, **options):
+        if options['month']:
+            try:
+                year, month = (int(part) for part in options['month'].split('-'))
+                date(year, month, 1)
+            except ValueError:
+                raise CommandError('--month deve estar no formato AAAA-MM')
+        else:
+            first_day = date.today().replace(day=1)
+            year, month = (first_day.year - 1, 12) if first_day.month == 1 else (first_day.year, first_day.month - 1)
+
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            with transaction.atomic():
+                count = StockLedgerService.close_month(company_id, year, month)
+            self.stdout.write(
+                self.style.SUCCESS(f'{company_id}: {count} saldos fechados em {month:02d}/{year}')
+            )
@@ -0,0 +1,133 @@
+# api/management/commands/pricing_benchmark.py
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.benchmarks.pricing_benchmark import DEFAULT_SIZES, SCENARIOS, build_dataset
+
+
+class Command(BaseCommand):
+    help = (
+        'Executa o benchmark do motor de preços sobre empresas sintéticas '
+        '(1k/10k/100k/1M linhas de lista de preços) e grava os resultados em JSON'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default=','.join(str(size) for size in DEFAULT_SIZES[:2]),
+            help='Quantidades de linhas de lista de preços, separadas por vírgula (ex: 1000,10000,100000,1000000)'
+        )
+        parser.add_argument(
+            '--scenarios',
+            default=','.join(SCENARIOS),
+            help=f'Cenários a executar: {", ".join(SCENARIOS)}'
+        )
+        parser.add_argument('--repeat', type=int, default=3, help='Execuções por cenário')
+        parser.add_argument('--rebuild', action='store_true', help='Recria os dados sintéticos')
+        parser.add_argument('--output', help='Arquivo JSON de saída (padrão: stdout)')
+        parser.add_argument('--compare', help='Arquivo JSON de uma execução anterior para comparação')
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options['sizes'].split(',') if size]
+        except ValueError:
+            raise CommandError('--sizes deve conter apenas números')
+
+        scenarios = [name for name in options['scenarios'].split(',') if name]
+        unknown = set(scenarios) - set(SCENARIOS)
+        if unknown:
+            raise CommandError(f'Cenários desconhecidos: {", ".join(sorted(unknown))}')
+
+        results = []
+        for size in sizes:
+            started = time.perf_counter()
+            dataset = build_dataset(size, rebuild=options['rebuild'])
+            self.stderr.write(f'Dataset {dataset.company_id}: {time.perf_counter() - started:.2f}s')
+
+            for name in scenarios:
+                results.append(self._run(name, SCENARIOS[name](dataset), size, options['repeat']))
+                result = results[-1]
+                self.stderr.write(
+                    f'  {name:<20} min={result["min"]:.4f}s median={result["median"]:.4f}s '
+                    f'queries={result["queries"]}'
+                )
+
+        report = {
+            'commit': self._commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'results': results,
+        }
+
+        if options['compare']:
+            self._compare(report, options['compare'])
+
+        content = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(content)
+            self.stderr.write(self.style.SUCCESS(f'Resultados gravados em {options["output"]}'))
+        else:
+            self.stdout.write(content)
+
+    def _run(self, name, scenario, size, repeat):
+        # A primeira execução conta as consultas e aquece caches de conexão/calendário
+        with CaptureQueriesContext(connection) as queries:
+            rows = scenario()
+
+        timings = []
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            scenario()
+            timings.append(time.perf_counter() - started)
+
+        return {
+            'scenario': name,
+            'size': size,
+            'rows': rows,
+            'queries': len(queries),
+            'runs': len(timings),
+            'min': min(timings),
+            'median': statistics.median(timings),
+            'mean': statistics.mean(timings),
+        }
+
+    def _commit(self):
+        try:
+            return subprocess.check_output(
+                ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def _compare(self, report, path):
+        with open(path) as file:
+            baseline = {
+                (result['scenario'], result['size']): result
+                for result in json.load(file)['results']
+            }
+
+        self.stderr.write(f'Comparação com {path}:')
+        for result in report['results']:
+            previous = baseline.get((result['scenario'], result['size']))
+            if not previous or not previous['median']:
+                continue
+            ratio = result['median'] / previous['median']
+            result['baseline_median'] = previous['median']
+            result['ratio'] = round(ratio, 3)
+            style = self.style.ERROR if ratio > 1.1 else self.style.SUCCESS
+            self.stderr.write(style(
+                f'  {result["scenario"]:<20} {result["size"]:>8} '
+                f'{previous["median"]:.4f}s -> {result["median"]:.4f}s ({ratio:.2f}x)'
+            ))
@@ -0,0 +1,26 @@
+# api/management/commands/rebuild_asset_stock.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.models import Company
+from api.services.asset_stock_service import AssetStockService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula os saldos de ativos por local a partir das movimentações aprovadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+
+    def handle(self, *args, **options):
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            with transaction.atomic():
+                count = AssetStockService.rebuild(company_id)
+            self.stdout.write(self.style.SUCCESS(f'{company_id}: {count} saldos por local recalculados'))
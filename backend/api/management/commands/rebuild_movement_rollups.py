@@ -0,0 +1,42 @@
+# api/management/commands/rebuild_movement_rollups.py
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.models import Company
+from api.services.movement_rollup_service import MovementRollupService
+
+
+class Command(BaseCommand):
+    help = 'Reconstrói os totais diários e mensais de movimentações a partir das movimentações aprovadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+        parser.add_argument('--start', help='Primeiro mês AAAA-MM-DD (padrão: todo o histórico)')
+        parser.add_argument('--end', help='Último mês AAAA-MM-DD (padrão: todo o histórico)')
+
+    def _date(self, value):
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise CommandError('Data inválida. Use o formato AAAA-MM-DD.')
+
+    def handle(self, *args, **options):
+        start, end = self._date(options['start']), self._date(options['end'])
+        if start and end and start > end:
+            raise CommandError('A data inicial deve ser anterior à data final.')
+
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            with transaction.atomic():
+                count = MovementRollupService.rebuild(company_id, start, end)
+            self.stdout.write(self.style.SUCCESS(f'{company_id}: {count} totais gravados'))
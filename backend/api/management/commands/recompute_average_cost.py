@@ -0,0 +1,40 @@
+# api/management/commands/recompute_average_cost.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from api.models import Company
+from api.services.valuation_service import ValuationService, RECOMPUTE_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = 'Recalcula o custo médio móvel dos ativos a partir do histórico de movimentações aprovadas'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=RECOMPUTE_CHUNK_SIZE,
+            help=f'Movimentações lidas e custos gravados por lote (padrão: {RECOMPUTE_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('O tamanho do lote deve ser maior que zero.')
+
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            started = time.perf_counter()
+            with transaction.atomic():
+                count = ValuationService.recompute_average_costs(company_id, options['chunk_size'])
+            self.stdout.write(self.style.SUCCESS(
+                f'{company_id}: custo médio de {count} ativos recalculado em {time.perf_counter() - started:.2f}s'
+            ))
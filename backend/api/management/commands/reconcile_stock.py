@@ -0,0 +1,50 @@
+# api/management/commands/reconcile_stock.py
+from django.core.management.base import BaseCommand
+
+from api.models import Company
+from api.services.stock_reconciliation_service import StockReconciliationService, REPORT_DEFAULT_LIMIT
+
+
+class Command(BaseCommand):
+    help = 'Compara a quantidade dos ativos com o saldo das movimentações aprovadas e opcionalmente corrige'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Corrige a quantidade dos ativos divergentes'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=REPORT_DEFAULT_LIMIT,
+            help=f'Ativos listados no relatório (padrão: {REPORT_DEFAULT_LIMIT})'
+        )
+
+    def handle(self, *args, **options):
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            report = StockReconciliationService.report(company_id, options['limit'])
+            self.stdout.write(f"{company_id}: {report['drifted']} de {report['checked']} ativos divergentes")
+            for row in report['results']:
+                self.stdout.write(
+                    f"  {row['asset_code']:<20} gravado={row['quantity']} "
+                    f"esperado={row['expected']} diferença={row['drift']:+} "
+                    f"({row['movement_count']} movimentações)"
+                )
+            if report['negative_expected']:
+                self.stdout.write(self.style.WARNING(
+                    f"{company_id}: {report['negative_expected']} ativos com saldo esperado negativo "
+                    f"não serão corrigidos"
+                ))
+
+            if options['fix'] and report['drifted']:
+                fixed = StockReconciliationService.fix(company_id)
+                self.stdout.write(self.style.SUCCESS(f'{company_id}: {fixed} ativos corrigidos'))
@@ -0,0 +1,64 @@
+# api/management/commands/revalue_assets.py
+from datetime import date
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import Company
+from api.services.depreciation_service import DepreciationService, REVALUE_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        'Recalcula o valor atual dos ativos pela depreciação da categoria. '
+        'Pode ser agendado (ex.: cron diário ou mensal).'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+        parser.add_argument(
+            '--as-of',
+            help='Data de referência AAAA-MM-DD (padrão: hoje)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=REVALUE_CHUNK_SIZE,
+            help=f'Ativos por lote (padrão: {REVALUE_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Apenas calcula, sem gravar'
+        )
+
+    def handle(self, *args, **options):
+        as_of = None
+        if options['as_of']:
+            try:
+                as_of = date.fromisoformat(options['as_of'])
+            except ValueError:
+                raise CommandError('Data inválida. Use o formato AAAA-MM-DD.')
+        if options['chunk_size'] < 1:
+            raise CommandError('O tamanho do lote deve ser maior que zero.')
+
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            started = time.perf_counter()
+            result = DepreciationService.revalue(
+                company_id,
+                as_of=as_of,
+                chunk_size=options['chunk_size'],
+                dry_run=options['dry_run']
+            )
+            elapsed = time.perf_counter() - started
+            self.stdout.write(self.style.SUCCESS(
+                f"{company_id}: {result['processed']} ativos processados, "
+                f"{result['changed']} alterados em {elapsed:.2f}s"
+            ))
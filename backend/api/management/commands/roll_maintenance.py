@@ -0,0 +1,27 @@
+# api/management/commands/roll_maintenance.py
+from django.core.management.base import BaseCommand
+
+from api.models import Company
+from api.services.maintenance_service import MaintenanceService
+
+
+class Command(BaseCommand):
+    help = (
+        'Aplica as manutenções concluídas pendentes, avançando a próxima '
+        'manutenção dos ativos pelo plano da categoria'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--company',
+            help='Código da empresa (padrão: todas as empresas ativas)'
+        )
+
+    def handle(self, *args, **options):
+        companies = Company.objects.filter(enabled=True)
+        if options['company']:
+            companies = companies.filter(company_id=options['company'].upper())
+
+        for company_id in companies.values_list('company_id', flat=True):
+            applied = MaintenanceService.roll_forward(company_id)
+            self.stdout.write(self.style.SUCCESS(f'{company_id}: {applied} manutenções aplicadas'))
@@ -27,7 +27,7 @@ class UserSessionMiddleware:
         if session_id:
             session = UserSessionService.get_active_session(session_id)
             if session:
-                session.update_activity()
+                UserSessionService.touch(session)
                 request.user_session = session
                 
                 # Garantir que o usuário tem acesso à empresa
@@ -0,0 +1,63 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_suppliespricelist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Holiday',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('date', models.DateField(verbose_name='Data')),
+                ('description', models.CharField(max_length=100, verbose_name='Descrição')),
+                ('recurring', models.BooleanField(default=False, help_text='Repete todo ano na mesma data (ex: 25/12)', verbose_name='Recorrente')),
+                ('holiday_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_holidays', to='api.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Feriado',
+                'verbose_name_plural': 'Feriados',
+                'db_table': 'holiday',
+                'ordering': ['date'],
+                'indexes': [models.Index(fields=['company_id', 'date'], name='holiday_company_019eab_idx')],
+                'constraints': [models.UniqueConstraint(fields=('date', 'company'), name='unique_holiday_date_per_company')],
+            },
+        ),
+        migrations.CreateModel(
+            name='WorkSchedule',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('name', models.CharField(max_length=100, verbose_name='Nome')),
+                ('code', models.CharField(max_length=20, verbose_name='Código')),
+                ('schedule_type', models.CharField(choices=[('WEEKLY', 'Semanal (dias da semana fixos)'), ('CYCLE', 'Ciclo (horas trabalhadas x horas de descanso)')], default='WEEKLY', max_length=10, verbose_name='Tipo de Escala')),
+                ('work_days', models.CharField(default='12345', help_text='Dias da semana trabalhados (1=segunda ... 7=domingo). Usado em escalas semanais.', max_length=7, verbose_name='Dias Trabalhados')),
+                ('daily_hours', models.DecimalField(decimal_places=2, default=8, help_text='Horas trabalhadas por dia em escalas semanais', max_digits=5, verbose_name='Horas por Dia')),
+                ('cycle_work_hours', models.PositiveSmallIntegerField(blank=True, help_text='Ex: 12 em uma escala 12x36', null=True, verbose_name='Horas Trabalhadas no Ciclo')),
+                ('cycle_rest_hours', models.PositiveSmallIntegerField(blank=True, help_text='Ex: 36 em uma escala 12x36', null=True, verbose_name='Horas de Descanso no Ciclo')),
+                ('cycle_start_date', models.DateField(blank=True, help_text='Data de referência do primeiro plantão do ciclo', null=True, verbose_name='Início do Ciclo')),
+                ('start_time', models.TimeField(help_text='Horário de início do turno, usado no cálculo de horas noturnas', verbose_name='Horário de Início')),
+                ('works_holidays', models.BooleanField(default=False, verbose_name='Trabalha em Feriados')),
+                ('workschedule_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_workschedules', to='api.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Escala de Trabalho',
+                'verbose_name_plural': 'Escalas de Trabalho',
+                'db_table': 'workschedule',
+                'ordering': ['name'],
+                'indexes': [models.Index(fields=['company_id'], name='workschedul_company_4ccea5_idx')],
+                'constraints': [models.UniqueConstraint(fields=('code', 'company'), name='unique_workschedule_code_per_company')],
+            },
+        ),
+    ]
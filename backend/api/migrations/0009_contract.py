@@ -0,0 +1,81 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_workschedule_holiday'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Contract',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('number', models.CharField(max_length=30, verbose_name='Número')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Descrição')),
+                ('status', models.CharField(choices=[('draft', 'Rascunho'), ('sent', 'Proposta Enviada'), ('active', 'Ativo'), ('closed', 'Encerrado'), ('cancelled', 'Cancelado')], default='draft', max_length=20, verbose_name='Status')),
+                ('start_date', models.DateField(verbose_name='Data de Início')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='Data de Término')),
+                ('total_value', models.DecimalField(decimal_places=4, default=0, editable=False, help_text='Mantido incrementalmente a cada alteração de item', max_digits=15, verbose_name='Valor Total')),
+                ('contract_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_contracts', to='api.company', verbose_name='Empresa')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='contracts', to='api.customer', verbose_name='Cliente')),
+            ],
+            options={
+                'verbose_name': 'Contrato',
+                'verbose_name_plural': 'Contratos',
+                'db_table': 'contract',
+                'ordering': ['-start_date', 'number'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ContractLine',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('quantity', models.DecimalField(decimal_places=3, default=1, max_digits=15, verbose_name='Quantidade')),
+                ('unit_price', models.DecimalField(decimal_places=4, default=0, max_digits=15, verbose_name='Preço Unitário')),
+                ('manual_price', models.BooleanField(default=False, help_text='Preço negociado manualmente; não é recalculado quando impostos mudam', verbose_name='Preço Manual')),
+                ('total_value', models.DecimalField(decimal_places=4, default=0, editable=False, max_digits=15, verbose_name='Valor Total')),
+                ('sequence', models.IntegerField(default=1, verbose_name='Sequência')),
+                ('contractline_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_contractlines', to='api.company', verbose_name='Empresa')),
+                ('contract', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lines', to='api.contract', verbose_name='Contrato')),
+                ('supply', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='contract_lines', to='api.supply', verbose_name='Insumo')),
+                ('work_schedule', models.ForeignKey(blank=True, help_text='Escala usada para converter insumos cobrados por hora/dia em valor mensal', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='contract_lines', to='api.workschedule', verbose_name='Escala')),
+            ],
+            options={
+                'verbose_name': 'Item do Contrato',
+                'verbose_name_plural': 'Itens do Contrato',
+                'db_table': 'contractline',
+                'ordering': ['sequence', 'contractline_id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['company_id', 'status'], name='contract_company_f47abe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['customer'], name='contract_custome_b94950_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='contract',
+            constraint=models.UniqueConstraint(fields=('number', 'company'), name='unique_contract_number_per_company'),
+        ),
+        migrations.AddIndex(
+            model_name='contractline',
+            index=models.Index(fields=['contract', 'enabled'], name='contractlin_contrac_7d1470_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contractline',
+            index=models.Index(fields=['supply'], name='contractlin_supply__4a8fc9_idx'),
+        ),
+    ]
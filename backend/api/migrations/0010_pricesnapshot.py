@@ -0,0 +1,47 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_contract'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contract',
+            name='confirmed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Confirmado em'),
+        ),
+        migrations.CreateModel(
+            name='PriceSnapshot',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('content_hash', models.CharField(editable=False, help_text='SHA-256 do JSON canônico da composição de preços', max_length=64, verbose_name='Hash do Conteúdo')),
+                ('payload', models.BinaryField(help_text='JSON canônico compactado com zlib', verbose_name='Conteúdo Compactado')),
+                ('payload_size', models.PositiveIntegerField(editable=False, verbose_name='Tamanho Original (bytes)')),
+                ('pricesnapshot_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_pricesnapshots', to='api.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Snapshot de Preços',
+                'verbose_name_plural': 'Snapshots de Preços',
+                'db_table': 'pricesnapshot',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.AddField(
+            model_name='contract',
+            name='price_snapshot',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='contracts', to='api.pricesnapshot', verbose_name='Snapshot de Preços'),
+        ),
+        migrations.AddConstraint(
+            model_name='pricesnapshot',
+            constraint=models.UniqueConstraint(fields=('content_hash', 'company'), name='unique_snapshot_hash_per_company'),
+        ),
+    ]
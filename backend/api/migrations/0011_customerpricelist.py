@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_pricesnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerPriceList',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('value', models.DecimalField(decimal_places=4, max_digits=15, verbose_name='Valor Negociado')),
+                ('notes', models.TextField(blank=True, null=True, verbose_name='Observações')),
+                ('customerpricelist_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_customerpricelists', to='api.company', verbose_name='Empresa')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='price_overrides', to='api.customer', verbose_name='Cliente')),
+                ('supply', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='customer_prices', to='api.supply', verbose_name='Insumo')),
+            ],
+            options={
+                'verbose_name': 'Preço por Cliente',
+                'verbose_name_plural': 'Preços por Cliente',
+                'db_table': 'customer_price_list',
+                'ordering': ['customer', 'supply'],
+                'indexes': [models.Index(fields=['company_id', 'customer', 'enabled'], name='customer_pr_company_871a14_idx')],
+                'constraints': [models.UniqueConstraint(fields=('customer', 'supply', 'company'), name='unique_customer_supply_per_company')],
+            },
+        ),
+    ]
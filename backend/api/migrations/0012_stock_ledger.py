@@ -0,0 +1,57 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_customerpricelist'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StockBalanceSnapshot',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('snapshot_date', models.DateField(verbose_name='Data do Fechamento')),
+                ('balance', models.DecimalField(decimal_places=3, max_digits=15, verbose_name='Saldo')),
+                ('stockbalancesnapshot_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='balance_snapshots', to='api.asset', verbose_name='Ativo')),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_stockbalancesnapshots', to='api.company', verbose_name='Empresa')),
+            ],
+            options={
+                'verbose_name': 'Saldo de Fechamento',
+                'verbose_name_plural': 'Saldos de Fechamento',
+                'db_table': 'stock_balance_snapshot',
+                'ordering': ['asset', '-snapshot_date'],
+                'indexes': [models.Index(fields=['company_id', 'snapshot_date'], name='stock_balan_company_3ba56d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('asset', 'snapshot_date'), name='unique_asset_snapshot_date')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StockLedgerEntry',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('movement_date', models.DateField(verbose_name='Data da Movimentação')),
+                ('quantity_delta', models.DecimalField(decimal_places=3, max_digits=15, verbose_name='Variação')),
+                ('balance', models.DecimalField(decimal_places=3, help_text='Saldo do ativo após o lançamento', max_digits=15, verbose_name='Saldo')),
+                ('stockledgerentry_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='api.asset', verbose_name='Ativo')),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_stockledgerentrys', to='api.company', verbose_name='Empresa')),
+                ('movement', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entry', to='api.assetmovement', verbose_name='Movimentação')),
+            ],
+            options={
+                'verbose_name': 'Lançamento de Estoque',
+                'verbose_name_plural': 'Razão de Estoque',
+                'db_table': 'stock_ledger_entry',
+                'ordering': ['stockledgerentry_id'],
+                'indexes': [models.Index(fields=['company_id'], name='stock_ledge_company_14d6d6_idx'), models.Index(fields=['asset', 'movement_date'], name='stock_ledge_asset_i_38d243_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_low_stock(apps, schema_editor):
+    Asset = apps.get_model('api', 'Asset')
+    Asset.objects.filter(quantity__lte=models.F('minimum_quantity')).update(is_low_stock=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_stock_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LowStockEvent',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('is_low_stock', models.BooleanField(help_text='True: ativo entrou em estoque baixo; False: estoque normalizado', verbose_name='Estoque Baixo')),
+                ('quantity', models.DecimalField(decimal_places=3, max_digits=15, verbose_name='Quantidade')),
+                ('minimum_quantity', models.DecimalField(decimal_places=3, max_digits=15, verbose_name='Quantidade Mínima')),
+                ('lowstockevent_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Evento de Estoque Baixo',
+                'verbose_name_plural': 'Eventos de Estoque Baixo',
+                'db_table': 'low_stock_event',
+                'ordering': ['lowstockevent_id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='asset',
+            name='is_low_stock',
+            field=models.BooleanField(default=False, editable=False, help_text='Quantidade menor ou igual à mínima; mantido a cada movimentação', verbose_name='Estoque Baixo'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('is_low_stock', True)), fields=['company', 'enabled'], name='asset_low_stock_idx'),
+        ),
+        migrations.AddField(
+            model_name='lowstockevent',
+            name='asset',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='low_stock_events', to='api.asset', verbose_name='Ativo'),
+        ),
+        migrations.AddField(
+            model_name='lowstockevent',
+            name='company',
+            field=models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_lowstockevents', to='api.company', verbose_name='Empresa'),
+        ),
+        migrations.AddIndex(
+            model_name='lowstockevent',
+            index=models.Index(fields=['company', 'lowstockevent_id'], name='low_stock_e_company_fa29dd_idx'),
+        ),
+        migrations.RunPython(backfill_low_stock, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:53
+
+from django.db import migrations, models
+
+
+def keep_latest_current_location(apps, schema_editor):
+    """Mantém apenas o registro mais recente como local atual de cada ativo"""
+    AssetLocation = apps.get_model('api', 'AssetLocation')
+    seen = set()
+    stale = []
+    rows = AssetLocation.objects.filter(current=True).order_by('asset_id', '-start_date', '-pk')
+    for pk, asset_id in rows.values_list('pk', 'asset_id').iterator():
+        if asset_id in seen:
+            stale.append(pk)
+        seen.add(asset_id)
+    AssetLocation.objects.filter(pk__in=stale).update(current=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_asset_low_stock'),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_current_location, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='assetlocation',
+            index=models.Index(condition=models.Q(('current', True)), fields=['location', 'asset'], name='assetlocation_current_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetlocation',
+            index=models.Index(fields=['asset', 'start_date'], name='assetlocation_asset_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetlocation',
+            index=models.Index(fields=['location', 'start_date', 'end_date'], name='assetlocation_interval_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='assetlocation',
+            constraint=models.UniqueConstraint(condition=models.Q(('current', True)), fields=('asset',), name='unique_current_location_per_asset'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_asset_location_intervals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetStock',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('quantity', models.DecimalField(decimal_places=3, default=0, max_digits=15, verbose_name='Quantidade')),
+                ('assetstock_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('asset', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='stocks', to='api.asset', verbose_name='Ativo')),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_assetstocks', to='api.company', verbose_name='Empresa')),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='asset_stocks', to='api.location', verbose_name='Local')),
+            ],
+            options={
+                'verbose_name': 'Estoque por Local',
+                'verbose_name_plural': 'Estoques por Local',
+                'db_table': 'asset_stock',
+                'ordering': ['location', 'asset'],
+                'indexes': [models.Index(fields=['company_id', 'location'], name='asset_stock_company_7ba853_idx')],
+                'constraints': [models.UniqueConstraint(fields=('asset', 'location'), name='unique_asset_stock_location')],
+            },
+        ),
+    ]
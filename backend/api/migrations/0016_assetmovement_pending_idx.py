@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_asset_stock'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetmovement',
+            index=models.Index(condition=models.Q(('status', 'pendente')), fields=['company', 'assetmovement_id'], name='assetmovement_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:58
+
+import django.core.validators
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_assetmovement_pending_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetcategory',
+            name='depreciation_method',
+            field=models.CharField(choices=[('none', 'Sem Depreciação'), ('straight_line', 'Linear'), ('declining_balance', 'Saldo Decrescente')], default='none', max_length=20, verbose_name='Método de Depreciação'),
+        ),
+        migrations.AddField(
+            model_name='assetcategory',
+            name='depreciation_rate',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Obrigatória para depreciação por saldo decrescente', max_digits=5, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01')), django.core.validators.MaxValueValidator(Decimal('100.00'))], verbose_name='Taxa Anual de Depreciação (%)'),
+        ),
+        migrations.AddField(
+            model_name='assetcategory',
+            name='residual_value_percent',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=5, validators=[django.core.validators.MinValueValidator(Decimal('0.00')), django.core.validators.MaxValueValidator(Decimal('100.00'))], verbose_name='Valor Residual (%)'),
+        ),
+        migrations.AddField(
+            model_name='assetcategory',
+            name='useful_life_months',
+            field=models.PositiveIntegerField(blank=True, help_text='Obrigatória para depreciação linear', null=True, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Vida Útil (meses)'),
+        ),
+    ]
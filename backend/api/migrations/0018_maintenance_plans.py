@@ -0,0 +1,98 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:05
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_assetcategory_depreciation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaintenancePlan',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('name', models.CharField(max_length=100, verbose_name='Nome')),
+                ('description', models.TextField(blank=True, null=True, verbose_name='Descrição')),
+                ('interval_days', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1)], verbose_name='Intervalo (dias)')),
+                ('maintenanceplan_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Plano de Manutenção',
+                'verbose_name_plural': 'Planos de Manutenção',
+                'db_table': 'maintenance_plan',
+                'ordering': ['category', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MaintenanceRecord',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('performed_at', models.DateField(verbose_name='Data da Manutenção')),
+                ('applied', models.BooleanField(default=False, help_text='Próxima manutenção do ativo já recalculada', verbose_name='Aplicada')),
+                ('notes', models.TextField(blank=True, null=True, verbose_name='Observações')),
+                ('maintenancerecord_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Manutenção Realizada',
+                'verbose_name_plural': 'Manutenções Realizadas',
+                'db_table': 'maintenance_record',
+                'ordering': ['-performed_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(condition=models.Q(('next_maintenance__isnull', False)), fields=['company', 'next_maintenance'], name='asset_maintenance_due_idx'),
+        ),
+        migrations.AddField(
+            model_name='maintenanceplan',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='maintenance_plans', to='api.assetcategory', verbose_name='Categoria de Ativo'),
+        ),
+        migrations.AddField(
+            model_name='maintenanceplan',
+            name='company',
+            field=models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_maintenanceplans', to='api.company', verbose_name='Empresa'),
+        ),
+        migrations.AddField(
+            model_name='maintenancerecord',
+            name='asset',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='maintenance_records', to='api.asset', verbose_name='Ativo'),
+        ),
+        migrations.AddField(
+            model_name='maintenancerecord',
+            name='company',
+            field=models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_maintenancerecords', to='api.company', verbose_name='Empresa'),
+        ),
+        migrations.AddField(
+            model_name='maintenancerecord',
+            name='performed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='maintenance_records', to=settings.AUTH_USER_MODEL, verbose_name='Registrado por'),
+        ),
+        migrations.AddField(
+            model_name='maintenancerecord',
+            name='plan',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='records', to='api.maintenanceplan', verbose_name='Plano'),
+        ),
+        migrations.AddConstraint(
+            model_name='maintenanceplan',
+            constraint=models.UniqueConstraint(condition=models.Q(('enabled', True)), fields=('company', 'category'), name='unique_enabled_maintenance_plan_per_category'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerecord',
+            index=models.Index(fields=['asset', '-performed_at'], name='maintenance_asset_i_7eb0df_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='maintenancerecord',
+            index=models.Index(condition=models.Q(('applied', False)), fields=['company', 'asset'], name='maintenance_record_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_maintenance_plans'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='average_cost',
+            field=models.DecimalField(decimal_places=4, default=0, editable=False, help_text='Custo médio móvel; mantido a cada entrada aprovada', max_digits=15, verbose_name='Custo Médio'),
+        ),
+        migrations.AddField(
+            model_name='stockbalancesnapshot',
+            name='average_cost',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=15, verbose_name='Custo Médio'),
+        ),
+        migrations.AddField(
+            model_name='stockledgerentry',
+            name='unit_cost',
+            field=models.DecimalField(blank=True, decimal_places=4, help_text='Custo médio do ativo após o lançamento', max_digits=15, null=True, verbose_name='Custo Médio'),
+        ),
+    ]
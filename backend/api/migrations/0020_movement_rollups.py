@@ -0,0 +1,39 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_inventory_valuation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovementRollup',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('period', models.CharField(choices=[('day', 'Dia'), ('month', 'Mês')], max_length=5, verbose_name='Período')),
+                ('period_start', models.DateField(verbose_name='Início do Período')),
+                ('movement_type', models.CharField(choices=[('entrada', 'Entrada'), ('saida', 'Saída'), ('transferencia', 'Transferência')], max_length=20, verbose_name='Tipo de Movimentação')),
+                ('quantity', models.DecimalField(decimal_places=3, default=0, max_digits=18, verbose_name='Quantidade')),
+                ('total_value', models.DecimalField(decimal_places=2, default=0, max_digits=18, verbose_name='Valor Total')),
+                ('movement_count', models.PositiveIntegerField(default=0, verbose_name='Movimentações')),
+                ('movementrollup_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+                ('asset_group', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='movement_rollups', to='api.assetgroup', verbose_name='Grupo de Ativo')),
+                ('company', models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_movementrollups', to='api.company', verbose_name='Empresa')),
+                ('location', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='movement_rollups', to='api.location', verbose_name='Local')),
+            ],
+            options={
+                'verbose_name': 'Total de Movimentações',
+                'verbose_name_plural': 'Totais de Movimentações',
+                'db_table': 'movement_rollup',
+                'ordering': ['period', 'period_start'],
+                'constraints': [models.UniqueConstraint(fields=('company', 'period', 'period_start', 'asset_group', 'location', 'movement_type'), name='unique_movement_rollup')],
+            },
+        ),
+    ]
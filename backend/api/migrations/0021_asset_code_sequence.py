@@ -0,0 +1,52 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:15
+
+import django.core.validators
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_movement_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssetCodeSequence',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Data de Criação')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='Última Atualização')),
+                ('enabled', models.BooleanField(default=True, verbose_name='Ativo')),
+                ('prefix', models.CharField(blank=True, default='AT', max_length=20, verbose_name='Prefixo')),
+                ('pattern', models.CharField(default='{prefix}{number:06d}', help_text='Use {prefix} e {number}, ex.: {prefix}-{number:05d}', max_length=50, verbose_name='Formato')),
+                ('next_value', models.PositiveBigIntegerField(default=1, verbose_name='Próximo Número')),
+                ('block_size', models.PositiveIntegerField(default=50, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Tamanho do Bloco')),
+                ('assetcodesequence_id', models.BigAutoField(editable=False, primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Sequência de Código de Ativo',
+                'verbose_name_plural': 'Sequências de Código de Ativo',
+                'db_table': 'asset_code_sequence',
+            },
+        ),
+        migrations.AlterField(
+            model_name='asset',
+            name='asset_code',
+            field=models.CharField(help_text='Único por empresa, sem diferenciar maiúsculas; gerado pela sequência da empresa se omitido', max_length=50, verbose_name='Código do Ativo'),
+        ),
+        migrations.AddConstraint(
+            model_name='asset',
+            constraint=models.UniqueConstraint(models.F('company'), django.db.models.functions.text.Upper('asset_code'), name='unique_asset_code_per_company'),
+        ),
+        migrations.AddField(
+            model_name='assetcodesequence',
+            name='company',
+            field=models.ForeignKey(help_text='Empresa à qual este registro pertence', on_delete=django.db.models.deletion.PROTECT, related_name='company_assetcodesequences', to='api.company', verbose_name='Empresa'),
+        ),
+        migrations.AddConstraint(
+            model_name='assetcodesequence',
+            constraint=models.UniqueConstraint(fields=('company',), name='unique_asset_code_sequence_per_company'),
+        ),
+    ]
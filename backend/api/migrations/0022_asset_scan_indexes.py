@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:23
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_asset_code_sequence'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(django.db.models.functions.text.Upper('patrimony_code'), name='asset_patrimony_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(models.F('company'), django.db.models.functions.text.Upper('serial_number'), name='asset_serial_upper_idx'),
+        ),
+    ]
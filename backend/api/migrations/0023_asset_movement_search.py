@@ -0,0 +1,59 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:26
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+# Índices só do PostgreSQL, fora do estado dos modelos: prefixo do documento
+# (LIKE 'x%' com collation não-C) e texto completo da descrição. A expressão
+# deve ser idêntica à usada na busca (AssetMovementSearchFilter).
+POSTGRES_INDEXES = [
+    models.Index(
+        fields=['document_number'],
+        opclasses=['varchar_pattern_ops'],
+        name='assetmovement_doc_pattern_idx'
+    ),
+    GinIndex(
+        SearchVector('description', config='portuguese'),
+        name='assetmovement_desc_fts_idx'
+    ),
+]
+
+
+def add_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    model = apps.get_model('api', 'AssetMovement')
+    for index in POSTGRES_INDEXES:
+        schema_editor.add_index(model, index)
+
+
+def remove_postgres_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    model = apps.get_model('api', 'AssetMovement')
+    for index in POSTGRES_INDEXES:
+        schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_asset_scan_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='assetmovement',
+            index=models.Index(fields=['company', '-movement_date', '-created'], name='assetmovement_company_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetmovement',
+            index=models.Index(fields=['company', 'movement_type', '-movement_date', '-created'], name='assetmovement_type_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='assetmovement',
+            index=models.Index(fields=['company', 'document_number'], name='assetmovement_document_idx'),
+        ),
+        migrations.RunPython(add_postgres_indexes, remove_postgres_indexes),
+    ]
@@ -0,0 +1,137 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:41
+
+from collections import defaultdict
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Case, F, Min, Sum, Value, When
+
+BATCH_SIZE = 1000
+
+
+def backfill_opening_entries(apps, schema_editor):
+    """
+    Saldo inicial dos ativos existentes: quantidade atual menos o efeito
+    líquido das movimentações aprovadas, lançado no razão (na data de
+    aquisição ou de criação, antes da primeira movimentação) e no local
+    correspondente ao campo `location` (ou no local padrão da empresa)
+    """
+    Asset = apps.get_model('api', 'Asset')
+    AssetMovement = apps.get_model('api', 'AssetMovement')
+    AssetStock = apps.get_model('api', 'AssetStock')
+    Location = apps.get_model('api', 'Location')
+    StockLedgerEntry = apps.get_model('api', 'StockLedgerEntry')
+
+    net = {
+        row['asset_id']: row
+        for row in AssetMovement.objects.filter(status='aprovado', enabled=True).order_by().values(
+            'asset_id'
+        ).annotate(
+            total=Sum(Case(
+                When(movement_type='entrada', then=F('quantity')),
+                When(movement_type='saida', then=-F('quantity')),
+                default=Value(Decimal('0')),
+                output_field=models.DecimalField(max_digits=15, decimal_places=3)
+            )),
+            first_date=Min('movement_date')
+        )
+    }
+
+    locations = {}
+    for location in Location.objects.order_by('location_id'):
+        locations.setdefault((location.company_id, location.name.strip().lower()), location.location_id)
+
+    def location_for(company_id, name):
+        location_id = locations.get((company_id, (name or '').strip().lower()))
+        if location_id is None:
+            default_name = settings.STOCK_DEFAULT_LOCATION_NAME
+            location_id = locations.get((company_id, default_name.lower()))
+            if location_id is None:
+                location_id = Location.objects.create(
+                    company_id=company_id, name=default_name, address=''
+                ).location_id
+                locations[(company_id, default_name.lower())] = location_id
+        return location_id
+
+    entries, stocks = [], defaultdict(Decimal)
+    for asset in Asset.objects.exclude(quantity=0).iterator(chunk_size=BATCH_SIZE):
+        row = net.get(asset.pk, {})
+        opening = asset.quantity - (row.get('total') or Decimal('0'))
+        if opening <= 0:
+            continue
+
+        location_id = location_for(asset.company_id, asset.location)
+        opening_date = asset.acquisition_date or asset.created.date()
+        if row.get('first_date'):
+            opening_date = min(opening_date, row['first_date'])
+        entries.append(StockLedgerEntry(
+            company_id=asset.company_id,
+            asset_id=asset.pk,
+            entry_type='saldo_inicial',
+            location_id=location_id,
+            movement_date=opening_date,
+            quantity_delta=opening,
+            balance=opening,
+            unit_cost=asset.purchase_value if asset.purchase_value is not None else asset.average_cost
+        ))
+        stocks[(asset.company_id, asset.pk, location_id)] += opening
+    StockLedgerEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+    AssetStock.objects.bulk_create(
+        [
+            AssetStock(company_id=company_id, asset_id=asset_id, location_id=location_id)
+            for company_id, asset_id, location_id in stocks
+        ],
+        batch_size=BATCH_SIZE,
+        ignore_conflicts=True
+    )
+    for (_, asset_id, location_id), quantity in stocks.items():
+        AssetStock.objects.filter(asset_id=asset_id, location_id=location_id).update(
+            quantity=F('quantity') + quantity
+        )
+
+
+def remove_opening_entries(apps, schema_editor):
+    """Remove os lançamentos sem movimentação e o seu efeito nos saldos por local"""
+    AssetStock = apps.get_model('api', 'AssetStock')
+    StockLedgerEntry = apps.get_model('api', 'StockLedgerEntry')
+    entries = StockLedgerEntry.objects.exclude(entry_type='movimentacao')
+    for asset_id, location_id, quantity in entries.filter(location__isnull=False).values_list(
+        'asset_id', 'location_id', 'quantity_delta'
+    ):
+        AssetStock.objects.filter(asset_id=asset_id, location_id=location_id).update(
+            quantity=F('quantity') - quantity
+        )
+    entries.delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_asset_movement_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stockledgerentry',
+            name='entry_type',
+            field=models.CharField(choices=[('movimentacao', 'Movimentação'), ('saldo_inicial', 'Saldo Inicial'), ('ajuste', 'Ajuste')], default='movimentacao', max_length=20, verbose_name='Tipo de Lançamento'),
+        ),
+        migrations.AddField(
+            model_name='stockledgerentry',
+            name='location',
+            field=models.ForeignKey(blank=True, help_text='Local do saldo inicial ou do ajuste', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entries', to='api.location', verbose_name='Local'),
+        ),
+        migrations.AlterField(
+            model_name='stockledgerentry',
+            name='movement',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='ledger_entry', to='api.assetmovement', verbose_name='Movimentação'),
+        ),
+        migrations.AddIndex(
+            model_name='stockledgerentry',
+            index=models.Index(condition=models.Q(('entry_type', 'movimentacao'), _negated=True), fields=['asset', 'location'], name='ledger_opening_adjust_idx'),
+        ),
+        migrations.RunPython(backfill_opening_entries, remove_opening_entries),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:20
+
+from datetime import datetime, time
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Min
+from django.utils import timezone
+
+BATCH_SIZE = 1000
+OPENING_NOTES = 'Local inicial'
+
+
+def backfill_opening_locations(apps, schema_editor):
+    """
+    Intervalo inicial de localização dos ativos existentes, da data de
+    aquisição ou de criação (antes da primeira movimentação) até a primeira
+    transferência registrada. O local inicial é a origem da primeira
+    transferência aprovada ou, sem transferências, o local correspondente ao
+    campo `location` (ou o local padrão da empresa). Ativos nunca
+    transferidos ficam com esse intervalo como local atual.
+    """
+    Asset = apps.get_model('api', 'Asset')
+    AssetLocation = apps.get_model('api', 'AssetLocation')
+    AssetMovement = apps.get_model('api', 'AssetMovement')
+    Location = apps.get_model('api', 'Location')
+
+    first_dates = {}
+    first_origins = {}
+    for asset_id, movement_type, movement_date, from_location_id in AssetMovement.objects.filter(
+        status='aprovado', enabled=True
+    ).order_by('asset_id', 'movement_date', 'pk').values_list(
+        'asset_id', 'movement_type', 'movement_date', 'from_location_id'
+    ).iterator(chunk_size=BATCH_SIZE):
+        first_dates.setdefault(asset_id, movement_date)
+        if movement_type == 'transferencia':
+            first_origins.setdefault(asset_id, from_location_id)
+
+    first_starts = dict(
+        AssetLocation.objects.order_by().values('asset_id').annotate(
+            first_start=Min('start_date')
+        ).values_list('asset_id', 'first_start')
+    )
+
+    locations = {}
+    for location in Location.objects.order_by('location_id'):
+        locations.setdefault((location.company_id, location.name.strip().lower()), location.location_id)
+
+    def location_for(company_id, name):
+        location_id = locations.get((company_id, (name or '').strip().lower()))
+        if location_id is None:
+            default_name = settings.STOCK_DEFAULT_LOCATION_NAME
+            location_id = locations.get((company_id, default_name.lower()))
+            if location_id is None:
+                location_id = Location.objects.create(
+                    company_id=company_id, name=default_name, address=''
+                ).location_id
+                locations[(company_id, default_name.lower())] = location_id
+        return location_id
+
+    intervals = []
+    for asset in Asset.objects.iterator(chunk_size=BATCH_SIZE):
+        opening_date = asset.acquisition_date or timezone.localdate(asset.created)
+        if asset.pk in first_dates:
+            opening_date = min(opening_date, first_dates[asset.pk])
+        start = timezone.make_aware(datetime.combine(opening_date, time.min))
+
+        end = first_starts.get(asset.pk)
+        if end is not None and end <= start:
+            continue
+        location_id = first_origins.get(asset.pk) or location_for(asset.company_id, asset.location)
+        intervals.append(AssetLocation(
+            company_id=asset.company_id,
+            asset_id=asset.pk,
+            location_id=location_id,
+            start_date=start,
+            end_date=end,
+            current=end is None,
+            notes=OPENING_NOTES
+        ))
+    AssetLocation.objects.bulk_create(intervals, batch_size=BATCH_SIZE)
+
+
+def remove_opening_locations(apps, schema_editor):
+    AssetLocation = apps.get_model('api', 'AssetLocation')
+    AssetLocation.objects.filter(notes=OPENING_NOTES).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_ledger_opening_entries'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_opening_locations, remove_opening_locations),
+    ]
@@ -16,6 +16,17 @@ from .location_model import Location
 from .usersession_model import UserSession
 from .managers_model import CustomUserManager
 from .supplies_price_list_model import SuppliesPriceList
+from .work_schedule_model import WorkSchedule
+from .holiday_model import Holiday
+from .price_snapshot_model import PriceSnapshot
+from .contract_model import Contract, ContractLine
+from .customer_price_list_model import CustomerPriceList
+from .stock_ledger_model import StockLedgerEntry, StockBalanceSnapshot
+from .low_stock_event_model import LowStockEvent
+from .asset_stock_model import AssetStock
+from .maintenance_model import MaintenancePlan, MaintenanceRecord
+from .movement_rollup_model import MovementRollup
+from .asset_code_sequence_model import AssetCodeSequence
 
 
 __all__ = [
@@ -35,6 +46,14 @@ __all__ = [
 
     'Supply',
     'SuppliesPriceList',
+    'CustomerPriceList',
+
+    'WorkSchedule',
+    'Holiday',
+
+    'Contract',
+    'ContractLine',
+    'PriceSnapshot',
     
     'Location',
 
@@ -43,4 +62,12 @@ __all__ = [
     'AssetCategory',
     'AssetMovement',
     'AssetLocation', 
+    'StockLedgerEntry',
+    'StockBalanceSnapshot',
+    'LowStockEvent',
+    'AssetStock',
+    'MaintenancePlan',
+    'MaintenanceRecord',
+    'MovementRollup',
+    'AssetCodeSequence',
 ]
\ No newline at end of file
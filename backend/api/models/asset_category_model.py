@@ -1,4 +1,7 @@
 # apps/assets/models/asset_category.py
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from .base_model import BaseModel
 from .asset_group_model import AssetGroup
@@ -7,7 +10,19 @@ class AssetCategory(BaseModel):
     """
     Categorias para melhor organização dos ativos
     Ex: Equipamentos de TI, Móveis, Ferramentas, etc.
+
+    Também define a depreciação aplicada ao valor atual dos ativos da categoria.
     """
+    DEPRECIATION_NONE = 'none'
+    DEPRECIATION_STRAIGHT_LINE = 'straight_line'
+    DEPRECIATION_DECLINING_BALANCE = 'declining_balance'
+
+    DEPRECIATION_METHOD_CHOICES = [
+        (DEPRECIATION_NONE, 'Sem Depreciação'),
+        (DEPRECIATION_STRAIGHT_LINE, 'Linear'),
+        (DEPRECIATION_DECLINING_BALANCE, 'Saldo Decrescente'),
+    ]
+
     name = models.CharField('Nome', max_length=100)
     code = models.CharField('Código', max_length=20, unique=True)
     description = models.TextField('Descrição', blank=True, null=True)
@@ -18,9 +33,47 @@ class AssetCategory(BaseModel):
         verbose_name='Grupo de Ativo'
     )
 
+    # Depreciação
+    depreciation_method = models.CharField(
+        'Método de Depreciação',
+        max_length=20,
+        choices=DEPRECIATION_METHOD_CHOICES,
+        default=DEPRECIATION_NONE
+    )
+    useful_life_months = models.PositiveIntegerField(
+        'Vida Útil (meses)',
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(1)],
+        help_text='Obrigatória para depreciação linear'
+    )
+    depreciation_rate = models.DecimalField(
+        'Taxa Anual de Depreciação (%)',
+        max_digits=5,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(Decimal('0.01')), MaxValueValidator(Decimal('100.00'))],
+        help_text='Obrigatória para depreciação por saldo decrescente'
+    )
+    residual_value_percent = models.DecimalField(
+        'Valor Residual (%)',
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        validators=[MinValueValidator(Decimal('0.00')), MaxValueValidator(Decimal('100.00'))]
+    )
+
     def __str__(self):
         return f"{self.code} - {self.name}"
 
+    def clean(self):
+        super().clean()
+        if self.depreciation_method == self.DEPRECIATION_STRAIGHT_LINE and not self.useful_life_months:
+            raise ValidationError({'useful_life_months': 'Informe a vida útil para depreciação linear.'})
+        if self.depreciation_method == self.DEPRECIATION_DECLINING_BALANCE and not self.depreciation_rate:
+            raise ValidationError({'depreciation_rate': 'Informe a taxa anual para depreciação por saldo decrescente.'})
+
     class Meta:
         db_table = 'assetcategory'
         ordering = ['name']
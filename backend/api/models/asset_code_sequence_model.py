@@ -0,0 +1,54 @@
+# api/models/asset_code_sequence_model.py
+from django.core.exceptions import ValidationError
+from django.core.validators import MinValueValidator
+from django.db import models
+from .base_model import BaseModel
+
+
+class AssetCodeSequence(BaseModel):
+    """
+    Sequência de códigos de ativo da empresa. Os números são reservados em
+    blocos de `block_size`: cada processo consome seu bloco em memória e só
+    volta ao banco quando ele se esgota. Números de blocos não utilizados
+    (reinício do processo) são descartados.
+    """
+    DEFAULT_PATTERN = '{prefix}{number:06d}'
+
+    prefix = models.CharField('Prefixo', max_length=20, default='AT', blank=True)
+    pattern = models.CharField(
+        'Formato',
+        max_length=50,
+        default=DEFAULT_PATTERN,
+        help_text='Use {prefix} e {number}, ex.: {prefix}-{number:05d}'
+    )
+    next_value = models.PositiveBigIntegerField('Próximo Número', default=1)
+    block_size = models.PositiveIntegerField(
+        'Tamanho do Bloco',
+        default=50,
+        validators=[MinValueValidator(1)]
+    )
+
+    class Meta:
+        db_table = 'asset_code_sequence'
+        verbose_name = 'Sequência de Código de Ativo'
+        verbose_name_plural = 'Sequências de Código de Ativo'
+        constraints = [
+            models.UniqueConstraint(fields=['company'], name='unique_asset_code_sequence_per_company')
+        ]
+
+    def __str__(self):
+        return f"{self.company_id}: {self.format(self.next_value)}"
+
+    def format(self, number: int) -> str:
+        return self.pattern.format(prefix=self.prefix, number=number).upper()
+
+    def clean(self):
+        super().clean()
+        if '{number' not in self.pattern:
+            raise ValidationError({'pattern': 'O formato deve conter {number}.'})
+        try:
+            code = self.format(1)
+        except (KeyError, IndexError, ValueError):
+            raise ValidationError({'pattern': 'Formato inválido. Use apenas {prefix} e {number}.'})
+        if len(code) > 50:
+            raise ValidationError({'pattern': 'O código gerado excede 50 caracteres.'})
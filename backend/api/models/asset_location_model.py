@@ -34,5 +34,23 @@ class AssetLocation(BaseModel):
             models.UniqueConstraint(
                 fields=['asset', 'location', 'start_date'],
                 name='unique_asset_location_time'
-            )
+            ),
+            # Um único local atual por ativo; também serve de índice parcial
+            # para "onde o ativo está agora"
+            models.UniqueConstraint(
+                fields=['asset'],
+                condition=models.Q(current=True),
+                name='unique_current_location_per_asset'
+            ),
+        ]
+        indexes = [
+            # Ativos atualmente em um local
+            models.Index(
+                fields=['location', 'asset'],
+                condition=models.Q(current=True),
+                name='assetlocation_current_idx'
+            ),
+            # Intervalos: "onde estava o ativo em T" e "ativos no local L em T"
+            models.Index(fields=['asset', 'start_date'], name='assetlocation_asset_start_idx'),
+            models.Index(fields=['location', 'start_date', 'end_date'], name='assetlocation_interval_idx'),
         ]
\ No newline at end of file
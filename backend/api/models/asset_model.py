@@ -1,5 +1,7 @@
 # apps/assets/models/asset.py
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.core.validators import MinValueValidator
 from decimal import Decimal
 from .base_model import BaseModel
@@ -36,8 +38,8 @@ class Asset(BaseModel):
     # Identificação
     asset_code = models.CharField(
         'Código do Ativo', 
-        max_length=50, 
-        unique=True
+        max_length=50,
+        help_text='Único por empresa, sem diferenciar maiúsculas; gerado pela sequência da empresa se omitido'
     )
     patrimony_code = models.CharField(
         'Código Patrimonial',
@@ -90,6 +92,14 @@ class Asset(BaseModel):
         null=True,
         blank=True
     )
+    average_cost = models.DecimalField(
+        'Custo Médio',
+        max_digits=15,
+        decimal_places=4,
+        default=0,
+        editable=False,
+        help_text='Custo médio móvel; mantido a cada entrada aprovada'
+    )
     
     # Status e controle
     status = models.CharField(
@@ -113,6 +123,12 @@ class Asset(BaseModel):
         null=True,
         blank=True
     )
+    is_low_stock = models.BooleanField(
+        'Estoque Baixo',
+        default=False,
+        editable=False,
+        help_text='Quantidade menor ou igual à mínima; mantido a cada movimentação'
+    )
     location = models.CharField(
         'Localização',
         max_length=200,
@@ -125,14 +141,56 @@ class Asset(BaseModel):
     def __str__(self):
         return f"{self.asset_code} - {self.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'is_low_stock' in field_names:
+            instance._stored_low_stock = instance.is_low_stock
+        return instance
+
+    def save(self, *args, **kwargs):
+        self.is_low_stock = Decimal(self.quantity) <= Decimal(self.minimum_quantity)
+        super().save(*args, **kwargs)
+
+        if self.is_low_stock != getattr(self, '_stored_low_stock', False):
+            self.low_stock_events.create(
+                company_id=self.company_id,
+                is_low_stock=self.is_low_stock,
+                quantity=self.quantity,
+                minimum_quantity=self.minimum_quantity
+            )
+        self._stored_low_stock = self.is_low_stock
+
     class Meta:
         db_table = 'asset'
         ordering = ['name']
+        constraints = [
+            # Unicidade garantida pelo banco (sem consulta prévia), sem diferenciar maiúsculas
+            models.UniqueConstraint(
+                F('company'),
+                Upper('asset_code'),
+                name='unique_asset_code_per_company'
+            ),
+        ]
         verbose_name = 'Ativo'
         verbose_name_plural = 'Insumos'
         indexes = [
             models.Index(fields=['company_id']),
             models.Index(fields=['asset_code']),
             models.Index(fields=['patrimony_code']),
+            # Leitura de código de barras (ver AssetScanService)
+            models.Index(Upper('patrimony_code'), name='asset_patrimony_upper_idx'),
+            models.Index(F('company'), Upper('serial_number'), name='asset_serial_upper_idx'),
             models.Index(fields=['status']),
+            models.Index(
+                fields=['company', 'enabled'],
+                condition=models.Q(is_low_stock=True),
+                name='asset_low_stock_idx'
+            ),
+            # Fila de manutenção: faixa de datas por empresa sem varrer os ativos
+            models.Index(
+                fields=['company', 'next_maintenance'],
+                condition=models.Q(next_maintenance__isnull=False),
+                name='asset_maintenance_due_idx'
+            ),
         ]
\ No newline at end of file
@@ -1,4 +1,5 @@
 # backend/api/models/asset_movement.py
+from decimal import Decimal
 from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -12,17 +13,27 @@ class AssetMovement(BaseModel):
     """
     Modelo para controle de movimentação de ativos
     """
+    ENTRY = 'entrada'
+    EXIT = 'saida'
+    TRANSFER = 'transferencia'
+
     MOVEMENT_TYPES = [
-        ('entrada', 'Entrada'),
-        ('saida', 'Saída'),
-        ('transferencia', 'Transferência'),
+        (ENTRY, 'Entrada'),
+        (EXIT, 'Saída'),
+        (TRANSFER, 'Transferência'),
     ]
 
+    PENDING = 'pendente'
+    APPROVED = 'aprovado'
+    REJECTED = 'rejeitado'
+    CANCELLED = 'cancelado'
+
+
     STATUS_CHOICES = [
-        ('pendente', 'Pendente'),
-        ('aprovado', 'Aprovado'),
-        ('rejeitado', 'Rejeitado'),
-        ('cancelado', 'Cancelado'),
+        (PENDING, 'Pendente'),
+        (APPROVED, 'Aprovado'),
+        (REJECTED, 'Rejeitado'),
+        (CANCELLED, 'Cancelado'),
     ]
 
     # Campos básicos
@@ -71,7 +82,7 @@ class AssetMovement(BaseModel):
     status = models.CharField(
         max_length=20,
         choices=STATUS_CHOICES,
-        default='pendente',
+        default=PENDING,
         verbose_name='Status'
     )
 
@@ -156,13 +167,34 @@ class AssetMovement(BaseModel):
             models.Index(fields=['movement_date', 'movement_type']),
             models.Index(fields=['created']),
             models.Index(fields=['status']),
+            # Fila de aprovação (paginação por id)
+            models.Index(
+                fields=['company', 'assetmovement_id'],
+                condition=models.Q(status='pendente'),
+                name='assetmovement_pending_idx'
+            ),
+            # Listagem e busca: mesma ordem do `ordering`, com e sem filtro de tipo
+            models.Index(
+                fields=['company', '-movement_date', '-created'],
+                name='assetmovement_company_date_idx'
+            ),
+            models.Index(
+                fields=['company', 'movement_type', '-movement_date', '-created'],
+                name='assetmovement_type_date_idx'
+            ),
+            # Busca exata/por prefixo do documento (no PostgreSQL há também
+            # índices de padrão e de texto completo, ver migração 0023)
+            models.Index(
+                fields=['company', 'document_number'],
+                name='assetmovement_document_idx'
+            ),
         ]
 
     def __str__(self):
         return f"{self.get_movement_type_display()} - {self.asset} - {self.movement_date}"
 
     def clean(self):
-        if self.movement_type == 'transferencia' and not self.to_location:
+        if self.movement_type == self.TRANSFER and not self.to_location:
             raise ValidationError({
                 'to_location': _('Local de destino é obrigatório para transferências')
             })
@@ -183,6 +215,6 @@ class AssetMovement(BaseModel):
             })
 
     def save(self, *args, **kwargs):
-        self.total_value = self.quantity * self.unit_value
+        self.total_value = (Decimal(self.quantity) * Decimal(self.unit_value)).quantize(Decimal('0.01'))
         self.full_clean()
         super().save(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,48 @@
+# api/models/asset_stock_model.py
+from django.db import models
+from .base_model import BaseModel
+from .asset_model import Asset
+from .location_model import Location
+
+
+class AssetStock(BaseModel):
+    """
+    Saldo do ativo por local, mantido na mesma transação das movimentações
+    aprovadas. Asset.quantity continua sendo o saldo global.
+    """
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.PROTECT,
+        related_name='stocks',
+        verbose_name='Ativo'
+    )
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.PROTECT,
+        related_name='asset_stocks',
+        verbose_name='Local'
+    )
+    quantity = models.DecimalField(
+        'Quantidade',
+        max_digits=15,
+        decimal_places=3,
+        default=0
+    )
+
+    class Meta:
+        db_table = 'asset_stock'
+        ordering = ['location', 'asset']
+        verbose_name = 'Estoque por Local'
+        verbose_name_plural = 'Estoques por Local'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['asset', 'location'],
+                name='unique_asset_stock_location'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['company_id', 'location']),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id} @ {self.location_id}: {self.quantity}"
@@ -0,0 +1,238 @@
+# api/models/contract_model.py
+from decimal import Decimal
+from django.db import models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from .base_model import BaseModel
+from .customer_model import Customer
+from .supply_model import Supply
+from .work_schedule_model import WorkSchedule
+from .price_snapshot_model import PriceSnapshot
+
+
+class Contract(BaseModel):
+    """
+    Contratos (e propostas) de fornecimento de insumos e serviços a clientes
+    """
+    class Status(models.TextChoices):
+        DRAFT = 'draft', 'Rascunho'
+        SENT = 'sent', 'Proposta Enviada'
+        ACTIVE = 'active', 'Ativo'
+        CLOSED = 'closed', 'Encerrado'
+        CANCELLED = 'cancelled', 'Cancelado'
+
+    OPEN_STATUSES = (Status.DRAFT, Status.SENT, Status.ACTIVE)
+    # Após a confirmação os preços ficam congelados no snapshot
+    EDITABLE_STATUSES = (Status.DRAFT,)
+
+    number = models.CharField('Número', max_length=30)
+    customer = models.ForeignKey(
+        Customer,
+        on_delete=models.PROTECT,
+        related_name='contracts',
+        verbose_name='Cliente'
+    )
+    description = models.TextField('Descrição', blank=True, null=True)
+    status = models.CharField(
+        'Status',
+        max_length=20,
+        choices=Status.choices,
+        default=Status.DRAFT
+    )
+    start_date = models.DateField('Data de Início')
+    end_date = models.DateField('Data de Término', null=True, blank=True)
+    total_value = models.DecimalField(
+        'Valor Total',
+        max_digits=15,
+        decimal_places=4,
+        default=0,
+        editable=False,
+        help_text='Mantido incrementalmente a cada alteração de item'
+    )
+    price_snapshot = models.ForeignKey(
+        PriceSnapshot,
+        on_delete=models.PROTECT,
+        related_name='contracts',
+        verbose_name='Snapshot de Preços',
+        null=True,
+        blank=True,
+        editable=False
+    )
+    confirmed_at = models.DateTimeField('Confirmado em', null=True, blank=True, editable=False)
+
+    class Meta:
+        db_table = 'contract'
+        ordering = ['-start_date', 'number']
+        verbose_name = 'Contrato'
+        verbose_name_plural = 'Contratos'
+        indexes = [
+            models.Index(fields=['company_id', 'status']),
+            models.Index(fields=['customer']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['number', 'company'],
+                name='unique_contract_number_per_company'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.number} - {self.customer}"
+
+    @property
+    def is_open(self):
+        return self.status in self.OPEN_STATUSES
+
+    @property
+    def is_editable(self):
+        return self.status in self.EDITABLE_STATUSES and self.price_snapshot_id is None
+
+    @staticmethod
+    def recalculate_totals(contract_ids) -> int:
+        """
+        Recalcula o total dos contratos a partir dos itens em um único UPDATE
+        (ver ContractService.recalculate_totals)
+        """
+        line_totals = ContractLine.objects.filter(
+            contract=OuterRef('pk'),
+            enabled=True
+        ).order_by().values('contract').annotate(
+            total=Sum('total_value')
+        ).values('total')
+
+        return Contract.objects.filter(pk__in=list(contract_ids)).update(
+            total_value=Coalesce(
+                Subquery(line_totals),
+                Value(Decimal('0')),
+                output_field=DecimalField(max_digits=15, decimal_places=4)
+            )
+        )
+
+
+class ContractLine(BaseModel):
+    """
+    Itens do contrato. O total do item é propagado para o cabeçalho
+    aplicando apenas a diferença (delta) de cada alteração; um item movido
+    de contrato sai do total do anterior e entra no do novo. Itens lidos sem
+    o valor (.only()/.defer()) recalculam os totais a partir dos itens.
+    """
+    contract = models.ForeignKey(
+        Contract,
+        on_delete=models.CASCADE,
+        related_name='lines',
+        verbose_name='Contrato'
+    )
+    supply = models.ForeignKey(
+        Supply,
+        on_delete=models.PROTECT,
+        related_name='contract_lines',
+        verbose_name='Insumo'
+    )
+    work_schedule = models.ForeignKey(
+        WorkSchedule,
+        on_delete=models.PROTECT,
+        related_name='contract_lines',
+        verbose_name='Escala',
+        null=True,
+        blank=True,
+        help_text='Escala usada para converter insumos cobrados por hora/dia em valor mensal'
+    )
+    quantity = models.DecimalField(
+        'Quantidade',
+        max_digits=15,
+        decimal_places=3,
+        default=1
+    )
+    unit_price = models.DecimalField(
+        'Preço Unitário',
+        max_digits=15,
+        decimal_places=4,
+        default=0
+    )
+    manual_price = models.BooleanField(
+        'Preço Manual',
+        default=False,
+        help_text='Preço negociado manualmente; não é recalculado quando impostos mudam'
+    )
+    total_value = models.DecimalField(
+        'Valor Total',
+        max_digits=15,
+        decimal_places=4,
+        default=0,
+        editable=False
+    )
+    sequence = models.IntegerField('Sequência', default=1)
+
+    class Meta:
+        db_table = 'contractline'
+        ordering = ['sequence', 'contractline_id']
+        verbose_name = 'Item do Contrato'
+        verbose_name_plural = 'Itens do Contrato'
+        indexes = [
+            models.Index(fields=['contract', 'enabled']),
+            models.Index(fields=['supply']),
+        ]
+
+    def __str__(self):
+        return f"{self.contract.number} - {self.supply.name}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Contrato e valor com que o item está contado no cabeçalho; None
+        # quando não foram carregados
+        instance._counted_contract_id = instance.__dict__.get('contract_id')
+        if 'total_value' in field_names and 'enabled' in field_names:
+            instance._counted_total = instance._effective_total()
+        else:
+            instance._counted_total = None
+        return instance
+
+    def _effective_total(self):
+        """Valor com que o item contribui para o total do contrato"""
+        if not self.enabled or self.total_value is None:
+            return Decimal('0')
+        return self.total_value
+
+    def _counted_contract(self):
+        """Contrato em cujo total o item está contado (None para itens novos)"""
+        counted_contract_id = getattr(self, '_counted_contract_id', None)
+        if counted_contract_id is None and not self._state.adding:
+            counted_contract_id = ContractLine.objects.filter(pk=self.pk).values_list(
+                'contract_id', flat=True
+            ).first()
+        return counted_contract_id
+
+    @staticmethod
+    def _add_to_total(contract_id, delta):
+        if contract_id is not None and delta:
+            Contract.objects.filter(pk=contract_id).update(
+                total_value=F('total_value') + delta
+            )
+
+    def save(self, *args, **kwargs):
+        self.total_value = (Decimal(self.quantity) * Decimal(self.unit_price)).quantize(Decimal('0.0001'))
+        counted_total = getattr(self, '_counted_total', Decimal('0'))
+        counted_contract_id = self._counted_contract()
+
+        super().save(*args, **kwargs)
+
+        if counted_total is None:
+            Contract.recalculate_totals({counted_contract_id, self.contract_id} - {None})
+        elif counted_contract_id in (None, self.contract_id):
+            self._add_to_total(self.contract_id, self._effective_total() - counted_total)
+        else:
+            self._add_to_total(counted_contract_id, -counted_total)
+            self._add_to_total(self.contract_id, self._effective_total())
+        self._counted_total = self._effective_total()
+        self._counted_contract_id = self.contract_id
+
+    def delete(self, *args, **kwargs):
+        counted_total = getattr(self, '_counted_total', Decimal('0'))
+        counted_contract_id = self._counted_contract()
+        result = super().delete(*args, **kwargs)
+        if counted_total is None:
+            Contract.recalculate_totals([counted_contract_id])
+        else:
+            self._add_to_total(counted_contract_id, -counted_total)
+        return result
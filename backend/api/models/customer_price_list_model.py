@@ -0,0 +1,48 @@
+# api/models/customer_price_list_model.py
+from django.db import models
+from .base_model import BaseModel
+from .customer_model import Customer
+from .supply_model import Supply
+
+
+class CustomerPriceList(BaseModel):
+    """
+    Preços negociados por cliente. Sobrepõem o preço padrão da empresa
+    calculado a partir de SuppliesPriceList.
+    """
+    customer = models.ForeignKey(
+        Customer,
+        on_delete=models.PROTECT,
+        related_name='price_overrides',
+        verbose_name='Cliente'
+    )
+    supply = models.ForeignKey(
+        Supply,
+        on_delete=models.PROTECT,
+        related_name='customer_prices',
+        verbose_name='Insumo'
+    )
+    value = models.DecimalField(
+        'Valor Negociado',
+        max_digits=15,
+        decimal_places=4
+    )
+    notes = models.TextField('Observações', blank=True, null=True)
+
+    class Meta:
+        db_table = 'customer_price_list'
+        verbose_name = 'Preço por Cliente'
+        verbose_name_plural = 'Preços por Cliente'
+        ordering = ['customer', 'supply']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['customer', 'supply', 'company'],
+                name='unique_customer_supply_per_company'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['company_id', 'customer', 'enabled']),
+        ]
+
+    def __str__(self):
+        return f"{self.customer.name} - {self.supply.name}: {self.value}"
@@ -0,0 +1,34 @@
+# api/models/holiday_model.py
+from django.db import models
+from .base_model import BaseModel
+
+
+class Holiday(BaseModel):
+    """
+    Feriados da empresa, usados no cálculo do mês padrão e das escalas
+    """
+    date = models.DateField('Data')
+    description = models.CharField('Descrição', max_length=100)
+    recurring = models.BooleanField(
+        'Recorrente',
+        default=False,
+        help_text='Repete todo ano na mesma data (ex: 25/12)'
+    )
+
+    class Meta:
+        db_table = 'holiday'
+        ordering = ['date']
+        verbose_name = 'Feriado'
+        verbose_name_plural = 'Feriados'
+        indexes = [
+            models.Index(fields=['company_id', 'date']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['date', 'company'],
+                name='unique_holiday_date_per_company'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date:%d/%m/%Y} - {self.description}"
@@ -0,0 +1,36 @@
+# api/models/low_stock_event_model.py
+from django.db import models
+from .base_model import BaseModel
+from .asset_model import Asset
+
+
+class LowStockEvent(BaseModel):
+    """
+    Transições de estoque baixo dos ativos (entrada e saída do estado).
+    O id crescente serve de cursor para o feed de reposição.
+    """
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.PROTECT,
+        related_name='low_stock_events',
+        verbose_name='Ativo'
+    )
+    is_low_stock = models.BooleanField(
+        'Estoque Baixo',
+        help_text='True: ativo entrou em estoque baixo; False: estoque normalizado'
+    )
+    quantity = models.DecimalField('Quantidade', max_digits=15, decimal_places=3)
+    minimum_quantity = models.DecimalField('Quantidade Mínima', max_digits=15, decimal_places=3)
+
+    class Meta:
+        db_table = 'low_stock_event'
+        ordering = ['lowstockevent_id']
+        verbose_name = 'Evento de Estoque Baixo'
+        verbose_name_plural = 'Eventos de Estoque Baixo'
+        indexes = [
+            models.Index(fields=['company', 'lowstockevent_id']),
+        ]
+
+    def __str__(self):
+        state = 'baixo' if self.is_low_stock else 'normalizado'
+        return f"{self.asset_id}: estoque {state} ({self.quantity}/{self.minimum_quantity})"
@@ -0,0 +1,97 @@
+# api/models/maintenance_model.py
+from django.core.validators import MinValueValidator
+from django.db import models
+from .base_model import BaseModel
+from .asset_model import Asset
+from .asset_category_model import AssetCategory
+from .user_model import User
+
+
+class MaintenancePlan(BaseModel):
+    """
+    Plano de manutenção recorrente da categoria de ativo: após cada manutenção
+    concluída a próxima é agendada `interval_days` depois
+    """
+    category = models.ForeignKey(
+        AssetCategory,
+        on_delete=models.PROTECT,
+        related_name='maintenance_plans',
+        verbose_name='Categoria de Ativo'
+    )
+    name = models.CharField('Nome', max_length=100)
+    description = models.TextField('Descrição', blank=True, null=True)
+    interval_days = models.PositiveIntegerField(
+        'Intervalo (dias)',
+        validators=[MinValueValidator(1)]
+    )
+
+    class Meta:
+        db_table = 'maintenance_plan'
+        ordering = ['category', 'name']
+        verbose_name = 'Plano de Manutenção'
+        verbose_name_plural = 'Planos de Manutenção'
+        constraints = [
+            # Um plano ativo por categoria: define a recorrência de next_maintenance
+            models.UniqueConstraint(
+                fields=['company', 'category'],
+                condition=models.Q(enabled=True),
+                name='unique_enabled_maintenance_plan_per_category'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.interval_days} dias)"
+
+
+class MaintenanceRecord(BaseModel):
+    """
+    Manutenção concluída. Registros ainda não aplicados (`applied=False`)
+    são processados em lote, avançando Asset.next_maintenance pelo plano
+    da categoria.
+    """
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.PROTECT,
+        related_name='maintenance_records',
+        verbose_name='Ativo'
+    )
+    plan = models.ForeignKey(
+        MaintenancePlan,
+        on_delete=models.PROTECT,
+        related_name='records',
+        null=True,
+        blank=True,
+        verbose_name='Plano'
+    )
+    performed_at = models.DateField('Data da Manutenção')
+    performed_by = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='maintenance_records',
+        null=True,
+        blank=True,
+        verbose_name='Registrado por'
+    )
+    applied = models.BooleanField(
+        'Aplicada',
+        default=False,
+        help_text='Próxima manutenção do ativo já recalculada'
+    )
+    notes = models.TextField('Observações', blank=True, null=True)
+
+    class Meta:
+        db_table = 'maintenance_record'
+        ordering = ['-performed_at']
+        verbose_name = 'Manutenção Realizada'
+        verbose_name_plural = 'Manutenções Realizadas'
+        indexes = [
+            models.Index(fields=['asset', '-performed_at']),
+            models.Index(
+                fields=['company', 'asset'],
+                condition=models.Q(applied=False),
+                name='maintenance_record_pending_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.asset} - {self.performed_at}"
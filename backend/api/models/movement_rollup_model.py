@@ -0,0 +1,62 @@
+# api/models/movement_rollup_model.py
+from django.db import models
+from .base_model import BaseModel
+from .asset_group_model import AssetGroup
+from .asset_movement_model import AssetMovement
+from .location_model import Location
+
+
+class MovementRollup(BaseModel):
+    """
+    Totais de movimentações aprovadas por período (dia ou mês), grupo de
+    ativo, local e tipo. Mantidos a cada aprovação; os relatórios leem estes
+    totais em vez de agregar a tabela de movimentações.
+
+    Local: destino das entradas (ou a origem, sem destino) e origem das
+    saídas e transferências.
+    """
+    PERIOD_DAY = 'day'
+    PERIOD_MONTH = 'month'
+
+    PERIOD_CHOICES = [
+        (PERIOD_DAY, 'Dia'),
+        (PERIOD_MONTH, 'Mês'),
+    ]
+
+    period = models.CharField('Período', max_length=5, choices=PERIOD_CHOICES)
+    period_start = models.DateField('Início do Período')
+    asset_group = models.ForeignKey(
+        AssetGroup,
+        on_delete=models.PROTECT,
+        related_name='movement_rollups',
+        verbose_name='Grupo de Ativo'
+    )
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.PROTECT,
+        related_name='movement_rollups',
+        verbose_name='Local'
+    )
+    movement_type = models.CharField(
+        'Tipo de Movimentação',
+        max_length=20,
+        choices=AssetMovement.MOVEMENT_TYPES
+    )
+    quantity = models.DecimalField('Quantidade', max_digits=18, decimal_places=3, default=0)
+    total_value = models.DecimalField('Valor Total', max_digits=18, decimal_places=2, default=0)
+    movement_count = models.PositiveIntegerField('Movimentações', default=0)
+
+    class Meta:
+        db_table = 'movement_rollup'
+        ordering = ['period', 'period_start']
+        verbose_name = 'Total de Movimentações'
+        verbose_name_plural = 'Totais de Movimentações'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['company', 'period', 'period_start', 'asset_group', 'location', 'movement_type'],
+                name='unique_movement_rollup'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.period} {self.period_start} {self.asset_group_id}/{self.location_id} {self.movement_type}: {self.quantity}"
@@ -0,0 +1,80 @@
+# api/models/price_snapshot_model.py
+import hashlib
+import json
+import zlib
+from django.db import models
+from django.core.exceptions import ValidationError
+from .base_model import BaseModel
+
+
+class PriceSnapshot(BaseModel):
+    """
+    Cópia imutável e endereçada por conteúdo da composição de preços de um
+    contrato/proposta no momento da confirmação. Breakdowns idênticos
+    compartilham o mesmo registro (mesmo hash).
+    """
+    content_hash = models.CharField(
+        'Hash do Conteúdo',
+        max_length=64,
+        editable=False,
+        help_text='SHA-256 do JSON canônico da composição de preços'
+    )
+    payload = models.BinaryField(
+        'Conteúdo Compactado',
+        editable=False,
+        help_text='JSON canônico compactado com zlib'
+    )
+    payload_size = models.PositiveIntegerField('Tamanho Original (bytes)', editable=False)
+
+    class Meta:
+        db_table = 'pricesnapshot'
+        ordering = ['-created']
+        verbose_name = 'Snapshot de Preços'
+        verbose_name_plural = 'Snapshots de Preços'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_hash', 'company'],
+                name='unique_snapshot_hash_per_company'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({self.payload_size} bytes)"
+
+    @staticmethod
+    def canonical_json(data) -> bytes:
+        return json.dumps(
+            data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+        ).encode('utf-8')
+
+    @classmethod
+    def store(cls, company_id: str, data) -> 'PriceSnapshot':
+        """
+        Grava (ou reaproveita) o snapshot correspondente ao conteúdo informado
+        """
+        raw = cls.canonical_json(data)
+        content_hash = hashlib.sha256(raw).hexdigest()
+        snapshot, _ = cls.objects.get_or_create(
+            company_id=company_id,
+            content_hash=content_hash,
+            defaults={
+                'payload': zlib.compress(raw, 9),
+                'payload_size': len(raw),
+            }
+        )
+        return snapshot
+
+    @property
+    def data(self):
+        return json.loads(zlib.decompress(bytes(self.payload)).decode('utf-8'))
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValidationError('Snapshots de preços são imutáveis')
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValidationError('Snapshots de preços são imutáveis')
+
+    def soft_delete(self):
+        raise ValidationError('Snapshots de preços são imutáveis')
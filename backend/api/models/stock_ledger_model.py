@@ -0,0 +1,147 @@
+# api/models/stock_ledger_model.py
+from django.core.exceptions import ValidationError
+from django.db import models
+from .base_model import BaseModel
+from .asset_model import Asset
+from .asset_movement_model import AssetMovement
+from .location_model import Location
+
+
+class StockLedgerEntry(BaseModel):
+    """
+    Razão de estoque: um lançamento imutável por movimentação aprovada, pelo
+    saldo inicial do ativo ou por ajuste de inventário, com o saldo do ativo
+    após o lançamento (saldo corrente na ordem de registro).
+    Saldo inicial e ajustes não têm movimentação; o local afetado fica em `location`.
+    """
+    MOVEMENT = 'movimentacao'
+    OPENING = 'saldo_inicial'
+    ADJUSTMENT = 'ajuste'
+
+    ENTRY_TYPES = [
+        (MOVEMENT, 'Movimentação'),
+        (OPENING, 'Saldo Inicial'),
+        (ADJUSTMENT, 'Ajuste'),
+    ]
+
+    entry_type = models.CharField(
+        'Tipo de Lançamento',
+        max_length=20,
+        choices=ENTRY_TYPES,
+        default=MOVEMENT
+    )
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.PROTECT,
+        related_name='ledger_entries',
+        verbose_name='Ativo'
+    )
+    movement = models.OneToOneField(
+        AssetMovement,
+        on_delete=models.PROTECT,
+        related_name='ledger_entry',
+        verbose_name='Movimentação',
+        null=True,
+        blank=True
+    )
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.PROTECT,
+        related_name='ledger_entries',
+        verbose_name='Local',
+        null=True,
+        blank=True,
+        help_text='Local do saldo inicial ou do ajuste'
+    )
+    movement_date = models.DateField('Data da Movimentação')
+    quantity_delta = models.DecimalField(
+        'Variação',
+        max_digits=15,
+        decimal_places=3
+    )
+    balance = models.DecimalField(
+        'Saldo',
+        max_digits=15,
+        decimal_places=3,
+        help_text='Saldo do ativo após o lançamento'
+    )
+    unit_cost = models.DecimalField(
+        'Custo Médio',
+        max_digits=15,
+        decimal_places=4,
+        null=True,
+        blank=True,
+        help_text='Custo médio do ativo após o lançamento'
+    )
+
+    class Meta:
+        db_table = 'stock_ledger_entry'
+        ordering = ['stockledgerentry_id']
+        verbose_name = 'Lançamento de Estoque'
+        verbose_name_plural = 'Razão de Estoque'
+        indexes = [
+            models.Index(fields=['company_id']),
+            models.Index(fields=['asset', 'movement_date']),
+            models.Index(
+                fields=['asset', 'location'],
+                condition=~models.Q(entry_type='movimentacao'),
+                name='ledger_opening_adjust_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id} {self.movement_date}: {self.quantity_delta:+} = {self.balance}"
+
+    def save(self, *args, **kwargs):
+        if self.pk is not None:
+            raise ValidationError('Lançamentos de estoque são imutáveis.')
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValidationError('Lançamentos de estoque são imutáveis.')
+
+    def soft_delete(self):
+        raise ValidationError('Lançamentos de estoque são imutáveis.')
+
+
+class StockBalanceSnapshot(BaseModel):
+    """
+    Saldo do ativo no fechamento de um período (fim do mês).
+    Saldo em uma data = snapshot mais próximo + lançamentos posteriores a ele.
+    """
+    asset = models.ForeignKey(
+        Asset,
+        on_delete=models.PROTECT,
+        related_name='balance_snapshots',
+        verbose_name='Ativo'
+    )
+    snapshot_date = models.DateField('Data do Fechamento')
+    balance = models.DecimalField(
+        'Saldo',
+        max_digits=15,
+        decimal_places=3
+    )
+    average_cost = models.DecimalField(
+        'Custo Médio',
+        max_digits=15,
+        decimal_places=4,
+        default=0
+    )
+
+    class Meta:
+        db_table = 'stock_balance_snapshot'
+        ordering = ['asset', '-snapshot_date']
+        verbose_name = 'Saldo de Fechamento'
+        verbose_name_plural = 'Saldos de Fechamento'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['asset', 'snapshot_date'],
+                name='unique_asset_snapshot_date'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['company_id', 'snapshot_date']),
+        ]
+
+    def __str__(self):
+        return f"{self.asset_id} {self.snapshot_date}: {self.balance}"
@@ -53,9 +53,9 @@ class UserSession(models.Model):
         self.save()
 
     def update_activity(self):
-        """Atualiza o timestamp da última atividade"""
+        """Atualiza o timestamp da última atividade (apenas essa coluna)"""
         self.last_activity = timezone.now()
-        self.save()
+        self.save(update_fields=['last_activity'])
 
     def update_tokens(self, token, refresh_token, expired_token=None):
         """Atualiza os tokens da sessão"""
@@ -0,0 +1,107 @@
+# api/models/work_schedule_model.py
+from django.db import models
+from django.core.exceptions import ValidationError
+from .base_model import BaseModel
+
+
+class WorkSchedule(BaseModel):
+    """
+    Escalas de trabalho usadas na precificação de mão de obra.
+    Ex: 5x2 (segunda a sexta), 6x1, 12x36, plantões noturnos.
+    """
+    class ScheduleType(models.TextChoices):
+        WEEKLY = 'WEEKLY', 'Semanal (dias da semana fixos)'
+        CYCLE = 'CYCLE', 'Ciclo (horas trabalhadas x horas de descanso)'
+
+    name = models.CharField('Nome', max_length=100)
+    code = models.CharField('Código', max_length=20)
+    schedule_type = models.CharField(
+        'Tipo de Escala',
+        max_length=10,
+        choices=ScheduleType.choices,
+        default=ScheduleType.WEEKLY
+    )
+    work_days = models.CharField(
+        'Dias Trabalhados',
+        max_length=7,
+        default='12345',
+        help_text='Dias da semana trabalhados (1=segunda ... 7=domingo). Usado em escalas semanais.'
+    )
+    daily_hours = models.DecimalField(
+        'Horas por Dia',
+        max_digits=5,
+        decimal_places=2,
+        default=8,
+        help_text='Horas trabalhadas por dia em escalas semanais'
+    )
+    cycle_work_hours = models.PositiveSmallIntegerField(
+        'Horas Trabalhadas no Ciclo',
+        null=True,
+        blank=True,
+        help_text='Ex: 12 em uma escala 12x36'
+    )
+    cycle_rest_hours = models.PositiveSmallIntegerField(
+        'Horas de Descanso no Ciclo',
+        null=True,
+        blank=True,
+        help_text='Ex: 36 em uma escala 12x36'
+    )
+    cycle_start_date = models.DateField(
+        'Início do Ciclo',
+        null=True,
+        blank=True,
+        help_text='Data de referência do primeiro plantão do ciclo'
+    )
+    start_time = models.TimeField(
+        'Horário de Início',
+        help_text='Horário de início do turno, usado no cálculo de horas noturnas'
+    )
+    works_holidays = models.BooleanField(
+        'Trabalha em Feriados',
+        default=False
+    )
+
+    class Meta:
+        db_table = 'workschedule'
+        ordering = ['name']
+        verbose_name = 'Escala de Trabalho'
+        verbose_name_plural = 'Escalas de Trabalho'
+        indexes = [
+            models.Index(fields=['company_id']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['code', 'company'],
+                name='unique_workschedule_code_per_company'
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.code} - {self.name}"
+
+    def clean(self):
+        if self.schedule_type == self.ScheduleType.WEEKLY:
+            if not self.work_days or not set(self.work_days) <= set('1234567'):
+                raise ValidationError({
+                    'work_days': 'Informe os dias trabalhados com dígitos de 1 (segunda) a 7 (domingo)'
+                })
+        else:
+            if not self.cycle_work_hours or self.cycle_rest_hours is None:
+                raise ValidationError({
+                    'cycle_work_hours': 'Horas trabalhadas e de descanso são obrigatórias em escalas de ciclo'
+                })
+            if (self.cycle_work_hours + self.cycle_rest_hours) % 24:
+                raise ValidationError({
+                    'cycle_rest_hours': 'O ciclo completo deve ser múltiplo de 24 horas (ex: 12x36, 24x48)'
+                })
+            if not self.cycle_start_date:
+                raise ValidationError({
+                    'cycle_start_date': 'Data de início do ciclo é obrigatória em escalas de ciclo'
+                })
+
+    @property
+    def shift_hours(self):
+        """Horas de um turno completo"""
+        if self.schedule_type == self.ScheduleType.CYCLE:
+            return float(self.cycle_work_hours or 0)
+        return float(self.daily_hours or 0)
@@ -22,7 +22,10 @@ from .user_serializer import UserSerializer
 from .usersession_serializer import UserSessionSerializer
 from .auth_serializer import LoginSerializer
 from .supplies_price_list_serializer import SuppliesPriceListSerializer
-# from .contract import ContractSerializer, ContractDetailSerializer, ContractListSerializer
+from .work_schedule_serializer import WorkScheduleSerializer, HolidaySerializer
+from .contract_serializer import ContractSerializer, ContractListSerializer, ContractLineSerializer
+from .pricing_serializer import CustomerPriceListSerializer, QuoteSerializer
+from .maintenance_serializer import MaintenancePlanSerializer, MaintenanceCompletionSerializer
 # from .quote import QuoteSerializer, QuoteDetailSerializer, QuoteListSerializer
 
 __all__ = [
@@ -56,17 +59,25 @@ __all__ = [
     # Supply
     'SupplySerializer',
     'SuppliesPriceListSerializer',
+    'CustomerPriceListSerializer',
+    'QuoteSerializer',
+
+    # Escalas e calendário
+    'WorkScheduleSerializer',
+    'HolidaySerializer',
 
     # Asset
     'AssetSerializer',
     'AssetGroupSerializer',
     'AssetCategorySerializer',
     'AssetMovementSerializer',
+    'MaintenancePlanSerializer',
+    'MaintenanceCompletionSerializer',
 
-    # # Contract
-    # 'ContractSerializer',
-    # 'ContractDetailSerializer',
-    # 'ContractListSerializer',
+    # Contract
+    'ContractSerializer',
+    'ContractListSerializer',
+    'ContractLineSerializer',
 
     # # Quote
     # 'QuoteSerializer',
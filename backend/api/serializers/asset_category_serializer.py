@@ -11,7 +11,8 @@ class AssetCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = AssetCategory
         fields = ['assetcategory_id', 'name', 'code', 'description', 'asset_group', 
-                 'asset_group_name', 'enabled', 'created', 'updated']
+                 'asset_group_name', 'depreciation_method', 'useful_life_months',
+                 'depreciation_rate', 'residual_value_percent', 'enabled', 'created', 'updated']
         read_only_fields = ['created', 'updated']
 
     def validate_code(self, value):
@@ -35,4 +36,18 @@ class AssetCategorySerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({
                 "asset_group": "O grupo selecionado está inativo."
             })
+
+        method = data.get('depreciation_method', getattr(self.instance, 'depreciation_method', None))
+        if method == AssetCategory.DEPRECIATION_STRAIGHT_LINE and not data.get(
+            'useful_life_months', getattr(self.instance, 'useful_life_months', None)
+        ):
+            raise serializers.ValidationError({
+                "useful_life_months": "Informe a vida útil para depreciação linear."
+            })
+        if method == AssetCategory.DEPRECIATION_DECLINING_BALANCE and not data.get(
+            'depreciation_rate', getattr(self.instance, 'depreciation_rate', None)
+        ):
+            raise serializers.ValidationError({
+                "depreciation_rate": "Informe a taxa anual para depreciação por saldo decrescente."
+            })
         return data
\ No newline at end of file
@@ -1,8 +1,9 @@
 
 # apps/assets/serializers/asset_movement_serializer.py
 from rest_framework import serializers
-from ..models import AssetMovement, Asset
-from decimal import Decimal
+from datetime import date
+from django.utils import timezone
+from ..models import AssetMovement, Asset, Location, MovementRollup
 
 # Modifique o arquivo apps/assets/serializers/asset_movement_serializer.py
 # Modifique o arquivo apps/assets/serializers/asset_movement_serializer.py
@@ -18,12 +19,15 @@ class AssetMovementSerializer(serializers.ModelSerializer):
         model = AssetMovement
         fields = [
             'assetmovement_id', 'asset', 'asset_name', 'movement_type', 'movement_type_display',
-            'quantity', 'from_location', 'to_location', 'document_number', 
+            'quantity', 'unit_value', 'total_value', 'from_location', 'to_location', 'document_number', 
             'description',  # Substitua 'notes' por 'description' (se este campo existir)
-            'movement_date', 'created_by', 'created_by_name',
-            'created', 'updated'
+            'movement_date', 'status', 'created_by', 'created_by_name',
+            'approved_by', 'approved_at', 'created', 'updated'
+        ]
+        read_only_fields = [
+            'created', 'updated', 'created_by', 'total_value',
+            'status', 'approved_by', 'approved_at'
         ]
-        read_only_fields = ['created', 'updated', 'created_by']
 
     def validate(self, data):
         """
@@ -36,16 +40,11 @@ class AssetMovementSerializer(serializers.ModelSerializer):
         if not asset or not quantity:
             return data
 
-        # Validar quantidade para saídas
-        if movement_type in ['out', 'transfer']:
-            current_quantity = asset.quantity
-            if Decimal(str(quantity)) > current_quantity:
-                raise serializers.ValidationError({
-                    "quantity": f"Quantidade insuficiente. Disponível: {current_quantity}"
-                })
+        # O saldo é verificado ao aplicar a movimentação (StockService),
+        # de forma atômica com a atualização do estoque
 
         # Validar origem/destino para transferências
-        if movement_type == 'transfer':
+        if movement_type == AssetMovement.TRANSFER:
             from_location = data.get('from_location')
             to_location = data.get('to_location')
             
@@ -66,4 +65,149 @@ class AssetMovementSerializer(serializers.ModelSerializer):
         Sobrescreve o método create para incluir o usuário atual
         """
         validated_data['created_by'] = self.context['request'].user
-        return super().create(validated_data)
\ No newline at end of file
+        return super().create(validated_data)
+
+class AssetMovementBatchLineSerializer(serializers.Serializer):
+    """
+    Linha de um lote de movimentações. Os relacionamentos chegam como ids e
+    são resolvidos em lote pelo AssetMovementBatchSerializer.
+    """
+    asset = serializers.IntegerField()
+    movement_type = serializers.ChoiceField(choices=AssetMovement.MOVEMENT_TYPES)
+    movement_date = serializers.DateField()
+    quantity = serializers.DecimalField(max_digits=10, decimal_places=2)
+    unit_value = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    from_location = serializers.IntegerField()
+    to_location = serializers.IntegerField(required=False, allow_null=True)
+    document_number = serializers.CharField(max_length=50, required=False, allow_blank=True, allow_null=True)
+    description = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    def validate(self, data):
+        if data['quantity'] <= 0:
+            raise serializers.ValidationError({'quantity': 'Quantidade deve ser maior que zero.'})
+
+        if data['movement_type'] == AssetMovement.TRANSFER and not data.get('to_location'):
+            raise serializers.ValidationError({
+                'to_location': 'Local de destino é obrigatório para transferências.'
+            })
+
+        if data.get('to_location') and data['from_location'] == data['to_location']:
+            raise serializers.ValidationError({'to_location': 'Origem e destino não podem ser iguais.'})
+
+        return data
+
+
+class AssetMovementBatchSerializer(serializers.Serializer):
+    """
+    Lote de movimentações: valida todas as linhas e resolve ativos e locais
+    da empresa em uma consulta por tabela
+    """
+    MODE_ATOMIC = 'atomic'
+    MODE_BEST_EFFORT = 'best_effort'
+    MAX_LINES = 1000
+
+    mode = serializers.ChoiceField(choices=[MODE_ATOMIC, MODE_BEST_EFFORT], default=MODE_ATOMIC)
+    movements = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=MAX_LINES)
+
+    def validate(self, data):
+        company = self.context['request'].user.company
+        lines = []
+        errors = {}
+
+        for index, raw in enumerate(data['movements']):
+            line = AssetMovementBatchLineSerializer(data=raw)
+            if line.is_valid():
+                lines.append((index, dict(line.validated_data)))
+            else:
+                errors[index] = line.errors
+
+        assets = Asset.objects.filter(
+            company=company,
+            enabled=True,
+            pk__in={line['asset'] for _, line in lines}
+        ).in_bulk()
+        locations = Location.objects.filter(
+            company=company,
+            pk__in={line['from_location'] for _, line in lines}
+            | {line['to_location'] for _, line in lines if line.get('to_location')}
+        ).in_bulk()
+
+        resolved = []
+        for index, line in lines:
+            if line['asset'] not in assets:
+                errors[index] = {'asset': ['Ativo não encontrado.']}
+                continue
+            if line['from_location'] not in locations or (
+                line.get('to_location') and line['to_location'] not in locations
+            ):
+                errors[index] = {'from_location': ['Local não encontrado.']}
+                continue
+
+            line['asset'] = assets[line['asset']]
+            line['from_location'] = locations[line['from_location']]
+            line['to_location'] = locations.get(line.get('to_location'))
+            resolved.append((index, line))
+
+        data['lines'] = resolved
+        data['errors'] = errors
+        return data
+
+
+class AssetMovementDecisionSerializer(serializers.Serializer):
+    """
+    Aprovação/rejeição em lote de movimentações pendentes
+    """
+    MODE_ATOMIC = 'atomic'
+    MODE_BEST_EFFORT = 'best_effort'
+    MAX_IDS = 5000
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_IDS
+    )
+    mode = serializers.ChoiceField(choices=[MODE_ATOMIC, MODE_BEST_EFFORT], default=MODE_ATOMIC)
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
+
+
+class MovementReportQuerySerializer(serializers.Serializer):
+    """
+    Parâmetros do relatório de movimentações por período
+    """
+    GROUP_BY_CHOICES = ['asset_group', 'location']
+    MAX_DAYS = 366
+
+    period = serializers.ChoiceField(choices=[MovementRollup.PERIOD_DAY, MovementRollup.PERIOD_MONTH], default=MovementRollup.PERIOD_MONTH)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.CharField(required=False, allow_blank=True, default='')
+    movement_type = serializers.ChoiceField(choices=AssetMovement.MOVEMENT_TYPES, required=False)
+
+    def validate_group_by(self, value):
+        names = [name.strip() for name in value.split(',') if name.strip()]
+        invalid = [name for name in names if name not in self.GROUP_BY_CHOICES]
+        if invalid:
+            raise serializers.ValidationError(
+                f"Agrupamento inválido: {', '.join(invalid)}. Use {', '.join(self.GROUP_BY_CHOICES)}."
+            )
+        return list(dict.fromkeys(names))
+
+    def validate(self, data):
+        today = timezone.localdate()
+        end = data.get('end') or today
+        if data['period'] == MovementRollup.PERIOD_MONTH:
+            start = data.get('start') or date(end.year - 1, end.month, 1)
+            start = start.replace(day=1)
+        else:
+            start = data.get('start') or end.replace(day=1)
+            if (end - start).days > self.MAX_DAYS:
+                raise serializers.ValidationError({'start': f'Período diário limitado a {self.MAX_DAYS} dias.'})
+
+        if start > end:
+            raise serializers.ValidationError({'start': 'A data inicial deve ser anterior à data final.'})
+
+        data['start'], data['end'] = start, end
+        return data
+
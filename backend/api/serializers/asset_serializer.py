@@ -1,9 +1,13 @@
 
 # apps/assets/serializers/asset_serializer.py
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 from ..models import Asset, AssetCategory, AssetGroup
+from ..services.asset_code_service import AssetCodeService
 from decimal import Decimal
 
+CODE_GENERATION_ATTEMPTS = 3
+
 class AssetSerializer(serializers.ModelSerializer):
     """
     Serializer principal para o modelo Asset
@@ -17,12 +21,15 @@ class AssetSerializer(serializers.ModelSerializer):
         fields = [
             'asset_id', 'name', 'description', 'asset_group', 'asset_group_name',
             'category', 'category_name', 'asset_code', 'patrimony_code',
-            'serial_number', 'quantity', 'minimum_quantity', 'unit_measure',
-            'purchase_value', 'current_value', 'status', 'status_display',
+            'serial_number', 'quantity', 'minimum_quantity', 'is_low_stock', 'unit_measure',
+            'purchase_value', 'current_value', 'average_cost', 'status', 'status_display',
             'acquisition_date', 'warranty_expiration', 'next_maintenance',
             'location', 'notes', 'enabled', 'created', 'updated'
         ]
-        read_only_fields = ['created', 'updated']
+        read_only_fields = ['created', 'updated', 'is_low_stock', 'average_cost']
+        extra_kwargs = {
+            'asset_code': {'required': False, 'allow_blank': True},
+        }
 
     def validate(self, data):
         """
@@ -61,16 +68,43 @@ class AssetSerializer(serializers.ModelSerializer):
 
     def validate_asset_code(self, value):
         """
-        Validação do código do ativo
+        Normaliza o código do ativo. A unicidade por empresa é garantida pelo
+        índice único do banco (ver create/update)
         """
         if value:
             value = value.upper().strip()
-            if Asset.objects.filter(asset_code__iexact=value).exists():
-                if self.instance and self.instance.asset_code.upper() == value:
-                    return value
-                raise serializers.ValidationError("Já existe um ativo com este código.")
         return value
 
+    def _save_with_code(self, save, validated_data, instance=None):
+        """
+        Executa a gravação convertendo a violação do índice único de código
+        em erro de validação. Sem código informado na criação, gera o próximo
+        código da empresa (tentando um novo bloco se houver colisão).
+        """
+        generate = instance is None and not validated_data.get('asset_code')
+        if instance is None and 'company' not in validated_data:
+            validated_data['company'] = self.context['request'].user.company
+        for _ in range(CODE_GENERATION_ATTEMPTS):
+            if generate:
+                validated_data['asset_code'] = AssetCodeService.next_code(validated_data['company'].company_id)
+            try:
+                with transaction.atomic():
+                    return save(validated_data) if instance is None else save(instance, validated_data)
+            except IntegrityError as exc:
+                if not AssetCodeService.is_code_conflict(exc):
+                    raise
+                if not generate:
+                    raise serializers.ValidationError({'asset_code': 'Já existe um ativo com este código.'})
+                AssetCodeService.discard_block(validated_data['company'].company_id)
+
+        raise serializers.ValidationError({'asset_code': 'Não foi possível gerar um código de ativo.'})
+
+    def create(self, validated_data):
+        return self._save_with_code(super().create, validated_data)
+
+    def update(self, instance, validated_data):
+        return self._save_with_code(super().update, validated_data, instance)
+
 class AssetListSerializer(AssetSerializer):
     """
     Serializer específico para listagem de ativos (com menos campos)
@@ -78,5 +112,5 @@ class AssetListSerializer(AssetSerializer):
     class Meta(AssetSerializer.Meta):
         fields = [
             'asset_id', 'name', 'asset_code', 'asset_group_name', 'category_name',
-            'quantity', 'status_display', 'location'
+            'quantity', 'is_low_stock', 'status_display', 'location'
         ]
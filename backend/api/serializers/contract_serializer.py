@@ -0,0 +1,106 @@
+# api/serializers/contract_serializer.py
+from rest_framework import serializers
+from ..models import Contract, ContractLine
+
+
+class ContractLineSerializer(serializers.ModelSerializer):
+    """
+    Serializer para itens do contrato
+    """
+    supply_name = serializers.CharField(source='supply.name', read_only=True)
+    unit_measure = serializers.CharField(source='supply.unit_measure', read_only=True)
+    work_schedule_code = serializers.CharField(source='work_schedule.code', read_only=True)
+
+    class Meta:
+        model = ContractLine
+        fields = [
+            'contractline_id', 'contract', 'supply', 'supply_name', 'unit_measure',
+            'work_schedule', 'work_schedule_code', 'quantity', 'unit_price',
+            'manual_price', 'total_value', 'sequence', 'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['total_value', 'created', 'updated']
+        extra_kwargs = {
+            'unit_price': {'required': False},
+        }
+
+    def validate(self, data):
+        company = self.context['request'].user.company
+        contract = data.get('contract') or getattr(self.instance, 'contract', None)
+
+        for field in ('contract', 'supply', 'work_schedule'):
+            related = data.get(field)
+            if related is not None and related.company_id != company.company_id:
+                raise serializers.ValidationError({field: 'Registro não pertence à empresa do usuário.'})
+
+        if contract and not contract.is_editable:
+            raise serializers.ValidationError({
+                'contract': 'Itens só podem ser alterados em contratos em rascunho (preços não congelados).'
+            })
+
+        manual_price = data.get('manual_price', getattr(self.instance, 'manual_price', False))
+        if manual_price and data.get('unit_price') is None and not self.instance:
+            raise serializers.ValidationError({
+                'unit_price': 'Informe o preço unitário para itens com preço manual.'
+            })
+
+        return data
+
+
+class ContractSerializer(serializers.ModelSerializer):
+    """
+    Serializer para o cabeçalho do contrato
+    """
+    company_id = serializers.CharField(source='company.company_id', read_only=True)
+    customer_name = serializers.CharField(source='customer.name', read_only=True)
+    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    lines = serializers.SerializerMethodField()
+    price_snapshot_hash = serializers.CharField(source='price_snapshot.content_hash', read_only=True)
+
+    class Meta:
+        model = Contract
+        fields = [
+            'contract_id', 'number', 'customer', 'customer_name', 'description',
+            'status', 'status_display', 'start_date', 'end_date', 'total_value',
+            'confirmed_at', 'price_snapshot_hash', 'lines', 'company_id',
+            'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['total_value', 'confirmed_at', 'company_id', 'created', 'updated']
+
+    def get_lines(self, obj):
+        lines = [line for line in obj.lines.all() if line.enabled]
+        return ContractLineSerializer(lines, many=True, context=self.context).data
+
+    def validate_customer(self, value):
+        company = self.context['request'].user.company
+        if value.company_id != company.company_id:
+            raise serializers.ValidationError('Cliente não pertence à empresa do usuário.')
+        return value
+
+    def validate_status(self, value):
+        """
+        A saída do rascunho acontece pela confirmação, que congela os preços
+        """
+        current = self.instance.status if self.instance else Contract.Status.DRAFT
+        if current == Contract.Status.DRAFT and value not in (Contract.Status.DRAFT, Contract.Status.CANCELLED):
+            raise serializers.ValidationError('Use a confirmação do contrato para enviar a proposta.')
+        return value
+
+    def validate(self, data):
+        if self.instance and not self.instance.is_editable:
+            frozen = {'customer', 'start_date'} & set(data)
+            if frozen:
+                raise serializers.ValidationError({
+                    field: 'Não pode ser alterado após a confirmação.' for field in frozen
+                })
+        return data
+
+
+class ContractListSerializer(ContractSerializer):
+    """
+    Serializer para listagem de contratos (sem itens)
+    """
+    class Meta(ContractSerializer.Meta):
+        fields = [
+            'contract_id', 'number', 'customer', 'customer_name', 'status',
+            'status_display', 'start_date', 'end_date', 'total_value'
+        ]
@@ -0,0 +1,58 @@
+# api/serializers/maintenance_serializer.py
+from django.utils import timezone
+from rest_framework import serializers
+from ..models import MaintenancePlan
+
+
+class MaintenancePlanSerializer(serializers.ModelSerializer):
+    """
+    Serializer para planos de manutenção recorrente por categoria
+    """
+    category_name = serializers.CharField(source='category.name', read_only=True)
+    company_id = serializers.CharField(source='company.company_id', read_only=True)
+
+    class Meta:
+        model = MaintenancePlan
+        fields = [
+            'maintenanceplan_id', 'category', 'category_name', 'name', 'description',
+            'interval_days', 'company_id', 'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['company_id', 'created', 'updated']
+
+    def validate(self, data):
+        company = self.context['request'].user.company
+        category = data.get('category', getattr(self.instance, 'category', None))
+        if category is not None and category.company_id != company.company_id:
+            raise serializers.ValidationError({'category': 'Registro não pertence à empresa do usuário.'})
+
+        if data.get('enabled', True) and category is not None:
+            others = MaintenancePlan.objects.filter(
+                company=company,
+                category=category,
+                enabled=True
+            )
+            if self.instance:
+                others = others.exclude(pk=self.instance.pk)
+            if others.exists():
+                raise serializers.ValidationError({'category': 'A categoria já possui um plano de manutenção ativo.'})
+        return data
+
+
+class MaintenanceCompletionSerializer(serializers.Serializer):
+    """
+    Conclusão de manutenção de um ou mais ativos
+    """
+    MAX_ASSETS = 1000
+
+    assets = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_ASSETS
+    )
+    performed_at = serializers.DateField(required=False)
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    def validate_performed_at(self, value):
+        if value > timezone.localdate():
+            raise serializers.ValidationError('A data da manutenção não pode ser futura.')
+        return value
@@ -0,0 +1,80 @@
+# api/serializers/pricing_serializer.py
+from rest_framework import serializers
+from ..models import CustomerPriceList, Customer, Supply, WorkSchedule
+
+
+class CustomerPriceListSerializer(serializers.ModelSerializer):
+    """
+    Serializer para preços negociados por cliente
+    """
+    customer_name = serializers.CharField(source='customer.name', read_only=True)
+    supply_name = serializers.CharField(source='supply.name', read_only=True)
+    company_id = serializers.CharField(source='company.company_id', read_only=True)
+
+    class Meta:
+        model = CustomerPriceList
+        fields = [
+            'customerpricelist_id', 'customer', 'customer_name', 'supply', 'supply_name',
+            'value', 'notes', 'company_id', 'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['company_id', 'created', 'updated']
+
+    def validate(self, data):
+        company = self.context['request'].user.company
+        for field in ('customer', 'supply'):
+            related = data.get(field)
+            if related is not None and related.company_id != company.company_id:
+                raise serializers.ValidationError({field: 'Registro não pertence à empresa do usuário.'})
+        return data
+
+
+class QuoteItemSerializer(serializers.Serializer):
+    supply = serializers.IntegerField()
+    quantity = serializers.DecimalField(max_digits=15, decimal_places=3, min_value=0)
+    work_schedule = serializers.IntegerField(required=False, allow_null=True)
+
+
+class QuoteSerializer(serializers.Serializer):
+    """
+    Dados de entrada para precificação de um orçamento
+    """
+    customer = serializers.IntegerField(required=False, allow_null=True)
+    reference_date = serializers.DateField(required=False)
+    items = QuoteItemSerializer(many=True, allow_empty=False)
+
+    def validate(self, data):
+        """
+        Carrega clientes, insumos e escalas do orçamento em uma consulta por tabela
+        """
+        company = self.context['request'].user.company
+        items = data['items']
+
+        if data.get('customer') and not Customer.objects.filter(
+            pk=data['customer'], company=company, enabled=True
+        ).exists():
+            raise serializers.ValidationError({'customer': 'Cliente não encontrado.'})
+
+        supplies = Supply.objects.filter(
+            company=company,
+            enabled=True,
+            pk__in={item['supply'] for item in items}
+        ).in_bulk()
+        schedule_ids = {item['work_schedule'] for item in items if item.get('work_schedule')}
+        schedules = WorkSchedule.objects.filter(
+            company=company,
+            enabled=True,
+            pk__in=schedule_ids
+        ).in_bulk() if schedule_ids else {}
+
+        errors = {}
+        for index, item in enumerate(items):
+            if item['supply'] not in supplies:
+                errors[index] = {'supply': 'Insumo não encontrado.'}
+            elif item.get('work_schedule') and item['work_schedule'] not in schedules:
+                errors[index] = {'work_schedule': 'Escala não encontrada.'}
+        if errors:
+            raise serializers.ValidationError({'items': errors})
+
+        data['supplies'] = supplies
+        data['schedules'] = schedules
+        return data
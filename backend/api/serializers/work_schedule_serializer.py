@@ -0,0 +1,62 @@
+# api/serializers/work_schedule_serializer.py
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework import serializers
+from ..models import WorkSchedule, Holiday
+
+
+class WorkScheduleSerializer(serializers.ModelSerializer):
+    """
+    Serializer para escalas de trabalho
+    """
+    company_id = serializers.CharField(source='company.company_id', read_only=True)
+    schedule_type_display = serializers.CharField(source='get_schedule_type_display', read_only=True)
+
+    class Meta:
+        model = WorkSchedule
+        fields = [
+            'workschedule_id', 'name', 'code', 'schedule_type', 'schedule_type_display',
+            'work_days', 'daily_hours', 'cycle_work_hours', 'cycle_rest_hours',
+            'cycle_start_date', 'start_time', 'works_holidays', 'company_id',
+            'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['company_id', 'created', 'updated']
+
+    def validate_code(self, value):
+        return value.upper().strip() if value else value
+
+    def validate(self, data):
+        """
+        Reaproveita as validações do modelo (clean) para escalas semanais e de ciclo
+        """
+        instance = WorkSchedule(**{**self._current_values(), **data})
+        try:
+            instance.clean()
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.message_dict)
+        return data
+
+    def _current_values(self):
+        if not self.instance:
+            return {}
+        return {
+            field: getattr(self.instance, field)
+            for field in (
+                'schedule_type', 'work_days', 'daily_hours', 'cycle_work_hours',
+                'cycle_rest_hours', 'cycle_start_date', 'start_time'
+            )
+        }
+
+
+class HolidaySerializer(serializers.ModelSerializer):
+    """
+    Serializer para feriados
+    """
+    company_id = serializers.CharField(source='company.company_id', read_only=True)
+
+    class Meta:
+        model = Holiday
+        fields = [
+            'holiday_id', 'date', 'description', 'recurring', 'company_id',
+            'created', 'updated', 'enabled'
+        ]
+        read_only_fields = ['company_id', 'created', 'updated']
@@ -1,8 +1,54 @@
 # api/serializers/__init__.py
 from .usersession_service import UserSessionService, UserSession
+from .calendar_service import CalendarService
+from .pricing_service import PricingService
+from .contract_service import ContractService
+from .price_resolver_service import PriceResolverService
+from .price_list_service import PriceListService, PriceListImportError
+from .stock_service import StockService, InsufficientStockError, StockBatchError
+from .stock_ledger_service import StockLedgerService
+from .asset_dashboard_service import AssetDashboardService
+from .low_stock_service import LowStockService
+from .asset_location_service import AssetLocationService
+from .asset_stock_service import AssetStockService
+from .depreciation_service import DepreciationService
+from .maintenance_service import MaintenanceService
+from .valuation_service import ValuationService
+from .stock_reconciliation_service import StockReconciliationService
+from .movement_rollup_service import MovementRollupService
+from .asset_code_service import AssetCodeService
+from .asset_import_service import AssetImportService, AssetImportError
+from .asset_scan_service import AssetScanService
 
 __all__ = [
     # Base
     'UserSession',
     'UserSessionService',
+
+    # Precificação
+    'CalendarService',
+    'PricingService',
+    'ContractService',
+    'PriceResolverService',
+    'PriceListService',
+    'PriceListImportError',
+
+    # Estoque
+    'StockService',
+    'InsufficientStockError',
+    'StockBatchError',
+    'StockLedgerService',
+    'AssetDashboardService',
+    'LowStockService',
+    'AssetLocationService',
+    'AssetStockService',
+    'DepreciationService',
+    'MaintenanceService',
+    'ValuationService',
+    'StockReconciliationService',
+    'MovementRollupService',
+    'AssetCodeService',
+    'AssetImportService',
+    'AssetImportError',
+    'AssetScanService',
 ]
\ No newline at end of file
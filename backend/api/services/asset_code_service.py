@@ -0,0 +1,91 @@
+# services/asset_code_service.py
+import re
+import threading
+
+from django.db import IntegrityError, transaction
+
+from ..models.asset_model import Asset
+from ..models.asset_code_sequence_model import AssetCodeSequence
+
+ASSET_CODE_CONSTRAINT = 'unique_asset_code_per_company'
+
+
+class AssetCodeService:
+    """
+    Geração de códigos de ativo por empresa.
+
+    Cada processo reserva um bloco de números na sequência da empresa
+    (um UPDATE sob bloqueio da linha) e entrega os códigos do bloco sem
+    acessar o banco. A unicidade é garantida pelo índice único
+    (empresa, UPPER(asset_code)); se um código gerado colidir (ex.: bloco
+    reservado em transação desfeita), o bloco é descartado e outro é reservado.
+    """
+    _blocks = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _initial_value(company_id: str, sequence: AssetCodeSequence) -> int:
+        """
+        Primeiro número de uma sequência nova: após o maior código existente
+        da empresa que siga o formato
+        """
+        regex = ''.join(
+            r'(\d+)' if part.startswith('{number')
+            else re.escape(sequence.prefix.upper()) if part == '{prefix}'
+            else re.escape(part.upper())
+            for part in re.split(r'(\{prefix\}|\{number(?::[^}]*)?\})', sequence.pattern)
+        )
+        numbered = re.compile(f'^{regex}$')
+
+        numbers = []
+        codes = Asset.objects.filter(
+            company_id=company_id,
+            asset_code__istartswith=sequence.prefix
+        ).values_list('asset_code', flat=True)
+        for code in codes.iterator():
+            match = numbered.match(code.upper())
+            if match:
+                numbers.append(int(match.group(1)))
+        return max(numbers, default=0) + 1
+
+    @classmethod
+    def _reserve_block(cls, company_id: str) -> list:
+        with transaction.atomic():
+            sequence = AssetCodeSequence.objects.select_for_update().filter(company_id=company_id).first()
+            if sequence is None:
+                sequence = AssetCodeSequence(company_id=company_id)
+                sequence.next_value = cls._initial_value(company_id, sequence)
+                try:
+                    with transaction.atomic():
+                        sequence.save()
+                except IntegrityError:
+                    # Criada por outro processo
+                    sequence = AssetCodeSequence.objects.select_for_update().get(company_id=company_id)
+
+            start = sequence.next_value
+            sequence.next_value = start + sequence.block_size
+            sequence.save(update_fields=['next_value', 'updated'])
+
+        return [start, sequence.next_value, sequence]
+
+    @classmethod
+    def next_code(cls, company_id: str) -> str:
+        """
+        Próximo código de ativo da empresa
+        """
+        with cls._lock:
+            block = cls._blocks.get(company_id)
+            if block is None or block[0] >= block[1]:
+                block = cls._blocks[company_id] = cls._reserve_block(company_id)
+            number = block[0]
+            block[0] += 1
+            return block[2].format(number)
+
+    @classmethod
+    def discard_block(cls, company_id: str) -> None:
+        with cls._lock:
+            cls._blocks.pop(company_id, None)
+
+    @staticmethod
+    def is_code_conflict(error: IntegrityError) -> bool:
+        return ASSET_CODE_CONSTRAINT in str(error) or 'asset.company_id, asset.asset_code' in str(error)
@@ -0,0 +1,101 @@
+# services/asset_dashboard_service.py
+import time
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from core.utils.cache import bump_version, get_version
+from ..models.asset_model import Asset
+
+DASHBOARD_VERSION_KEY = 'asset_dashboard_version:{company_id}'
+DASHBOARD_CACHE_KEY = 'asset_dashboard:{company_id}:{version}:{day}'
+
+
+class AssetDashboardService:
+    """
+    Indicadores do dashboard de ativos.
+
+    Calculados em uma única consulta (agregação condicional agrupada por
+    status e grupo) e mantidos no cache por empresa. Alterações em ativos e
+    movimentações incrementam a versão da empresa, invalidando o cache.
+    Entre processos, isso exige um cache compartilhado (CACHE_REDIS_URL);
+    com LocMemCache cada worker tem o seu dashboard e as suas versões, e um
+    worker só vê alterações feitas em outro ao fim de ASSET_DASHBOARD_CACHE_TTL.
+    """
+
+    @staticmethod
+    def invalidate(company_id: str) -> None:
+        """
+        Invalida o dashboard da empresa após o commit da transação corrente,
+        para que nenhuma leitura concorrente grave no cache dados anteriores ao commit
+        """
+        transaction.on_commit(
+            lambda: bump_version(DASHBOARD_VERSION_KEY.format(company_id=company_id))
+        )
+
+    @staticmethod
+    def compute(company_id: str) -> dict:
+        today = timezone.localdate()
+        rows = Asset.objects.filter(
+            company_id=company_id,
+            enabled=True
+        ).order_by().values('status', 'asset_group__name').annotate(
+            count=Count('pk'),
+            low_stock=Count('pk', filter=Q(is_low_stock=True)),
+            maintenance_needed=Count('pk', filter=Q(next_maintenance__lte=today, status='available')),
+        )
+
+        total_assets = low_stock = maintenance_needed = 0
+        by_status = {}
+        by_group = {}
+        for row in rows:
+            total_assets += row['count']
+            low_stock += row['low_stock']
+            maintenance_needed += row['maintenance_needed']
+            by_status[row['status']] = by_status.get(row['status'], 0) + row['count']
+            group = row['asset_group__name']
+            by_group[group] = by_group.get(group, 0) + row['count']
+
+        return {
+            'total_assets': total_assets,
+            'low_stock': low_stock,
+            'maintenance_needed': maintenance_needed,
+            'by_status': [
+                {'status': status, 'count': count}
+                for status, count in sorted(by_status.items())
+            ],
+            'by_group': [
+                {'asset_group__name': group, 'count': count}
+                for group, count in sorted(by_group.items(), key=lambda item: item[0] or '')
+            ],
+        }
+
+    @classmethod
+    def get(cls, company_id: str, max_staleness: Optional[float] = None) -> dict:
+        """
+        Dashboard da empresa a partir do cache, recalculando quando não houver
+        entrada válida ou quando ela for mais antiga que `max_staleness` segundos
+        """
+        version = get_version(DASHBOARD_VERSION_KEY.format(company_id=company_id))
+        key = DASHBOARD_CACHE_KEY.format(
+            company_id=company_id,
+            version=version,
+            day=timezone.localdate().isoformat()
+        )
+
+        entry = cache.get(key)
+        now = time.time()
+        if entry is not None and (max_staleness is None or now - entry['computed_at'] <= max_staleness):
+            return {**entry['data'], 'computed_at': entry['computed_at'], 'cached': True}
+
+        data = cls.compute(company_id)
+        cache.set(
+            key,
+            {'computed_at': now, 'data': data},
+            getattr(settings, 'ASSET_DASHBOARD_CACHE_TTL', 300)
+        )
+        return {**data, 'computed_at': now, 'cached': False}
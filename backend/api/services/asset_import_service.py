@@ -0,0 +1,368 @@
+# services/asset_import_service.py
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Upper
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from core.utils.bulk import bulk_update_rows
+
+from ..models.asset_model import Asset
+from ..models.asset_group_model import AssetGroup
+from ..models.asset_category_model import AssetCategory
+from ..models.low_stock_event_model import LowStockEvent
+from .asset_code_service import AssetCodeService
+from .asset_dashboard_service import AssetDashboardService
+from .asset_scan_service import AssetScanService
+from .stock_service import StockService
+
+IMPORT_CHUNK_SIZE = 1000
+EXPORT_CHUNK_SIZE = 2000
+
+# Cabeçalho da planilha -> campo do ativo (mesma ordem na exportação)
+COLUMNS = [
+    ('Código', 'asset_code'),
+    ('Nome', 'name'),
+    ('Grupo', 'asset_group__code'),
+    ('Categoria', 'category__code'),
+    ('Descrição', 'description'),
+    ('Código Patrimonial', 'patrimony_code'),
+    ('Número de Série', 'serial_number'),
+    ('Quantidade', 'quantity'),
+    ('Quantidade Mínima', 'minimum_quantity'),
+    ('Unidade de Medida', 'unit_measure'),
+    ('Valor de Compra', 'purchase_value'),
+    ('Valor Atual', 'current_value'),
+    ('Status', 'status'),
+    ('Data de Aquisição', 'acquisition_date'),
+    ('Vencimento da Garantia', 'warranty_expiration'),
+    ('Próxima Manutenção', 'next_maintenance'),
+    ('Localização', 'location'),
+    ('Observações', 'notes'),
+]
+HEADERS = {field: header for header, field in COLUMNS}
+REQUIRED_COLUMNS = {'Nome', 'Grupo', 'Categoria', 'Unidade de Medida'}
+
+TEXT_FIELDS = ('description', 'patrimony_code', 'serial_number', 'location', 'notes')
+DECIMAL_FIELDS = ('quantity', 'minimum_quantity', 'purchase_value', 'current_value')
+DATE_FIELDS = ('acquisition_date', 'warranty_expiration', 'next_maintenance')
+DATE_FORMATS = ('%d/%m/%Y', '%Y-%m-%d')
+
+# Campos gravados na atualização de ativos existentes (o código identifica o
+# ativo). A quantidade só é lida para ativos novos, como saldo inicial: o
+# estoque de ativos existentes muda apenas por movimentações e ajustes.
+UPDATE_FIELDS = [
+    'name', 'asset_group', 'category', *TEXT_FIELDS,
+    *(field for field in DECIMAL_FIELDS if field != 'quantity'), 'unit_measure',
+    'status', *DATE_FIELDS, 'is_low_stock'
+]
+UPDATE_ATTNAMES = [Asset._meta.get_field(name).attname for name in UPDATE_FIELDS]
+
+
+class AssetImportError(ValueError):
+    """Erro de leitura do arquivo de importação"""
+
+
+class AssetImportService:
+    """
+    Importação e exportação de ativos em CSV/XLSX.
+
+    O arquivo é lido em streaming e processado em lotes: grupos e categorias
+    da empresa são carregados uma vez em mapas por código (validação de
+    consistência em memória), os ativos existentes do lote são lidos em uma
+    consulta pelo código normalizado e a gravação é feita com
+    bulk_create/bulk_update, um lote por transação.
+    """
+    STATUS_BY_LABEL = {label.upper(): value for value, label in Asset.STATUS_CHOICES}
+    STATUS_VALUES = {value for value, _ in Asset.STATUS_CHOICES}
+
+    # Leitura
+
+    @staticmethod
+    def read_rows(file, filename: str) -> Iterator[dict]:
+        """
+        Linhas do arquivo como dicionários (cabeçalho -> valor), sem carregar
+        o arquivo inteiro em memória. CSV separado por ';' (UTF-8, com ou sem BOM)
+        ou XLSX (primeira planilha).
+        """
+        filename = filename.lower()
+        if filename.endswith('.csv'):
+            reader = csv.DictReader(io.TextIOWrapper(file, encoding='utf-8-sig', newline=''), delimiter=';')
+            if not reader.fieldnames:
+                raise AssetImportError('Arquivo vazio.')
+            AssetImportService._check_headers(reader.fieldnames)
+            yield from reader
+            return
+
+        if filename.endswith('.xlsx'):
+            workbook = load_workbook(file, read_only=True, data_only=True)
+            try:
+                rows = workbook.active.iter_rows(values_only=True)
+                headers = [str(value).strip() if value is not None else '' for value in next(rows, ())]
+                if not headers:
+                    raise AssetImportError('Arquivo vazio.')
+                AssetImportService._check_headers(headers)
+                for values in rows:
+                    if any(value not in (None, '') for value in values):
+                        yield dict(zip(headers, values))
+            finally:
+                workbook.close()
+            return
+
+        raise AssetImportError('Formato de arquivo não suportado. Use CSV ou XLSX.')
+
+    @staticmethod
+    def _check_headers(headers: Iterable[str]) -> None:
+        missing = REQUIRED_COLUMNS - {header.strip() for header in headers if header}
+        if missing:
+            raise AssetImportError(f'Colunas obrigatórias faltando: {", ".join(sorted(missing))}')
+
+    # Conversão de valores
+
+    @staticmethod
+    def _text(value) -> Optional[str]:
+        if value is None:
+            return None
+        value = str(value).strip()
+        return value or None
+
+    @staticmethod
+    def _decimal(value, label: str) -> Optional[Decimal]:
+        if value is None or str(value).strip() == '':
+            return None
+        if isinstance(value, (int, float, Decimal)):
+            return Decimal(str(value))
+        text = str(value).strip()
+        if ',' in text:
+            text = text.replace('.', '').replace(',', '.')
+        try:
+            return Decimal(text)
+        except InvalidOperation:
+            raise ValueError(f'{label}: valor numérico inválido ({value})')
+
+    @staticmethod
+    def _date(value, label: str) -> Optional[date]:
+        if value is None or str(value).strip() == '':
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        for fmt in DATE_FORMATS:
+            try:
+                return datetime.strptime(str(value).strip(), fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(f'{label}: data inválida ({value}); use DD/MM/AAAA')
+
+    @classmethod
+    def _parse(cls, row: dict, groups: Dict[str, int], categories: Dict[str, tuple]) -> dict:
+        """
+        Valores do ativo a partir da linha, validados em memória
+        """
+        get = lambda header: row.get(header)
+        data = {'asset_code': (cls._text(get('Código')) or '').upper()}
+
+        data['name'] = cls._text(get('Nome'))
+        if not data['name']:
+            raise ValueError('Nome é obrigatório')
+        data['unit_measure'] = cls._text(get('Unidade de Medida'))
+        if not data['unit_measure']:
+            raise ValueError('Unidade de Medida é obrigatória')
+
+        group_code = (cls._text(get('Grupo')) or '').upper()
+        category_code = (cls._text(get('Categoria')) or '').upper()
+        if group_code not in groups:
+            raise ValueError(f'Grupo não encontrado: {group_code or "(vazio)"}')
+        if category_code not in categories:
+            raise ValueError(f'Categoria não encontrada: {category_code or "(vazio)"}')
+        category_id, category_group_id = categories[category_code]
+        if category_group_id != groups[group_code]:
+            raise ValueError('A categoria selecionada não pertence ao grupo escolhido.')
+        data['asset_group_id'] = groups[group_code]
+        data['category_id'] = category_id
+
+        for field in TEXT_FIELDS:
+            data[field] = cls._text(get(HEADERS[field]))
+        for field in DECIMAL_FIELDS:
+            value = cls._decimal(get(HEADERS[field]), HEADERS[field])
+            if value is not None and value < 0:
+                raise ValueError(f'{HEADERS[field]}: valor não pode ser negativo')
+            data[field] = value
+        for field in DATE_FIELDS:
+            data[field] = cls._date(get(HEADERS[field]), HEADERS[field])
+
+        data['quantity'] = data['quantity'] or Decimal('0')
+        data['minimum_quantity'] = data['minimum_quantity'] or Decimal('0')
+        if data['acquisition_date'] and data['warranty_expiration'] and data['warranty_expiration'] < data['acquisition_date']:
+            raise ValueError('A data de vencimento da garantia não pode ser anterior à data de aquisição.')
+
+        status = (cls._text(get('Status')) or 'available')
+        status = status if status in cls.STATUS_VALUES else cls.STATUS_BY_LABEL.get(status.upper())
+        if not status:
+            raise ValueError(f'Status inválido: {get("Status")}')
+        data['status'] = status
+        return data
+
+    # Importação
+
+    @classmethod
+    def import_rows(cls, company_id: str, rows: Iterable[dict], chunk_size: int = IMPORT_CHUNK_SIZE) -> dict:
+        """
+        Importa as linhas: cria ativos com código novo (ou sem código, usando
+        a sequência da empresa), com a quantidade lançada como saldo inicial,
+        e atualiza os existentes pelo código, sem alterar a quantidade.
+        Linhas inválidas são informadas em `errors` sem interromper o lote.
+
+        Returns:
+            dict: created, updated e errors (linha do arquivo e mensagem)
+        """
+        groups = dict(
+            AssetGroup.objects.filter(company_id=company_id, enabled=True).annotate(
+                code_upper=Upper('code')
+            ).values_list('code_upper', 'pk')
+        )
+        categories = {
+            code: (pk, group_id)
+            for code, pk, group_id in AssetCategory.objects.filter(company_id=company_id, enabled=True).annotate(
+                code_upper=Upper('code')
+            ).values_list('code_upper', 'pk', 'asset_group_id')
+        }
+
+        result = {'created': 0, 'updated': 0, 'errors': []}
+        # Linha 1 é o cabeçalho
+        numbered = enumerate(rows, start=2)
+        while True:
+            chunk = list(islice(numbered, chunk_size))
+            if not chunk:
+                break
+
+            parsed = []
+            for line, row in chunk:
+                try:
+                    parsed.append((line, cls._parse(row, groups, categories)))
+                except ValueError as exc:
+                    result['errors'].append({'row': line, 'error': str(exc)})
+
+            try:
+                with transaction.atomic():
+                    created, updated = cls._write_chunk(company_id, parsed, result['errors'])
+            except IntegrityError as exc:
+                # A reserva do bloco de códigos foi desfeita com o lote: o bloco
+                # local não pode continuar sendo usado
+                AssetCodeService.discard_block(company_id)
+                lines = [line for line, _ in parsed]
+                if lines:
+                    result['errors'].append({
+                        'row': f'{lines[0]}-{lines[-1]}',
+                        'error': f'Lote não importado: {exc}'
+                    })
+                continue
+            result['created'] += created
+            result['updated'] += updated
+
+        if result['created'] or result['updated']:
+            AssetDashboardService.invalidate(company_id)
+            AssetScanService.invalidate(company_id)
+        return result
+
+    @staticmethod
+    def _write_chunk(company_id: str, parsed: List[tuple], errors: List[dict]) -> tuple:
+        codes = {data['asset_code'] for _, data in parsed if data['asset_code']}
+        existing = {
+            code: (pk, is_low_stock, quantity)
+            for code, pk, is_low_stock, quantity in Asset.objects.filter(company_id=company_id).annotate(
+                code_upper=Upper('asset_code')
+            ).filter(code_upper__in=codes).values_list('code_upper', 'pk', 'is_low_stock', 'quantity')
+        } if codes else {}
+
+        # Código patrimonial é único em todas as empresas
+        patrimony_codes = {data['patrimony_code'] for _, data in parsed if data['patrimony_code']}
+        patrimony_owners = dict(
+            Asset.objects.filter(patrimony_code__in=patrimony_codes).values_list('patrimony_code', 'pk')
+        ) if patrimony_codes else {}
+
+        to_create, to_update, events = [], [], []
+        seen_codes, seen_patrimony = set(), set()
+        for line, data in parsed:
+            code = data['asset_code']
+            asset_id, was_low, quantity = existing.get(code, (None, None, data['quantity']))
+            patrimony = data['patrimony_code']
+            if data['minimum_quantity'] > quantity:
+                errors.append({'row': line, 'error': 'A quantidade mínima não pode ser maior que a quantidade atual.'})
+                continue
+            if code and code in seen_codes:
+                errors.append({'row': line, 'error': f'Código repetido no arquivo: {code}'})
+                continue
+            if patrimony and (patrimony in seen_patrimony or patrimony_owners.get(patrimony, asset_id) != asset_id):
+                errors.append({'row': line, 'error': f'Código patrimonial já utilizado: {patrimony}'})
+                continue
+            seen_codes.add(code)
+            if patrimony:
+                seen_patrimony.add(patrimony)
+            data['quantity'] = quantity
+            data['is_low_stock'] = quantity <= data['minimum_quantity']
+
+            if asset_id is None:
+                if not code:
+                    code = AssetCodeService.next_code(company_id)
+                    # Código gerado não pode colidir com os informados no lote
+                    while code in codes:
+                        code = AssetCodeService.next_code(company_id)
+                to_create.append(Asset(company_id=company_id, **{**data, 'asset_code': code}))
+                continue
+
+            to_update.append((asset_id, *(data[attname] for attname in UPDATE_ATTNAMES)))
+            if data['is_low_stock'] != was_low:
+                events.append((asset_id, data))
+
+        Asset.objects.bulk_create(to_create, batch_size=IMPORT_CHUNK_SIZE)
+        StockService.record_opening(company_id, to_create)
+        bulk_update_rows(Asset, UPDATE_FIELDS, to_update, batch_size=IMPORT_CHUNK_SIZE, updated=timezone.now())
+
+        # Mesmas transições registradas por Asset.save()
+        events.extend((asset.pk, vars(asset)) for asset in to_create if asset.is_low_stock)
+        LowStockEvent.objects.bulk_create([
+            LowStockEvent(
+                company_id=company_id,
+                asset_id=asset_id,
+                is_low_stock=data['is_low_stock'],
+                quantity=data['quantity'],
+                minimum_quantity=data['minimum_quantity']
+            )
+            for asset_id, data in events
+        ], batch_size=IMPORT_CHUNK_SIZE)
+
+        return len(to_create), len(to_update)
+
+    # Exportação
+
+    @staticmethod
+    def export_rows(queryset, as_text: bool = True) -> Iterator[list]:
+        """
+        Cabeçalho e linhas dos ativos, lidos em blocos (sem instanciar modelos),
+        no mesmo layout aceito pela importação. Com `as_text`, datas e números
+        são formatados para CSV (DD/MM/AAAA e vírgula decimal).
+        """
+        yield [header for header, _ in COLUMNS]
+        fields = [field for _, field in COLUMNS]
+        for values in queryset.order_by('asset_code', 'pk').values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            if not as_text:
+                yield list(values)
+                continue
+            row = []
+            for value in values:
+                if value is None:
+                    value = ''
+                elif isinstance(value, date):
+                    value = value.strftime('%d/%m/%Y')
+                elif isinstance(value, Decimal):
+                    value = str(value).replace('.', ',')
+                row.append(value)
+            yield row
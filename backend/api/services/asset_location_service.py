@@ -0,0 +1,193 @@
+# services/asset_location_service.py
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional, Tuple
+
+from django.db.models import Q
+from django.utils import timezone
+
+from core.utils.bulk import bulk_update_values
+
+from ..models.asset_location_model import AssetLocation
+
+HISTORY_FIELDS = (
+    'assetlocation_id', 'asset_id', 'location_id', 'location__name',
+    'start_date', 'end_date', 'current', 'notes'
+)
+
+# Intervalos abertos no mesmo dia ficam na ordem em que foram registrados
+SAME_DAY_STEP = timedelta(microseconds=1)
+
+
+class AssetLocationService:
+    """
+    Histórico de localização dos ativos em intervalos [start_date, end_date).
+
+    O ativo recebe um intervalo atual ao ser criado (local do saldo inicial);
+    cada transferência fecha o intervalo vigente na data da movimentação e
+    abre um novo na mesma transação. As consultas por instante usam os
+    índices por (ativo, início) e (local, início, fim).
+    """
+    OPENING_NOTES = 'Local inicial'
+
+    @staticmethod
+    def _serialize(row: dict) -> dict:
+        return {
+            'assetlocation_id': row['assetlocation_id'],
+            'asset': row['asset_id'],
+            'location': row['location_id'],
+            'location_name': row['location__name'],
+            'start_date': row['start_date'],
+            'end_date': row['end_date'],
+            'current': row['current'],
+            'notes': row['notes'],
+        }
+
+    @staticmethod
+    def start_of(day: date) -> datetime:
+        """Início do dia no fuso corrente (datas de movimentação não têm hora)"""
+        return timezone.make_aware(datetime.combine(day, time.min))
+
+    @classmethod
+    def _insert(cls, company_id: str, asset_id: int, location_id: int, day: date, notes: Optional[str], now) -> None:
+        """
+        Movimentação retroativa: fecha na data o intervalo que a contém e
+        abre o novo até o início do intervalo seguinte (o local atual só muda
+        se o intervalo fechado era o atual)
+        """
+        start = cls.start_of(day)
+        intervals = AssetLocation.objects.filter(asset_id=asset_id)
+        containing = intervals.filter(
+            start_date__lt=start + timedelta(days=1)
+        ).order_by('-start_date', '-pk').first()
+
+        if containing is not None:
+            start = max(start, containing.start_date + SAME_DAY_STEP)
+            end, current = containing.end_date, containing.current
+            AssetLocation.objects.filter(pk=containing.pk).update(current=False, end_date=start, updated=now)
+        else:
+            end = intervals.order_by('start_date').values_list('start_date', flat=True).first()
+            current = end is None
+
+        AssetLocation.objects.create(
+            company_id=company_id,
+            asset_id=asset_id,
+            location_id=location_id,
+            start_date=start,
+            end_date=end,
+            current=current,
+            notes=notes
+        )
+
+    @classmethod
+    def move_many(
+        cls,
+        company_id: str,
+        destinations: Dict[int, Tuple[int, date]],
+        notes: Optional[str] = None
+    ) -> int:
+        """
+        Registra a chegada dos ativos aos locais (ativo -> (id do local, data
+        da movimentação)): o intervalo atual é fechado no início do dia da
+        movimentação, ou logo após o seu início se ele começou no mesmo dia,
+        e o novo passa a ser o atual. Ativos sem intervalo recebem o primeiro.
+        Deve ser chamado dentro da transação da movimentação.
+        """
+        if not destinations:
+            return 0
+        now = timezone.now()
+
+        current = dict(
+            AssetLocation.objects.filter(
+                asset_id__in=list(destinations),
+                current=True
+            ).values_list('asset_id', 'start_date')
+        )
+
+        # Ativos sem intervalo atual, mas com histórico, recebem a movimentação retroativa
+        with_history = set(
+            AssetLocation.objects.filter(
+                asset_id__in=[asset_id for asset_id in destinations if asset_id not in current]
+            ).values_list('asset_id', flat=True)
+        ) if len(current) < len(destinations) else set()
+
+        closed, opened, backdated = [], [], []
+        for asset_id, (location_id, day) in destinations.items():
+            start = cls.start_of(day)
+            current_start = current.get(asset_id)
+            if current_start is not None:
+                if current_start >= start + timedelta(days=1):
+                    backdated.append(asset_id)
+                    continue
+                start = max(start, current_start + SAME_DAY_STEP)
+                closed.append((asset_id, start))
+            elif asset_id in with_history:
+                backdated.append(asset_id)
+                continue
+            opened.append(AssetLocation(
+                company_id=company_id,
+                asset_id=asset_id,
+                location_id=location_id,
+                start_date=start,
+                current=True,
+                notes=notes
+            ))
+
+        if closed:
+            ids = dict(
+                AssetLocation.objects.filter(
+                    asset_id__in=[asset_id for asset_id, _ in closed],
+                    current=True
+                ).values_list('asset_id', 'pk')
+            )
+            bulk_update_values(
+                AssetLocation, 'end_date',
+                [(ids[asset_id], end) for asset_id, end in closed],
+                current=False,
+                updated=now
+            )
+        AssetLocation.objects.bulk_create(opened)
+
+        for asset_id in backdated:
+            location_id, day = destinations[asset_id]
+            cls._insert(company_id, asset_id, location_id, day, notes, now)
+        return len(destinations)
+
+    @classmethod
+    def move(cls, company_id: str, asset_id: int, location_id: int, day: date) -> None:
+        cls.move_many(company_id, {asset_id: (location_id, day)})
+
+    @classmethod
+    def history(cls, asset_id: int) -> list:
+        rows = AssetLocation.objects.filter(asset_id=asset_id).order_by('-start_date', '-pk').values(*HISTORY_FIELDS)
+        return [cls._serialize(row) for row in rows]
+
+    @classmethod
+    def location_at(cls, asset_id: int, at: datetime) -> Optional[dict]:
+        """
+        Local do ativo no instante informado: último intervalo iniciado até T
+        (busca pelo índice) que ainda estava aberto em T
+        """
+        row = AssetLocation.objects.filter(
+            asset_id=asset_id,
+            start_date__lte=at
+        ).order_by('-start_date', '-pk').values(*HISTORY_FIELDS).first()
+
+        if row is None or (row['end_date'] is not None and row['end_date'] <= at):
+            return None
+        return cls._serialize(row)
+
+    @staticmethod
+    def assets_at(company_id: str, location_id: int, at: Optional[datetime] = None):
+        """
+        Ativos presentes no local: atuais (índice parcial) ou no instante informado
+        """
+        queryset = AssetLocation.objects.filter(company_id=company_id, location_id=location_id)
+        if at is None:
+            queryset = queryset.filter(current=True)
+        else:
+            queryset = queryset.filter(start_date__lte=at).filter(
+                Q(end_date__isnull=True) | Q(end_date__gt=at)
+            )
+        return queryset.order_by('asset__name').values(
+            'asset_id', 'asset__asset_code', 'asset__name', 'start_date', 'end_date'
+        )
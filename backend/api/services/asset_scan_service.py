@@ -0,0 +1,109 @@
+# services/asset_scan_service.py
+from typing import Callable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.functions import Upper
+
+from core.utils.cache import TTLCache, bump_version, get_version
+from ..models.asset_model import Asset
+
+# Ordem de prioridade quando o código coincide com mais de um campo
+SCAN_FIELDS = (
+    ('asset_code', 'code_upper'),
+    ('patrimony_code', 'patrimony_upper'),
+    ('serial_number', 'serial_upper'),
+)
+
+SCAN_VERSION_KEY = 'asset_scan_version:{company_id}'
+
+
+class AssetScanService:
+    """
+    Localização de ativos por leitura de código de barras: código do ativo,
+    código patrimonial ou número de série, sem diferenciar maiúsculas.
+
+    A busca usa igualdade sobre UPPER(campo), atendida pelos índices
+    funcionais do ativo, um campo por vez. O ativo já serializado para cada
+    (empresa, código) fica em cache no processo, sob a versão de cache da
+    empresa: no acerto não há consulta ao banco. A versão é incrementada
+    pelos sinais de ativo e movimentação e pelos caminhos em lote que não
+    disparam sinais (ver invalidate). Códigos não encontrados não são guardados.
+    """
+    _cache = TTLCache(
+        maxsize=getattr(settings, 'ASSET_SCAN_CACHE_MAX_ENTRIES', 4096),
+        ttl=getattr(settings, 'ASSET_SCAN_CACHE_TTL', 300)
+    )
+
+    @staticmethod
+    def invalidate(company_id: str) -> None:
+        """
+        Invalida as leituras em cache da empresa após o commit da transação
+        corrente, para que nenhuma leitura concorrente grave no cache dados
+        anteriores ao commit
+        """
+        transaction.on_commit(
+            lambda: bump_version(SCAN_VERSION_KEY.format(company_id=company_id))
+        )
+
+    @staticmethod
+    def normalize(code: str) -> str:
+        return (code or '').strip().upper()
+
+    @staticmethod
+    def _queryset(company_id: str):
+        return Asset.objects.filter(company_id=company_id, enabled=True).annotate(
+            **{alias: Upper(field) for field, alias in SCAN_FIELDS}
+        )
+
+    @classmethod
+    def _resolve(cls, company_id: str, code: str) -> Optional[Tuple[int, str]]:
+        # Uma busca indexada por campo, na ordem de prioridade (um OR entre
+        # as expressões leva o SQLite a percorrer todos os ativos da empresa)
+        for field, alias in SCAN_FIELDS:
+            asset_id = cls._queryset(company_id).filter(**{alias: code}).order_by('pk').values_list(
+                'pk', flat=True
+            ).first()
+            if asset_id is not None:
+                return asset_id, field
+        return None
+
+    @classmethod
+    def lookup(
+        cls,
+        company_id: str,
+        code: str,
+        serialize: Callable[[Asset], dict]
+    ) -> Optional[Tuple[dict, str]]:
+        """
+        Ativo da empresa correspondente ao código lido, já serializado, e o
+        campo que coincidiu
+
+        Args:
+            serialize: converte o ativo (com grupo e categoria carregados) na
+                representação devolvida e guardada em cache
+
+        Returns:
+            (dados do ativo, campo) ou None se nenhum ativo ativo tiver o código
+        """
+        code = cls.normalize(code)
+        if not code:
+            return None
+
+        # A versão é lida antes do banco: uma alteração durante a leitura
+        # incrementa a versão e a entrada gravada abaixo deixa de ser usada
+        version = get_version(SCAN_VERSION_KEY.format(company_id=company_id))
+        key = (company_id, code, version)
+        cached = cls._cache.get(key)
+        if cached is not None:
+            data, field = cached
+            return dict(data), field
+
+        resolved = cls._resolve(company_id, code)
+        if resolved is None:
+            return None
+
+        asset_id, field = resolved
+        data = serialize(Asset.objects.select_related('asset_group', 'category').get(pk=asset_id))
+        cls._cache.set(key, (data, field))
+        return dict(data), field
@@ -0,0 +1,224 @@
+# services/asset_stock_service.py
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import F, Sum
+
+from ..models.asset_movement_model import AssetMovement
+from ..models.asset_stock_model import AssetStock
+from ..models.location_model import Location
+from ..models.stock_ledger_model import StockLedgerEntry
+
+StockKey = Tuple[int, int]  # (asset_id, location_id)
+
+REBUILD_BATCH_SIZE = 1000
+
+
+class AssetStockService:
+    """
+    Saldos por local derivados do saldo inicial e das movimentações aprovadas:
+    - saldo inicial: soma no local do lançamento do razão
+    - entrada: soma no destino (ou na origem, quando não há destino)
+    - saída: subtrai da origem
+    - transferência: subtrai da origem e soma no destino
+    """
+
+    @staticmethod
+    def location_deltas(
+        movement_type: str,
+        quantity: Decimal,
+        from_location_id: Optional[int],
+        to_location_id: Optional[int]
+    ) -> List[Tuple[int, Decimal]]:
+        if movement_type == AssetMovement.ENTRY:
+            return [(to_location_id or from_location_id, quantity)]
+        if movement_type == AssetMovement.EXIT:
+            return [(from_location_id, -quantity)]
+        if movement_type == AssetMovement.TRANSFER:
+            return [(from_location_id, -quantity), (to_location_id, quantity)]
+        return []
+
+    @classmethod
+    def movement_deltas(cls, movement: AssetMovement) -> Dict[StockKey, Decimal]:
+        deltas = defaultdict(Decimal)
+        for location_id, delta in cls.location_deltas(
+            movement.movement_type, movement.quantity, movement.from_location_id, movement.to_location_id
+        ):
+            deltas[(movement.asset_id, location_id)] += delta
+        return deltas
+
+    @staticmethod
+    def resolve_locations(company_id: str, names: Dict[int, Optional[str]]) -> Dict[int, int]:
+        """
+        Local do saldo inicial de cada ativo (ativo -> nome informado no
+        campo `location`): o local cadastrado com o mesmo nome, sem diferenciar
+        maiúsculas, ou o local padrão da empresa (STOCK_DEFAULT_LOCATION_NAME)
+
+        Returns:
+            dict: ativo -> id do local
+        """
+        if not names:
+            return {}
+
+        locations = {}
+        for location_id, name in Location.objects.filter(
+            company_id=company_id,
+            enabled=True
+        ).order_by('location_id').values_list('location_id', 'name'):
+            locations.setdefault(name.strip().lower(), location_id)
+
+        resolved, missing = {}, []
+        for asset_id, name in names.items():
+            location_id = locations.get((name or '').strip().lower())
+            if location_id is None:
+                missing.append(asset_id)
+            else:
+                resolved[asset_id] = location_id
+
+        if missing:
+            default_name = settings.STOCK_DEFAULT_LOCATION_NAME
+            location_id = locations.get(default_name.lower())
+            if location_id is None:
+                location_id = Location.objects.create(
+                    company_id=company_id,
+                    name=default_name,
+                    address=''
+                ).location_id
+            resolved.update((asset_id, location_id) for asset_id in missing)
+
+        return resolved
+
+    @staticmethod
+    def apply(company_id: str, deltas: Dict[StockKey, Decimal]) -> bool:
+        """
+        Aplica variações aos saldos por local. Saídas só são aplicadas se o
+        local tiver a quantidade (UPDATE condicional na linha do ativo no
+        local). Deve ser chamado na transação da movimentação, após o UPDATE
+        do ativo: o bloqueio da linha do ativo serializa as alterações
+        concorrentes dos seus saldos por local, e o chamador desfaz a
+        transação quando algum local não tem saldo.
+
+        Returns:
+            bool: False quando algum local não tem saldo suficiente
+        """
+        deltas = {key: delta for key, delta in deltas.items() if key[1] and delta}
+        if not deltas:
+            return True
+
+        # Garante a existência das linhas (uma consulta) e aplica as variações com F()
+        AssetStock.objects.bulk_create(
+            [
+                AssetStock(company_id=company_id, asset_id=asset_id, location_id=location_id)
+                for asset_id, location_id in deltas
+            ],
+            ignore_conflicts=True
+        )
+        for (asset_id, location_id), delta in sorted(deltas.items()):
+            queryset = AssetStock.objects.filter(asset_id=asset_id, location_id=location_id)
+            if delta < 0:
+                queryset = queryset.filter(quantity__gte=-delta)
+            if queryset.update(quantity=F('quantity') + delta) != 1:
+                return False
+        return True
+
+    @staticmethod
+    def create_openings(company_id: str, balances: Dict[StockKey, Decimal]) -> None:
+        """
+        Grava os saldos por local de ativos recém-criados (sem linhas
+        existentes), em massa e sem UPDATE por linha
+        """
+        AssetStock.objects.bulk_create(
+            [
+                AssetStock(company_id=company_id, asset_id=asset_id, location_id=location_id, quantity=quantity)
+                for (asset_id, location_id), quantity in balances.items()
+                if quantity
+            ],
+            batch_size=REBUILD_BATCH_SIZE
+        )
+
+    @classmethod
+    def expected_balances(cls, company_id: str, asset_ids: Optional[List[int]] = None) -> Dict[StockKey, Decimal]:
+        """
+        Saldos por local esperados a partir dos saldos iniciais do razão e do
+        histórico de movimentações aprovadas, com uma consulta agrupada para
+        cada origem. Ajustes de conciliação não entram: eles corrigem o
+        estoque para este saldo.
+        """
+        movements = AssetMovement.objects.filter(
+            company_id=company_id,
+            status=AssetMovement.APPROVED,
+            enabled=True
+        )
+        openings = StockLedgerEntry.objects.filter(
+            company_id=company_id,
+            entry_type=StockLedgerEntry.OPENING,
+            location__isnull=False
+        )
+        if asset_ids is not None:
+            movements = movements.filter(asset_id__in=asset_ids)
+            openings = openings.filter(asset_id__in=asset_ids)
+
+        balances = defaultdict(Decimal)
+        for row in movements.order_by().values(
+            'asset_id', 'movement_type', 'from_location_id', 'to_location_id'
+        ).annotate(total=Sum('quantity')):
+            for location_id, delta in cls.location_deltas(
+                row['movement_type'], row['total'], row['from_location_id'], row['to_location_id']
+            ):
+                if location_id:
+                    balances[(row['asset_id'], location_id)] += delta
+
+        for asset_id, location_id, total in openings.order_by().values('asset_id', 'location_id').annotate(
+            total=Sum('quantity_delta')
+        ).values_list('asset_id', 'location_id', 'total'):
+            balances[(asset_id, location_id)] += total
+
+        return balances
+
+    @classmethod
+    def rebuild(cls, company_id: str) -> int:
+        """
+        Recalcula todos os saldos por local da empresa (ver expected_balances)
+
+        Returns:
+            int: quantidade de saldos gravados
+        """
+        balances = cls.expected_balances(company_id)
+
+        AssetStock.objects.filter(company_id=company_id).delete()
+        AssetStock.objects.bulk_create(
+            [
+                AssetStock(
+                    company_id=company_id,
+                    asset_id=asset_id,
+                    location_id=location_id,
+                    quantity=quantity
+                )
+                for (asset_id, location_id), quantity in balances.items()
+            ],
+            batch_size=REBUILD_BATCH_SIZE
+        )
+        return len(balances)
+
+    @staticmethod
+    def current_balances(asset_ids: List[int]) -> Dict[StockKey, Decimal]:
+        return {
+            (asset_id, location_id): quantity
+            for asset_id, location_id, quantity in AssetStock.objects.filter(
+                asset_id__in=asset_ids
+            ).values_list('asset_id', 'location_id', 'quantity')
+        }
+
+    @staticmethod
+    def by_location(company_id: str, location_id: Optional[int] = None, asset_id: Optional[int] = None):
+        queryset = AssetStock.objects.filter(company_id=company_id, enabled=True)
+        if location_id:
+            queryset = queryset.filter(location_id=location_id)
+        if asset_id:
+            queryset = queryset.filter(asset_id=asset_id)
+        return queryset.order_by('location__name', 'asset__name').values(
+            'asset_id', 'asset__asset_code', 'asset__name',
+            'location_id', 'location__name', 'quantity'
+        )
@@ -0,0 +1,222 @@
+# services/calendar_service.py
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from django.db.models import Q
+
+from core.utils.cache import bump_version, get_version
+
+from ..models.holiday_model import Holiday
+from ..models.work_schedule_model import WorkSchedule
+
+# Adicional noturno (CLT art. 73): das 22h às 5h
+NIGHT_START_HOUR = 22
+NIGHT_END_HOUR = 5
+
+CALENDAR_VERSION_KEY = 'calendar_version:{company_id}'
+
+
+class YearCalendar:
+    """
+    Tabela diária pré-calculada de um ano para uma empresa.
+    Cada posição dos arrays corresponde a um dia do ano.
+    """
+    __slots__ = ('company_id', 'year', 'days', 'weekday', 'holiday', 'month_starts')
+
+    def __init__(self, company_id: str, year: int, holiday_dates: Iterable):
+        start = np.datetime64(f'{year}-01-01')
+        end = np.datetime64(f'{year + 1}-01-01')
+        months = np.arange(
+            np.datetime64(f'{year}-01'),
+            np.datetime64(f'{year + 1}-01'),
+            dtype='datetime64[M]'
+        )
+
+        self.company_id = company_id
+        self.year = year
+        self.days = np.arange(start, end, dtype='datetime64[D]')
+        # 1970-01-01 foi uma quinta-feira; dias da semana no padrão ISO (1=segunda ... 7=domingo)
+        self.weekday = ((self.days.astype(np.int64) + 3) % 7 + 1).astype(np.int8)
+        self.holiday = np.isin(self.days, np.array(list(holiday_dates), dtype='datetime64[D]'))
+        self.month_starts = (months.astype('datetime64[D]') - start).astype(np.int64)
+
+    @property
+    def business_days(self) -> np.ndarray:
+        """Dias úteis: segunda a sexta, exceto feriados"""
+        return (self.weekday <= 5) & ~self.holiday
+
+    def monthly_sum(self, values: np.ndarray) -> np.ndarray:
+        """Soma um array diário por mês (12 posições)"""
+        return np.add.reduceat(values, self.month_starts)
+
+
+class ScheduleTable:
+    """
+    Dias trabalhados, horas e horas noturnas de uma escala em um ano
+    """
+    __slots__ = ('calendar', 'worked', 'hours', 'night_hours')
+
+    def __init__(self, calendar: YearCalendar, worked: np.ndarray, shift_hours: float, night_hours: float):
+        self.calendar = calendar
+        self.worked = worked
+        self.hours = worked * np.float64(shift_hours)
+        self.night_hours = worked * np.float64(night_hours)
+
+    def monthly_days(self) -> np.ndarray:
+        return self.calendar.monthly_sum(self.worked.astype(np.int64))
+
+    def monthly_hours(self) -> np.ndarray:
+        return self.calendar.monthly_sum(self.hours)
+
+    def monthly_night_hours(self) -> np.ndarray:
+        return self.calendar.monthly_sum(self.night_hours)
+
+
+class CalendarService:
+    """
+    Calendário pré-calculado por empresa e ano para escalas e mês padrão.
+    Os calendários ficam em memória no processo e são invalidados por versão
+    (compartilhada via cache do Django) sempre que os feriados mudam.
+    """
+    _calendars: Dict[Tuple[str, int], Tuple[int, YearCalendar]] = {}
+    _tables: Dict[tuple, ScheduleTable] = {}
+    _lock = threading.Lock()
+    MAX_TABLES = 1024
+
+    @staticmethod
+    def get_version(company_id: str) -> int:
+        return get_version(CALENDAR_VERSION_KEY.format(company_id=company_id))
+
+    @staticmethod
+    def invalidate(company_id: str) -> None:
+        """
+        Invalida os calendários da empresa (chamado quando feriados mudam)
+        """
+        bump_version(CALENDAR_VERSION_KEY.format(company_id=company_id))
+
+    @staticmethod
+    def _load_holidays(company_id: str, year: int):
+        rows = Holiday.objects.filter(
+            Q(date__year=year) | Q(recurring=True),
+            company_id=company_id,
+            enabled=True
+        ).values_list('date', 'recurring')
+
+        dates = set()
+        for holiday_date, recurring in rows:
+            if holiday_date.year == year:
+                dates.add(holiday_date)
+            elif recurring:
+                try:
+                    dates.add(holiday_date.replace(year=year))
+                except ValueError:
+                    # 29/02 em ano não bissexto
+                    continue
+        return sorted(dates)
+
+    @classmethod
+    def get_calendar(cls, company_id: str, year: int) -> YearCalendar:
+        """
+        Retorna o calendário do ano da empresa, construindo-o apenas uma vez por versão
+        """
+        version = cls.get_version(company_id)
+        cached = cls._calendars.get((company_id, year))
+        if cached and cached[0] == version:
+            return cached[1]
+
+        calendar = YearCalendar(company_id, year, cls._load_holidays(company_id, year))
+        with cls._lock:
+            cls._calendars[(company_id, year)] = (version, calendar)
+        return calendar
+
+    @staticmethod
+    def night_hours_per_shift(schedule: WorkSchedule) -> float:
+        """
+        Horas do turno que caem na janela noturna (22h-5h)
+        """
+        start = schedule.start_time.hour + schedule.start_time.minute / 60
+        end = start + schedule.shift_hours
+
+        total = 0.0
+        # Turnos podem atravessar a meia-noite e durar mais de 24h (ex: 24x48)
+        for day in range(-1, int(end // 24) + 2):
+            night_start = day * 24 + NIGHT_START_HOUR
+            night_end = (day + 1) * 24 + NIGHT_END_HOUR
+            total += max(0.0, min(end, night_end) - max(start, night_start))
+        return total
+
+    @staticmethod
+    def _worked_mask(schedule: WorkSchedule, calendar: YearCalendar) -> np.ndarray:
+        if schedule.schedule_type == WorkSchedule.ScheduleType.CYCLE:
+            cycle_days = (schedule.cycle_work_hours + schedule.cycle_rest_hours) // 24
+            on_days = max(1, schedule.cycle_work_hours // 24)
+            anchor = np.datetime64(schedule.cycle_start_date, 'D')
+            offset = (calendar.days - anchor).astype(np.int64) % cycle_days
+            worked = offset < on_days
+        else:
+            work_days = np.array([int(day) for day in schedule.work_days], dtype=np.int8)
+            worked = np.isin(calendar.weekday, work_days)
+
+        if not schedule.works_holidays:
+            worked = worked & ~calendar.holiday
+        return worked
+
+    @classmethod
+    def get_schedule_table(cls, schedule: WorkSchedule, year: int) -> ScheduleTable:
+        """
+        Retorna a tabela diária da escala no ano
+        """
+        calendar = cls.get_calendar(schedule.company_id, year)
+        # O calendário é recriado a cada nova versão, então sua identidade entra na chave
+        key = (schedule.pk, schedule.updated, year, id(calendar))
+        table = cls._tables.get(key)
+        if table is not None:
+            return table
+
+        on_days = 1
+        if schedule.schedule_type == WorkSchedule.ScheduleType.CYCLE:
+            on_days = max(1, schedule.cycle_work_hours // 24)
+
+        table = ScheduleTable(
+            calendar,
+            cls._worked_mask(schedule, calendar),
+            schedule.shift_hours / on_days,
+            cls.night_hours_per_shift(schedule) / on_days
+        )
+        with cls._lock:
+            if len(cls._tables) >= cls.MAX_TABLES:
+                cls._tables.clear()
+            cls._tables[key] = table
+        return table
+
+    @classmethod
+    def monthly_hours(cls, schedule: WorkSchedule, year: int) -> np.ndarray:
+        """Horas trabalhadas por mês (12 posições)"""
+        return cls.get_schedule_table(schedule, year).monthly_hours()
+
+    @classmethod
+    def month_summary(cls, schedule: WorkSchedule, year: int, month: Optional[int] = None) -> list:
+        """
+        Resumo mensal da escala: dias úteis, dias e horas trabalhadas e horas noturnas
+        """
+        table = cls.get_schedule_table(schedule, year)
+        business_days = table.calendar.monthly_sum(table.calendar.business_days.astype(np.int64))
+        holidays = table.calendar.monthly_sum(table.calendar.holiday.astype(np.int64))
+        worked_days = table.monthly_days()
+        hours = table.monthly_hours()
+        night_hours = table.monthly_night_hours()
+
+        months = [month] if month else range(1, 13)
+        return [
+            {
+                'year': year,
+                'month': m,
+                'business_days': int(business_days[m - 1]),
+                'holidays': int(holidays[m - 1]),
+                'worked_days': int(worked_days[m - 1]),
+                'hours': round(float(hours[m - 1]), 2),
+                'night_hours': round(float(night_hours[m - 1]), 2),
+            }
+            for m in months
+        ]
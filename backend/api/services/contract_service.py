@@ -0,0 +1,195 @@
+# services/contract_service.py
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from ..models.contract_model import Contract, ContractLine
+from ..models.price_snapshot_model import PriceSnapshot
+from ..models.supplies_price_list_model import SuppliesPriceList
+from ..models.tax_model import Tax
+from .pricing_service import PricingService, TIME_UNITS
+from .price_resolver_service import PriceResolverService
+
+REPRICE_BATCH_SIZE = 1000
+
+
+class ContractService:
+    """
+    Regras de negócio de contratos: preço dos itens e manutenção dos totais
+    """
+    # Origem do preço de itens com preço informado manualmente (as demais vêm do PriceResolverService)
+    SOURCE_MANUAL = 'manual'
+
+    @staticmethod
+    def line_price(line: ContractLine, base_price: Optional[Decimal] = None) -> Decimal:
+        """
+        Preço unitário calculado de um item: preço resolvido do insumo para o
+        cliente do contrato, convertido para valor mensal pela escala quando o
+        insumo é cobrado por tempo
+        """
+        if base_price is None:
+            base_price = PriceResolverService.resolve_one(
+                line.company_id, line.supply_id, line.contract.customer_id
+            ).value or Decimal('0')
+
+        start_date = line.contract.start_date
+        return PricingService.monthly_value(
+            base_price,
+            line.supply.unit_measure,
+            line.work_schedule,
+            start_date.year,
+            start_date.month
+        )
+
+    @staticmethod
+    def recalculate_totals(contract_ids: Iterable[int]) -> int:
+        """
+        Recalcula o total dos contratos a partir dos itens em um único UPDATE.
+        Usado após repricing em lote e como correção de eventuais divergências.
+        """
+        return Contract.recalculate_totals(contract_ids)
+
+    @classmethod
+    @transaction.atomic
+    def reprice_for_tax(cls, tax: Tax) -> int:
+        """
+        Recalcula em lote os itens de contratos em rascunho afetados pela alteração
+        de um imposto (contratos confirmados têm preços congelados no snapshot):
+        uma consulta de preços para todos os insumos afetados,
+        bulk_update dos itens e um único UPDATE dos totais dos contratos.
+
+        Returns:
+            int: quantidade de itens recalculados
+        """
+        supply_ids = set(
+            SuppliesPriceList.objects.filter(
+                company_id=tax.company_id,
+                tax=tax,
+                enabled=True
+            ).values_list('supply_id', flat=True)
+        )
+        if not supply_ids:
+            return 0
+
+        lines = ContractLine.objects.filter(
+            company_id=tax.company_id,
+            supply_id__in=supply_ids,
+            contract__status__in=Contract.EDITABLE_STATUSES,
+            contract__price_snapshot__isnull=True,
+            manual_price=False,
+            enabled=True
+        ).select_related('contract', 'supply', 'work_schedule')
+
+        changed = []
+        prices_by_customer = {}
+        for line in lines.iterator(chunk_size=REPRICE_BATCH_SIZE):
+            customer_id = line.contract.customer_id
+            if customer_id not in prices_by_customer:
+                prices_by_customer[customer_id] = PriceResolverService.resolve(
+                    tax.company_id, supply_ids, customer_id
+                )
+            base_price = prices_by_customer[customer_id][line.supply_id].value or Decimal('0')
+            unit_price = cls.line_price(line, base_price)
+            if unit_price != line.unit_price:
+                line.unit_price = unit_price
+                line.total_value = (line.quantity * unit_price).quantize(Decimal('0.0001'))
+                changed.append(line)
+
+        if not changed:
+            return 0
+
+        ContractLine.objects.bulk_update(
+            changed, ['unit_price', 'total_value'], batch_size=REPRICE_BATCH_SIZE
+        )
+        cls.recalculate_totals({line.contract_id for line in changed})
+        return len(changed)
+
+    @classmethod
+    def build_price_breakdown(cls, contract: Contract) -> dict:
+        """
+        Monta a composição completa de preços do contrato: itens, origem do
+        preço de cada item (manual, preço negociado do cliente ou lista de
+        preços da empresa), componentes da lista de preços, cadeia de
+        impostos e versões utilizadas
+        """
+        lines = list(
+            contract.lines.filter(enabled=True).select_related('supply', 'work_schedule')
+        )
+        supply_ids = {line.supply_id for line in lines}
+        components = PricingService.get_supply_components(contract.company_id, supply_ids)
+        customer_prices = PriceResolverService.get_customer_prices(
+            contract.company_id, contract.customer_id, supply_ids
+        )
+
+        reference = {'year': contract.start_date.year, 'month': contract.start_date.month}
+        items = []
+        for line in lines:
+            schedule = None
+            if line.work_schedule:
+                schedule = {
+                    'workschedule_id': line.work_schedule_id,
+                    'code': line.work_schedule.code,
+                    'version': line.work_schedule.updated.isoformat(),
+                }
+                if line.supply.unit_measure in TIME_UNITS:
+                    schedule['hours_per_unit'] = round(PricingService.hours_per_unit(
+                        line.supply.unit_measure, line.work_schedule,
+                        reference['year'], reference['month']
+                    ), 4)
+
+            customer_price = customer_prices.get(line.supply_id)
+            if line.manual_price:
+                price_source = cls.SOURCE_MANUAL
+            elif customer_price is not None:
+                price_source = PriceResolverService.SOURCE_CUSTOMER
+            elif line.supply_id in components:
+                price_source = PriceResolverService.SOURCE_COMPANY
+            else:
+                price_source = PriceResolverService.SOURCE_MISSING
+
+            items.append({
+                'sequence': line.sequence,
+                'supply_id': line.supply_id,
+                'supply_name': line.supply.name,
+                'unit_measure': line.supply.unit_measure,
+                'quantity': line.quantity,
+                'unit_price': line.unit_price,
+                'total_value': line.total_value,
+                'manual_price': line.manual_price,
+                'price_source': price_source,
+                'customer_price': customer_price,
+                'work_schedule': schedule,
+                'components': components.get(line.supply_id, []),
+            })
+
+        return {
+            'reference': reference,
+            'customer_id': contract.customer_id,
+            'lines': items,
+            'total_value': sum((line.total_value for line in lines), Decimal('0')),
+        }
+
+    @classmethod
+    @transaction.atomic
+    def confirm(cls, contract: Contract) -> Contract:
+        """
+        Confirma (envia) a proposta: congela a composição de preços em um
+        snapshot imutável. Leituras posteriores não consultam as tabelas de preço.
+        """
+        contract = Contract.objects.select_for_update().get(pk=contract.pk)
+        if not contract.is_editable:
+            raise ValidationError('Apenas contratos em rascunho podem ser confirmados.')
+
+        breakdown = cls.build_price_breakdown(contract)
+        if not breakdown['lines']:
+            raise ValidationError('O contrato não possui itens.')
+
+        contract.price_snapshot = PriceSnapshot.store(contract.company_id, breakdown)
+        contract.total_value = breakdown['total_value']
+        contract.status = Contract.Status.SENT
+        contract.confirmed_at = timezone.now()
+        contract.save(update_fields=['price_snapshot', 'total_value', 'status', 'confirmed_at', 'updated'])
+        return contract
@@ -0,0 +1,164 @@
+# services/depreciation_service.py
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from core.utils.bulk import bulk_update_values
+
+from ..models.asset_model import Asset
+from ..models.asset_category_model import AssetCategory
+
+REVALUE_CHUNK_SIZE = 5000
+
+REVALUE_FIELDS = (
+    'pk',
+    'purchase_value',
+    'acquisition_date',
+    'current_value',
+    'category__depreciation_method',
+    'category__useful_life_months',
+    'category__depreciation_rate',
+    'category__residual_value_percent',
+)
+
+
+class DepreciationService:
+    """
+    Depreciação do valor atual dos ativos conforme o método da categoria.
+
+    O cálculo é feito em arrays NumPy por lote de ativos (sem laço em Python
+    por ativo) e apenas os valores alterados são gravados.
+    A depreciação é mensal: conta apenas meses completos desde a aquisição.
+    """
+
+    @staticmethod
+    def elapsed_months(acquisition_dates: np.ndarray, as_of: date) -> np.ndarray:
+        """
+        Meses completos decorridos entre cada data de aquisição e `as_of`
+        (zero para aquisições futuras)
+        """
+        acquired = acquisition_dates.astype('datetime64[D]')
+        acquired_month = acquired.astype('datetime64[M]')
+        as_of_day = np.datetime64(as_of, 'D')
+
+        months = (as_of_day.astype('datetime64[M]') - acquired_month).astype(np.int64)
+        acquired_dom = (acquired - acquired_month.astype('datetime64[D]')).astype(np.int64)
+        as_of_dom = as_of.day - 1
+        months -= (as_of_dom < acquired_dom)
+        return np.clip(months, 0, None)
+
+    @classmethod
+    def compute(
+        cls,
+        purchase_values: np.ndarray,
+        acquisition_dates: np.ndarray,
+        methods: np.ndarray,
+        useful_life_months: np.ndarray,
+        rates: np.ndarray,
+        residual_percents: np.ndarray,
+        as_of: date
+    ) -> np.ndarray:
+        """
+        Valor depreciado de cada ativo, arredondado em centavos.
+
+        Linear: (compra - residual) é depreciado em partes iguais ao longo da
+        vida útil. Saldo decrescente: o valor é reduzido à taxa anual,
+        proporcionalmente aos meses decorridos, sem ficar abaixo do residual.
+        """
+        months = cls.elapsed_months(acquisition_dates, as_of).astype(np.float64)
+        residual = purchase_values * residual_percents / 100
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            straight_line = purchase_values - (purchase_values - residual) * np.minimum(
+                months / useful_life_months, 1
+            )
+        declining = np.maximum(
+            purchase_values * np.power(1 - rates / 100, months / 12),
+            residual
+        )
+
+        values = np.select(
+            [
+                methods == AssetCategory.DEPRECIATION_STRAIGHT_LINE,
+                methods == AssetCategory.DEPRECIATION_DECLINING_BALANCE,
+            ],
+            [straight_line, declining],
+            default=purchase_values
+        )
+        # Categoria sem vida útil/taxa configurada: mantém o valor de compra
+        values = np.where(np.isnan(values), purchase_values, values)
+        return np.floor(values * 100 + 0.5) / 100
+
+    @staticmethod
+    def _columns(rows: list) -> tuple:
+        pks, purchase, acquired, current, methods, lives, rates, residuals = zip(*rows)
+        as_float = lambda column: np.array(
+            [np.nan if value is None else float(value) for value in column], dtype=np.float64
+        )
+        return (
+            pks,
+            as_float(purchase),
+            np.array(acquired, dtype='datetime64[D]'),
+            as_float(current),
+            np.array(methods),
+            as_float(lives),
+            as_float(rates),
+            as_float(residuals),
+        )
+
+    @classmethod
+    def revalue(
+        cls,
+        company_id: str,
+        as_of: Optional[date] = None,
+        chunk_size: int = REVALUE_CHUNK_SIZE,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        Recalcula o valor atual de todos os ativos da empresa com categoria
+        depreciável, valor de compra e data de aquisição. Os ativos são lidos
+        por keyset em lotes de `chunk_size` e cada lote é gravado na sua
+        própria transação.
+
+        Returns:
+            dict: ativos processados e ativos com valor alterado
+        """
+        as_of = as_of or timezone.localdate()
+        queryset = Asset.objects.filter(
+            company_id=company_id,
+            enabled=True,
+            purchase_value__isnull=False,
+            acquisition_date__isnull=False,
+        ).exclude(
+            category__depreciation_method=AssetCategory.DEPRECIATION_NONE
+        ).order_by('pk')
+
+        processed = changed = 0
+        last_pk = 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk).values_list(*REVALUE_FIELDS)[:chunk_size])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            processed += len(rows)
+
+            pks, purchase, acquired, current, methods, lives, rates, residuals = cls._columns(rows)
+            values = cls.compute(purchase, acquired, methods, lives, rates, residuals, as_of)
+            dirty = np.flatnonzero(np.isnan(current) | (np.abs(values - current) >= 0.005))
+            changed += len(dirty)
+
+            if dirty.size and not dry_run:
+                dirty = dirty.tolist()
+                with transaction.atomic():
+                    bulk_update_values(
+                        Asset,
+                        'current_value',
+                        [(pks[index], Decimal(f'{values[index]:.2f}')) for index in dirty],
+                        updated=timezone.now()
+                    )
+
+        return {'processed': processed, 'changed': changed}
@@ -0,0 +1,123 @@
+# services/low_stock_service.py
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+
+from ..models.asset_model import Asset
+from ..models.low_stock_event_model import LowStockEvent
+
+FEED_DEFAULT_LIMIT = 100
+FEED_MAX_LIMIT = 1000
+
+# ativo -> (empresa, quantidade, quantidade mínima, flag gravado) antes da variação
+LowStockStates = Dict[int, Tuple[str, Decimal, Decimal, bool]]
+
+
+class LowStockService:
+    """
+    Estado de estoque baixo mantido incrementalmente.
+
+    O flag `Asset.is_low_stock` é gravado no mesmo UPDATE que altera a
+    quantidade e as transições são registradas em LowStockEvent, de onde os
+    processos de reposição leem apenas o que mudou desde o último cursor.
+    A transição compara o flag gravado, lido com a linha bloqueada antes do
+    UPDATE, com o flag que o UPDATE grava: nenhuma movimentação concorrente
+    altera o ativo entre a leitura e a gravação.
+    """
+
+    @staticmethod
+    def flag_after(delta: Decimal) -> Q:
+        """
+        Expressão do flag para um UPDATE que soma `delta` à quantidade.
+        As colunas do SET referenciam os valores anteriores da linha.
+        """
+        return Q(minimum_quantity__gte=F('quantity') + delta)
+
+    @staticmethod
+    def lock(asset_ids: Iterable[int]) -> LowStockStates:
+        """
+        Bloqueia os ativos (em ordem de id, como os UPDATEs em lote) e lê o
+        estado anterior à variação. Deve ser chamado na transação que
+        aplica a variação, antes do UPDATE.
+        """
+        return {
+            asset_id: (company_id, quantity, minimum_quantity, is_low_stock)
+            for asset_id, company_id, quantity, minimum_quantity, is_low_stock in Asset.objects.select_for_update().filter(
+                pk__in=list(asset_ids)
+            ).order_by('pk').values_list('pk', 'company_id', 'quantity', 'minimum_quantity', 'is_low_stock')
+        }
+
+    @staticmethod
+    def record_transitions(states: LowStockStates, deltas: Dict[int, Decimal]) -> int:
+        """
+        Registra as transições causadas por variações já aplicadas
+        (ativo -> variação total) a partir do estado lido por lock(), sem
+        nova leitura dos ativos
+
+        Returns:
+            int: quantidade de transições registradas
+        """
+        events = []
+        for asset_id, delta in deltas.items():
+            company_id, quantity, minimum_quantity, was_low = states[asset_id]
+            quantity += delta
+            is_low_stock = minimum_quantity >= quantity
+            if is_low_stock != was_low:
+                events.append(LowStockEvent(
+                    company_id=company_id,
+                    asset_id=asset_id,
+                    is_low_stock=is_low_stock,
+                    quantity=quantity,
+                    minimum_quantity=minimum_quantity
+                ))
+
+        LowStockEvent.objects.bulk_create(events)
+        return len(events)
+
+    @staticmethod
+    def feed(company_id: str, cursor: Optional[int] = None, limit: int = FEED_DEFAULT_LIMIT) -> dict:
+        """
+        Transições de estoque baixo posteriores ao cursor (id do último evento lido).
+
+        O id é atribuído na inserção, não no commit: um evento de uma
+        transação ainda aberta pode ter id menor que o de eventos já
+        visíveis. Por isso só são entregues eventos criados há pelo menos
+        LOW_STOCK_FEED_SETTLE_SECONDS; transações de movimentação mais longas
+        que esse atraso podem ter eventos pulados pelo cursor.
+        """
+        limit = max(1, min(limit, FEED_MAX_LIMIT))
+        settled = timezone.now() - timedelta(seconds=getattr(settings, 'LOW_STOCK_FEED_SETTLE_SECONDS', 30))
+        queryset = LowStockEvent.objects.filter(company_id=company_id, created__lte=settled)
+        if cursor:
+            queryset = queryset.filter(lowstockevent_id__gt=cursor)
+
+        events = list(
+            queryset.order_by('lowstockevent_id').values(
+                'lowstockevent_id', 'asset_id', 'asset__asset_code', 'asset__name',
+                'is_low_stock', 'quantity', 'minimum_quantity', 'created'
+            )[:limit + 1]
+        )
+        has_more = len(events) > limit
+        events = events[:limit]
+
+        return {
+            'events': [
+                {
+                    'event_id': event['lowstockevent_id'],
+                    'asset': event['asset_id'],
+                    'asset_code': event['asset__asset_code'],
+                    'asset_name': event['asset__name'],
+                    'is_low_stock': event['is_low_stock'],
+                    'quantity': event['quantity'],
+                    'minimum_quantity': event['minimum_quantity'],
+                    'created': event['created'],
+                }
+                for event in events
+            ],
+            'next_cursor': events[-1]['lowstockevent_id'] if events else cursor,
+            'has_more': has_more,
+        }
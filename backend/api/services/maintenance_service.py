@@ -0,0 +1,206 @@
+# services/maintenance_service.py
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Case, DateField, ExpressionWrapper, F, Max, OuterRef, Q, Subquery, Value, When
+from django.utils import timezone
+
+from ..models.asset_model import Asset
+from ..models.maintenance_model import MaintenancePlan, MaintenanceRecord
+from .asset_dashboard_service import AssetDashboardService
+from .asset_scan_service import AssetScanService
+
+QUEUE_DEFAULT_DAYS = 30
+QUEUE_DEFAULT_LIMIT = 100
+QUEUE_MAX_LIMIT = 1000
+QUEUE_EXCLUDED_STATUSES = ('disposed', 'sold')
+
+QUEUE_FIELDS = (
+    'asset_id', 'asset_code', 'name', 'status', 'location',
+    'category_id', 'category__name', 'next_maintenance'
+)
+
+
+class MaintenanceService:
+    """
+    Agenda de manutenção dos ativos.
+
+    A fila é lida pelo índice (empresa, next_maintenance) com paginação por
+    cursor (data, id); manutenções concluídas são aplicadas em lote, com um
+    UPDATE por plano que avança next_maintenance pelo intervalo do plano.
+    """
+
+    @staticmethod
+    def encode_cursor(due: date, asset_id: int) -> str:
+        return f'{due.isoformat()}_{asset_id}'
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[date, int]:
+        """
+        Raises:
+            ValueError: cursor inválido
+        """
+        due, asset_id = cursor.split('_', 1)
+        return date.fromisoformat(due), int(asset_id)
+
+    @classmethod
+    def queue(
+        cls,
+        company_id: str,
+        until: date,
+        cursor: Optional[str] = None,
+        limit: int = QUEUE_DEFAULT_LIMIT
+    ) -> dict:
+        """
+        Ativos com manutenção prevista até `until` (inclui as atrasadas), em
+        ordem de data, agrupados por localização dentro da página
+
+        Raises:
+            ValueError: cursor inválido
+        """
+        limit = max(1, min(limit, QUEUE_MAX_LIMIT))
+        queryset = Asset.objects.filter(
+            company_id=company_id,
+            next_maintenance__isnull=False,
+            next_maintenance__lte=until,
+            enabled=True
+        ).exclude(status__in=QUEUE_EXCLUDED_STATUSES)
+
+        if cursor:
+            due, asset_id = cls.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(next_maintenance__gt=due) | Q(next_maintenance=due, asset_id__gt=asset_id)
+            )
+
+        rows = list(queryset.order_by('next_maintenance', 'asset_id').values(*QUEUE_FIELDS)[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        today = timezone.localdate()
+        windows = {}
+        for row in rows:
+            windows.setdefault(row['location'], []).append({
+                'asset_id': row['asset_id'],
+                'asset_code': row['asset_code'],
+                'name': row['name'],
+                'status': row['status'],
+                'category': row['category_id'],
+                'category_name': row['category__name'],
+                'next_maintenance': row['next_maintenance'],
+                'overdue': row['next_maintenance'] < today,
+            })
+
+        return {
+            'until': until,
+            'windows': [
+                {'location': location, 'count': len(assets), 'assets': assets}
+                for location, assets in sorted(windows.items(), key=lambda item: item[0] or '')
+            ],
+            'next_cursor': cls.encode_cursor(rows[-1]['next_maintenance'], rows[-1]['asset_id']) if has_more else None,
+            'has_more': has_more,
+        }
+
+    @classmethod
+    def complete(
+        cls,
+        company_id: str,
+        asset_ids: Iterable[int],
+        performed_at: date,
+        user=None,
+        notes: Optional[str] = None
+    ) -> Tuple[List[MaintenanceRecord], List[int]]:
+        """
+        Registra manutenções concluídas (plano da categoria de cada ativo) e
+        avança a próxima manutenção dos ativos
+
+        Returns:
+            (registros criados, ids de ativos não encontrados)
+        """
+        asset_ids = list(dict.fromkeys(asset_ids))
+        with transaction.atomic():
+            categories = dict(
+                Asset.objects.filter(
+                    company_id=company_id,
+                    pk__in=asset_ids,
+                    enabled=True
+                ).values_list('pk', 'category_id')
+            )
+            plans = dict(
+                MaintenancePlan.objects.filter(
+                    company_id=company_id,
+                    category_id__in=set(categories.values()),
+                    enabled=True
+                ).values_list('category_id', 'pk')
+            )
+            records = MaintenanceRecord.objects.bulk_create([
+                MaintenanceRecord(
+                    company_id=company_id,
+                    asset_id=asset_id,
+                    plan_id=plans.get(categories[asset_id]),
+                    performed_at=performed_at,
+                    performed_by=user,
+                    notes=notes
+                )
+                for asset_id in asset_ids if asset_id in categories
+            ])
+            cls.roll_forward(company_id)
+
+        return records, [asset_id for asset_id in asset_ids if asset_id not in categories]
+
+    @staticmethod
+    def roll_forward(company_id: Optional[str] = None) -> int:
+        """
+        Aplica as manutenções pendentes: para cada plano, um único UPDATE
+        define next_maintenance = última manutenção + intervalo e libera os
+        ativos que estavam em manutenção; depois os registros são marcados
+        como aplicados. A última manutenção considera todos os registros do
+        ativo no plano, de modo que um registro retroativo lançado depois não
+        recua a agenda.
+
+        Returns:
+            int: quantidade de registros aplicados
+        """
+        with transaction.atomic():
+            pending = MaintenanceRecord.objects.filter(applied=False, enabled=True)
+            if company_id:
+                pending = pending.filter(company_id=company_id)
+
+            # Limita o lote aos registros existentes agora (e bloqueados):
+            # registros criados durante o processamento ficam para a próxima execução
+            locked = list(pending.select_for_update().order_by('pk').values_list('pk', flat=True))
+            if not locked:
+                return 0
+            pending = pending.filter(pk__lte=locked[-1])
+
+            now = timezone.now()
+            plans = MaintenancePlan.objects.filter(
+                pk__in=pending.values('plan_id')
+            ).values_list('pk', 'interval_days')
+            for plan_id, interval_days in plans:
+                plan_records = pending.filter(plan_id=plan_id)
+                last_performed = MaintenanceRecord.objects.filter(
+                    plan_id=plan_id,
+                    asset_id=OuterRef('pk'),
+                    enabled=True
+                ).order_by().values('asset_id').annotate(last=Max('performed_at')).values('last')
+
+                Asset.objects.filter(pk__in=plan_records.values('asset_id')).update(
+                    next_maintenance=ExpressionWrapper(
+                        Subquery(last_performed) + timedelta(days=interval_days),
+                        output_field=DateField()
+                    ),
+                    status=Case(
+                        When(status='maintenance', then=Value('available')),
+                        default=F('status')
+                    ),
+                    updated=now
+                )
+
+            company_ids = set(pending.values_list('company_id', flat=True).distinct())
+            applied = pending.update(applied=True, updated=now)
+            for affected_company_id in company_ids:
+                AssetDashboardService.invalidate(affected_company_id)
+                AssetScanService.invalidate(affected_company_id)
+
+        return applied
@@ -0,0 +1,192 @@
+# services/movement_rollup_service.py
+import calendar
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, List, Optional
+
+from django.db.models import Case, Count, DateField, F, Sum, When
+from django.db.models.functions import Coalesce, TruncMonth
+
+from ..models.asset_model import Asset
+from ..models.asset_movement_model import AssetMovement
+from ..models.movement_rollup_model import MovementRollup
+
+ROLLUP_BATCH_SIZE = 1000
+REPORT_DIMENSIONS = {
+    'asset_group': ('asset_group_id', 'asset_group__name'),
+    'location': ('location_id', 'location__name'),
+}
+
+
+class MovementRollupService:
+    """
+    Totais diários e mensais de movimentações aprovadas.
+
+    Atualizados na transação da aprovação (uma linha por combinação de
+    período, grupo, local e tipo) e reconstruídos a partir das movimentações
+    com uma agregação por período. Relatórios leem apenas os totais.
+    """
+
+    @staticmethod
+    def location_id(movement_type: str, from_location_id: Optional[int], to_location_id: Optional[int]) -> int:
+        if movement_type == AssetMovement.ENTRY:
+            return to_location_id or from_location_id
+        return from_location_id
+
+    @staticmethod
+    def periods(movement_date: date):
+        return (
+            (MovementRollup.PERIOD_DAY, movement_date),
+            (MovementRollup.PERIOD_MONTH, movement_date.replace(day=1)),
+        )
+
+    @classmethod
+    def record(cls, company_id: str, movements: Iterable[AssetMovement]) -> None:
+        """
+        Soma movimentações recém-aprovadas aos totais do dia e do mês.
+        Deve ser chamado na transação da aprovação.
+        """
+        movements = list(movements)
+        if not movements:
+            return
+
+        groups = dict(
+            Asset.objects.filter(pk__in={movement.asset_id for movement in movements}).values_list('pk', 'asset_group_id')
+        )
+        totals = defaultdict(lambda: [Decimal('0'), Decimal('0'), 0])
+        for movement in movements:
+            location_id = cls.location_id(movement.movement_type, movement.from_location_id, movement.to_location_id)
+            for period, period_start in cls.periods(movement.movement_date):
+                total = totals[(period, period_start, groups[movement.asset_id], location_id, movement.movement_type)]
+                total[0] += movement.quantity
+                total[1] += movement.total_value or Decimal('0')
+                total[2] += 1
+
+        # Garante a existência das linhas (uma consulta) e soma com F(), em ordem de chave
+        MovementRollup.objects.bulk_create(
+            [
+                MovementRollup(
+                    company_id=company_id,
+                    period=period,
+                    period_start=period_start,
+                    asset_group_id=asset_group_id,
+                    location_id=location_id,
+                    movement_type=movement_type
+                )
+                for period, period_start, asset_group_id, location_id, movement_type in totals
+            ],
+            ignore_conflicts=True
+        )
+        for (period, period_start, asset_group_id, location_id, movement_type), (quantity, value, count) in sorted(totals.items()):
+            MovementRollup.objects.filter(
+                company_id=company_id,
+                period=period,
+                period_start=period_start,
+                asset_group_id=asset_group_id,
+                location_id=location_id,
+                movement_type=movement_type
+            ).update(
+                quantity=F('quantity') + quantity,
+                total_value=F('total_value') + value,
+                movement_count=F('movement_count') + count
+            )
+
+    @staticmethod
+    def rebuild(company_id: str, start: Optional[date] = None, end: Optional[date] = None) -> int:
+        """
+        Reconstrói os totais da empresa a partir das movimentações aprovadas.
+        O intervalo é ampliado para meses completos, para que os totais
+        mensais fiquem consistentes com os diários.
+
+        Returns:
+            int: quantidade de totais gravados
+        """
+        movements = AssetMovement.objects.filter(
+            company_id=company_id,
+            status=AssetMovement.APPROVED,
+            enabled=True
+        )
+        rollups = MovementRollup.objects.filter(company_id=company_id)
+        if start:
+            start = start.replace(day=1)
+            movements = movements.filter(movement_date__gte=start)
+            rollups = rollups.filter(period_start__gte=start)
+        if end:
+            end = end.replace(day=calendar.monthrange(end.year, end.month)[1])
+            movements = movements.filter(movement_date__lte=end)
+            rollups = rollups.filter(period_start__lte=end)
+        rollups.delete()
+
+        location = Case(
+            When(movement_type=AssetMovement.ENTRY, then=Coalesce('to_location_id', 'from_location_id')),
+            default=F('from_location_id')
+        )
+        created = 0
+        for period, period_start in (
+            (MovementRollup.PERIOD_DAY, F('movement_date')),
+            (MovementRollup.PERIOD_MONTH, TruncMonth('movement_date', output_field=DateField())),
+        ):
+            rows = movements.order_by().annotate(
+                rollup_start=period_start,
+                rollup_location=location
+            ).values(
+                'rollup_start', 'asset__asset_group_id', 'rollup_location', 'movement_type'
+            ).annotate(
+                total_quantity=Sum('quantity'),
+                total=Sum('total_value'),
+                count=Count('pk')
+            )
+            created += len(MovementRollup.objects.bulk_create(
+                [
+                    MovementRollup(
+                        company_id=company_id,
+                        period=period,
+                        period_start=row['rollup_start'],
+                        asset_group_id=row['asset__asset_group_id'],
+                        location_id=row['rollup_location'],
+                        movement_type=row['movement_type'],
+                        quantity=row['total_quantity'],
+                        total_value=row['total'] or Decimal('0'),
+                        movement_count=row['count']
+                    )
+                    for row in rows.iterator(chunk_size=ROLLUP_BATCH_SIZE)
+                ],
+                batch_size=ROLLUP_BATCH_SIZE
+            ))
+
+        return created
+
+    @staticmethod
+    def report(
+        company_id: str,
+        period: str,
+        start: date,
+        end: date,
+        group_by: List[str],
+        movement_type: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Totais por período e tipo, detalhados pelas dimensões de `group_by`
+        ('asset_group', 'location'), lidos apenas da tabela de totais
+        """
+        rollups = MovementRollup.objects.filter(
+            company_id=company_id,
+            period=period,
+            period_start__range=(start, end)
+        )
+        if movement_type:
+            rollups = rollups.filter(movement_type=movement_type)
+
+        dimensions = ['period_start']
+        for name in group_by:
+            dimensions.extend(REPORT_DIMENSIONS[name])
+        dimensions.append('movement_type')
+
+        return list(
+            rollups.order_by().values(*dimensions).annotate(
+                quantity_total=Sum('quantity'),
+                value_total=Sum('total_value'),
+                movements=Sum('movement_count')
+            ).order_by(*dimensions)
+        )
@@ -0,0 +1,155 @@
+# services/price_list_service.py
+import csv
+from typing import Dict, Iterable, List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+
+from ..models.supplies_price_list_model import SuppliesPriceList
+from ..models.supply_model import Supply
+from ..models.tax_model import Tax
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_HEADERS = [
+    'Insumo',
+    'Código Insumo',
+    'Imposto',
+    'Sigla Imposto',
+    'Valor',
+    'Sequência',
+    'Data de Cadastro',
+    'Última Atualização'
+]
+REQUIRED_HEADERS = {'Código Insumo', 'Valor'}
+
+
+class PriceListImportError(ValueError):
+    """Erro de leitura do arquivo de importação da lista de preços"""
+
+
+class PriceListService:
+    """
+    Exportação e importação da lista de preços de insumos em CSV (separador
+    ";"), usadas pelo SuppliesPriceListViewSet e pelo benchmark de preços.
+    """
+
+    @staticmethod
+    def export_csv(price_lists: QuerySet, stream) -> int:
+        """
+        Escreve as linhas da lista de preços no arquivo, em streaming
+
+        Args:
+            price_lists: queryset de SuppliesPriceList já filtrado
+            stream: objeto com write() (HttpResponse, StringIO)
+
+        Returns:
+            int: quantidade de linhas exportadas
+        """
+        writer = csv.writer(stream, delimiter=';', quoting=csv.QUOTE_ALL)
+        writer.writerow(EXPORT_HEADERS)
+
+        count = 0
+        for price in price_lists.select_related('supply', 'tax').iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            writer.writerow([
+                price.supply.name,
+                price.supply.supply_id,
+                price.tax.description if price.tax else '',
+                price.tax.acronym if price.tax else '',
+                price.value,
+                price.sequence,
+                price.created.strftime('%d/%m/%Y %H:%M:%S'),
+                price.updated.strftime('%d/%m/%Y %H:%M:%S')
+            ])
+            count += 1
+        return count
+
+    @staticmethod
+    def import_row(company_id: str, row: Dict[str, str]) -> SuppliesPriceList:
+        """
+        Grava (cria ou atualiza) o preço de uma linha do arquivo, identificado
+        por insumo + imposto na empresa
+
+        Raises:
+            ValidationError: linha inválida ou insumo/imposto não encontrado
+        """
+        supply_code = row.get('Código Insumo', '').strip()
+        tax_acronym = row.get('Sigla Imposto', '').strip()
+
+        try:
+            value = float(row.get('Valor', '0').replace(',', '.'))
+        except ValueError:
+            raise ValidationError('Valor inválido')
+
+        try:
+            sequence = int(row.get('Sequência', '1'))
+        except ValueError:
+            sequence = 1
+
+        if not supply_code:
+            raise ValidationError('Código do insumo é obrigatório')
+
+        if value <= 0:
+            raise ValidationError('Valor deve ser maior que zero')
+
+        try:
+            supply = Supply.objects.get(
+                supply_id=supply_code,
+                company_id=company_id,
+                enabled=True
+            )
+        except Supply.DoesNotExist:
+            raise ValidationError(f'Insumo não encontrado: {supply_code}')
+
+        tax = None
+        if tax_acronym:
+            try:
+                tax = Tax.objects.get(
+                    acronym=tax_acronym,
+                    company_id=company_id,
+                    enabled=True
+                )
+            except Tax.DoesNotExist:
+                raise ValidationError(f'Imposto não encontrado: {tax_acronym}')
+
+        price_list, _ = SuppliesPriceList.objects.update_or_create(
+            supply=supply,
+            tax=tax,
+            company_id=company_id,
+            defaults={
+                'value': value,
+                'sequence': sequence,
+                'enabled': True
+            }
+        )
+        return price_list
+
+    @classmethod
+    def import_csv(cls, company_id: str, lines: Iterable[str]) -> Tuple[int, List[dict]]:
+        """
+        Importa a lista de preços a partir das linhas de um CSV no formato
+        da exportação. Linhas com erro não interrompem a importação.
+
+        Returns:
+            (linhas importadas, erros por linha)
+
+        Raises:
+            PriceListImportError: quando faltam cabeçalhos obrigatórios
+        """
+        reader = csv.DictReader(lines, delimiter=';')
+        headers = set(reader.fieldnames) if reader.fieldnames else set()
+        if not REQUIRED_HEADERS.issubset(headers):
+            raise PriceListImportError(f'Cabeçalhos obrigatórios faltando. Necessários: {REQUIRED_HEADERS}')
+
+        success_count = 0
+        error_rows = []
+        for row in reader:
+            try:
+                cls.import_row(company_id, row)
+                success_count += 1
+            except Exception as e:
+                error_rows.append({
+                    'row': row,
+                    'error': str(e)
+                })
+        return success_count, error_rows
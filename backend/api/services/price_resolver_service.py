@@ -0,0 +1,136 @@
+# services/price_resolver_service.py
+from decimal import Decimal
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from django.conf import settings
+
+from core.utils.cache import TTLCache, bump_version, get_version
+from ..models.customer_price_list_model import CustomerPriceList
+from .pricing_service import PricingService
+
+PRICE_VERSION_KEY = 'price_version:{company_id}'
+
+
+class ResolvedPrice(NamedTuple):
+    value: Optional[Decimal]
+    source: str
+
+
+class PriceResolverService:
+    """
+    Resolução hierárquica de preços de insumos:
+    preço negociado do cliente -> preço padrão da empresa (lista de preços) -> sem preço.
+
+    Os preços resolvidos ficam em cache no processo, por (empresa, cliente, versão
+    de preços). Qualquer alteração em listas de preço, impostos ou preços de
+    clientes incrementa a versão da empresa e invalida as entradas antigas.
+    """
+    SOURCE_CUSTOMER = 'customer'
+    SOURCE_COMPANY = 'company'
+    SOURCE_MISSING = 'missing'
+
+    _cache = TTLCache(
+        maxsize=getattr(settings, 'PRICE_CACHE_MAX_ENTRIES', 512),
+        ttl=getattr(settings, 'PRICE_CACHE_TTL', 300)
+    )
+
+    @staticmethod
+    def get_version(company_id: str) -> int:
+        return get_version(PRICE_VERSION_KEY.format(company_id=company_id))
+
+    @staticmethod
+    def invalidate(company_id: str) -> None:
+        """
+        Invalida os preços resolvidos da empresa
+        """
+        bump_version(PRICE_VERSION_KEY.format(company_id=company_id))
+
+    @classmethod
+    def _entry(cls, company_id: str, customer_id: Optional[int], version: int) -> dict:
+        key = (company_id, customer_id, version)
+        resolved = cls._cache.get(key)
+        if resolved is None:
+            resolved = {}
+            cls._cache.set(key, resolved)
+        return resolved
+
+    @classmethod
+    def resolve(
+        cls,
+        company_id: str,
+        supply_ids: Iterable[int],
+        customer_id: Optional[int] = None,
+        version: Optional[int] = None
+    ) -> Dict[int, ResolvedPrice]:
+        """
+        Resolve o preço unitário de todos os insumos informados em uma única passada.
+        Apenas os insumos ainda não resolvidos na versão atual consultam o banco
+        (no máximo uma consulta de preços do cliente e uma da lista da empresa).
+
+        Returns:
+            Dict[supply_id, ResolvedPrice]
+        """
+        supply_ids = list(dict.fromkeys(supply_ids))
+        if version is None:
+            version = cls.get_version(company_id)
+
+        resolved = cls._entry(company_id, customer_id, version)
+        missing = [supply_id for supply_id in supply_ids if supply_id not in resolved]
+
+        if missing:
+            if customer_id is None:
+                prices = PricingService.get_supply_prices(company_id, missing)
+                for supply_id in missing:
+                    price = prices.get(supply_id)
+                    resolved[supply_id] = ResolvedPrice(
+                        price, cls.SOURCE_COMPANY if price is not None else cls.SOURCE_MISSING
+                    )
+            else:
+                overrides = dict(
+                    CustomerPriceList.objects.filter(
+                        company_id=company_id,
+                        customer_id=customer_id,
+                        supply_id__in=missing,
+                        enabled=True
+                    ).values_list('supply_id', 'value')
+                )
+                remaining = [supply_id for supply_id in missing if supply_id not in overrides]
+                defaults = cls.resolve(company_id, remaining, None, version) if remaining else {}
+
+                for supply_id in missing:
+                    if supply_id in overrides:
+                        resolved[supply_id] = ResolvedPrice(overrides[supply_id], cls.SOURCE_CUSTOMER)
+                    else:
+                        resolved[supply_id] = defaults[supply_id]
+
+        return {supply_id: resolved[supply_id] for supply_id in supply_ids}
+
+    @staticmethod
+    def get_customer_prices(company_id: str, customer_id: Optional[int], supply_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Preços negociados do cliente com id e versão, lidos do banco (sem o
+        cache), usados para congelar preços em snapshots
+
+        Returns:
+            Dict[supply_id, preço negociado]
+        """
+        if customer_id is None:
+            return {}
+        rows = CustomerPriceList.objects.filter(
+            company_id=company_id,
+            customer_id=customer_id,
+            supply_id__in=list(supply_ids),
+            enabled=True
+        ).values('customerpricelist_id', 'supply_id', 'value', 'updated')
+        return {
+            row['supply_id']: {
+                'customer_price_id': row['customerpricelist_id'],
+                'value': row['value'],
+                'version': row['updated'].isoformat(),
+            }
+            for row in rows
+        }
+
+    @classmethod
+    def resolve_one(cls, company_id: str, supply_id: int, customer_id: Optional[int] = None) -> ResolvedPrice:
+        return cls.resolve(company_id, [supply_id], customer_id)[supply_id]
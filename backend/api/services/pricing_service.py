@@ -0,0 +1,186 @@
+# services/pricing_service.py
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterable, Optional
+
+from ..models.supply_model import Supply
+from ..models.supplies_price_list_model import SuppliesPriceList
+from ..models.types_model import CalcOperator
+from ..models.work_schedule_model import WorkSchedule
+from .calendar_service import CalendarService
+
+TIME_UNITS = (
+    Supply.UnitMeasure.HOUR,
+    Supply.UnitMeasure.DAY,
+    Supply.UnitMeasure.MONTH,
+    Supply.UnitMeasure.YEAR,
+)
+
+PRICE_QUANTUM = Decimal('0.0001')
+
+
+class PricingService:
+    """
+    Regras de cálculo de preços de insumos.
+
+    O preço de um insumo é a soma dos componentes da sua lista de preços
+    (SuppliesPriceList). Componentes com imposto têm o valor ajustado pelo
+    operador de cálculo do imposto.
+    """
+
+    @staticmethod
+    def apply_tax(value: Decimal, calc_operator: Optional[str], tax_value: Optional[Decimal]) -> Decimal:
+        """
+        Aplica um imposto/taxa sobre um valor conforme o operador de cálculo
+        """
+        if calc_operator is None or tax_value is None:
+            return value
+
+        if calc_operator == CalcOperator.PERCENTAGE:
+            return value * (1 + tax_value / 100)
+        if calc_operator in (CalcOperator.FIXED, CalcOperator.ADDITION):
+            return value + tax_value
+        if calc_operator == CalcOperator.SUBTRACTION:
+            return value - tax_value
+        if calc_operator == CalcOperator.MULTIPLICATION:
+            return value * tax_value
+        if calc_operator == CalcOperator.DIVISION:
+            return value / tax_value if tax_value else value
+        return value
+
+    @classmethod
+    def get_supply_prices(cls, company_id: str, supply_ids: Optional[Iterable[int]] = None) -> Dict[int, Decimal]:
+        """
+        Calcula o preço unitário dos insumos da empresa em uma única consulta
+
+        Returns:
+            Dict[supply_id, preço unitário]
+        """
+        queryset = SuppliesPriceList.objects.filter(company_id=company_id, enabled=True)
+        if supply_ids is not None:
+            queryset = queryset.filter(supply_id__in=list(supply_ids))
+
+        rows = queryset.order_by().values_list(
+            'supply_id', 'value', 'tax__calc_operator', 'tax__value', 'tax__enabled'
+        )
+
+        prices: Dict[int, Decimal] = {}
+        for supply_id, value, calc_operator, tax_value, tax_enabled in rows:
+            if not tax_enabled:
+                calc_operator = tax_value = None
+            component = cls.apply_tax(value, calc_operator, tax_value)
+            prices[supply_id] = prices.get(supply_id, Decimal('0')) + component
+
+        return {
+            supply_id: price.quantize(PRICE_QUANTUM, rounding=ROUND_HALF_UP)
+            for supply_id, price in prices.items()
+        }
+
+    @classmethod
+    def get_supply_components(cls, company_id: str, supply_ids: Iterable[int]) -> Dict[int, list]:
+        """
+        Composição detalhada do preço dos insumos (componentes, impostos e versões),
+        usada para congelar preços em snapshots
+
+        Returns:
+            Dict[supply_id, lista de componentes]
+        """
+        rows = SuppliesPriceList.objects.filter(
+            company_id=company_id,
+            enabled=True,
+            supply_id__in=list(supply_ids)
+        ).order_by('supply_id', 'sequence', 'suppliespricelist_id').values(
+            'suppliespricelist_id', 'supply_id', 'value', 'sequence', 'updated',
+            'tax_id', 'tax__acronym', 'tax__calc_operator', 'tax__value',
+            'tax__enabled', 'tax__updated'
+        )
+
+        components: Dict[int, list] = {}
+        for row in rows:
+            tax = None
+            calc_operator = tax_value = None
+            if row['tax_id'] and row['tax__enabled']:
+                calc_operator, tax_value = row['tax__calc_operator'], row['tax__value']
+                tax = {
+                    'tax_id': row['tax_id'],
+                    'acronym': row['tax__acronym'],
+                    'calc_operator': calc_operator,
+                    'value': tax_value,
+                    'version': row['tax__updated'].isoformat(),
+                }
+            components.setdefault(row['supply_id'], []).append({
+                'price_list_id': row['suppliespricelist_id'],
+                'sequence': row['sequence'],
+                'value': row['value'],
+                'version': row['updated'].isoformat(),
+                'tax': tax,
+                'amount': cls.apply_tax(row['value'], calc_operator, tax_value).quantize(
+                    PRICE_QUANTUM, rounding=ROUND_HALF_UP
+                ),
+            })
+        return components
+
+    @staticmethod
+    def hours_per_unit(unit: str, schedule: WorkSchedule, year: int, month: int) -> float:
+        """
+        Quantidade de horas trabalhadas representada por uma unidade de tempo,
+        de acordo com a escala e o calendário do mês
+        """
+        table = CalendarService.get_schedule_table(schedule, year)
+
+        if unit == Supply.UnitMeasure.HOUR:
+            return 1.0
+        if unit == Supply.UnitMeasure.DAY:
+            worked_days = int(table.monthly_days()[month - 1])
+            if not worked_days:
+                return schedule.shift_hours
+            return float(table.monthly_hours()[month - 1]) / worked_days
+        if unit == Supply.UnitMeasure.MONTH:
+            return float(table.monthly_hours()[month - 1])
+        if unit == Supply.UnitMeasure.YEAR:
+            return float(table.hours.sum())
+
+        raise ValueError(f'Unidade de medida não é de tempo: {unit}')
+
+    @classmethod
+    def convert_time_unit(
+        cls,
+        value: Decimal,
+        from_unit: str,
+        to_unit: str,
+        schedule: WorkSchedule,
+        year: int,
+        month: int
+    ) -> Decimal:
+        """
+        Converte um valor entre unidades de tempo (HR, DAY, MON, YEAR)
+        usando as horas da escala no mês informado
+
+        Ex: valor por hora de um vigilante 12x36 -> valor mensal do posto
+        """
+        if from_unit == to_unit:
+            return Decimal(value)
+
+        from_hours = cls.hours_per_unit(from_unit, schedule, year, month)
+        to_hours = cls.hours_per_unit(to_unit, schedule, year, month)
+        if not from_hours:
+            return Decimal('0')
+
+        ratio = Decimal(str(round(to_hours / from_hours, 6)))
+        return (Decimal(value) * ratio).quantize(PRICE_QUANTUM, rounding=ROUND_HALF_UP)
+
+    @classmethod
+    def monthly_value(
+        cls,
+        value: Decimal,
+        unit: str,
+        schedule: Optional[WorkSchedule],
+        year: int,
+        month: int
+    ) -> Decimal:
+        """
+        Valor mensal de um insumo. Insumos com unidade de tempo são convertidos
+        pela escala; os demais são retornados sem alteração.
+        """
+        if unit not in TIME_UNITS or schedule is None:
+            return Decimal(value)
+        return cls.convert_time_unit(value, unit, Supply.UnitMeasure.MONTH, schedule, year, month)
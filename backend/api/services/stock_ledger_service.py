@@ -0,0 +1,267 @@
+# services/stock_ledger_service.py
+import calendar
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from django.db.models import F, Sum
+
+from ..models.asset_model import Asset
+from ..models.asset_movement_model import AssetMovement
+from ..models.stock_ledger_model import StockLedgerEntry, StockBalanceSnapshot
+from .valuation_service import ValuationService
+
+SNAPSHOT_BATCH_SIZE = 1000
+
+
+class StockLedgerService:
+    """
+    Razão de estoque e saldos de fechamento.
+
+    Saldo em uma data = snapshot de fechamento mais próximo (busca pelo índice)
+    + soma dos lançamentos entre o snapshot e a data, sem reprocessar todo o
+    histórico de movimentações.
+    """
+
+    @staticmethod
+    def record(movement: AssetMovement, delta: Decimal) -> StockLedgerEntry:
+        """
+        Registra o lançamento de uma movimentação já aplicada ao estoque.
+        Deve ser chamado na mesma transação do UPDATE do ativo, que mantém a
+        linha bloqueada: o saldo lido é exatamente o resultante da movimentação.
+        """
+        balance, unit_cost = Asset.objects.filter(pk=movement.asset_id).values_list(
+            'quantity', 'average_cost'
+        ).get()
+        entry = StockLedgerEntry.objects.create(
+            company_id=movement.company_id,
+            asset_id=movement.asset_id,
+            movement=movement,
+            movement_date=movement.movement_date,
+            quantity_delta=delta,
+            balance=balance,
+            unit_cost=unit_cost
+        )
+
+        if delta:
+            # Movimentação retroativa: corrige os fechamentos já realizados
+            StockBalanceSnapshot.objects.filter(
+                asset_id=movement.asset_id,
+                snapshot_date__gte=movement.movement_date
+            ).update(balance=F('balance') + delta)
+
+        return entry
+
+    @staticmethod
+    def _record_many(company_id: str, rows: List[tuple], **fields) -> List[StockLedgerEntry]:
+        """
+        Grava em lote lançamentos já aplicados ao estoque, na ordem da lista.
+        O saldo corrente de cada lançamento é derivado do saldo final dos
+        ativos, lido em uma única consulta; o custo médio é o resultante do lote.
+
+        Args:
+            rows: tuplas (asset_id, data, variação, campos do lançamento)
+        """
+        totals = defaultdict(Decimal)
+        for asset_id, _, delta, _ in rows:
+            totals[asset_id] += delta
+
+        balances, costs = {}, {}
+        for asset_id, quantity, average_cost in Asset.objects.filter(pk__in=list(totals)).values_list(
+            'pk', 'quantity', 'average_cost'
+        ):
+            balances[asset_id] = quantity - totals[asset_id]
+            costs[asset_id] = average_cost
+
+        entries = []
+        for asset_id, movement_date, delta, extra in rows:
+            balances[asset_id] += delta
+            entries.append(StockLedgerEntry(
+                company_id=company_id,
+                asset_id=asset_id,
+                movement_date=movement_date,
+                quantity_delta=delta,
+                balance=balances[asset_id],
+                unit_cost=costs[asset_id],
+                **fields,
+                **extra
+            ))
+        StockLedgerEntry.objects.bulk_create(entries, batch_size=SNAPSHOT_BATCH_SIZE)
+
+        # Lançamentos retroativos: corrige os fechamentos já realizados
+        dated = [(asset_id, movement_date, delta) for asset_id, movement_date, delta, _ in rows if delta]
+        if dated and StockBalanceSnapshot.objects.filter(
+            asset_id__in=list(totals),
+            snapshot_date__gte=min(movement_date for _, movement_date, _ in dated)
+        ).exists():
+            by_date = defaultdict(Decimal)
+            for asset_id, movement_date, delta in dated:
+                by_date[(asset_id, movement_date)] += delta
+            for (asset_id, movement_date), delta in by_date.items():
+                StockBalanceSnapshot.objects.filter(
+                    asset_id=asset_id,
+                    snapshot_date__gte=movement_date
+                ).update(balance=F('balance') + delta)
+
+        return entries
+
+    @classmethod
+    def record_batch(cls, movements: List[AssetMovement], deltas: List[Decimal]) -> List[StockLedgerEntry]:
+        """
+        Registra em lote os lançamentos de movimentações já aplicadas ao estoque
+        (na ordem da lista)
+        """
+        if not movements:
+            return []
+        return cls._record_many(
+            movements[0].company_id,
+            [
+                (movement.asset_id, movement.movement_date, delta, {'movement': movement})
+                for movement, delta in zip(movements, deltas)
+            ]
+        )
+
+    @classmethod
+    def record_adjustments(
+        cls,
+        company_id: str,
+        entry_type: str,
+        rows: List[Tuple[int, Optional[int], Decimal, date]]
+    ) -> List[StockLedgerEntry]:
+        """
+        Registra lançamentos sem movimentação (saldo inicial ou ajuste de
+        inventário) já aplicados ao estoque do ativo e ao saldo do local
+
+        Args:
+            rows: tuplas (asset_id, location_id, variação, data)
+        """
+        return cls._record_many(
+            company_id,
+            [
+                (asset_id, on_date, delta, {'location_id': location_id})
+                for asset_id, location_id, delta, on_date in rows
+            ],
+            entry_type=entry_type
+        )
+
+    @staticmethod
+    def balance_at(asset_id: int, on_date: date) -> dict:
+        """
+        Saldo do ativo ao final do dia informado
+        """
+        snapshot = StockBalanceSnapshot.objects.filter(
+            asset_id=asset_id,
+            snapshot_date__lte=on_date
+        ).order_by('-snapshot_date').values_list('snapshot_date', 'balance').first()
+
+        entries = StockLedgerEntry.objects.filter(asset_id=asset_id)
+        if snapshot:
+            snapshot_date, balance = snapshot
+            delta = entries.filter(
+                movement_date__gt=snapshot_date,
+                movement_date__lte=on_date
+            ).aggregate(total=Sum('quantity_delta'))['total'] or Decimal('0')
+            balance += delta
+        else:
+            # Sem fechamento anterior: parte do saldo atual e desconta os lançamentos posteriores
+            snapshot_date = None
+            balance = Asset.objects.filter(pk=asset_id).values_list('quantity', flat=True).get()
+            later = entries.filter(
+                movement_date__gt=on_date
+            ).aggregate(total=Sum('quantity_delta'))['total'] or Decimal('0')
+            balance -= later
+
+        return {
+            'asset': asset_id,
+            'date': on_date,
+            'balance': balance,
+            'snapshot_date': snapshot_date,
+        }
+
+    @classmethod
+    def history(cls, asset_id: int, start: date, end: date) -> dict:
+        """
+        Extrato de estoque do ativo no período: saldo inicial, lançamentos
+        em ordem de data com saldo corrente e saldo final
+        """
+        opening = cls.balance_at(asset_id, start - timedelta(days=1))['balance']
+        rows = StockLedgerEntry.objects.filter(
+            asset_id=asset_id,
+            movement_date__range=(start, end)
+        ).order_by('movement_date', 'stockledgerentry_id').values(
+            'stockledgerentry_id', 'entry_type', 'movement_id', 'movement__movement_type',
+            'movement__document_number', 'movement_date', 'quantity_delta'
+        )
+
+        balance = opening
+        entries = []
+        for row in rows:
+            balance += row['quantity_delta']
+            entries.append({
+                'entry_id': row['stockledgerentry_id'],
+                'entry_type': row['entry_type'],
+                'movement': row['movement_id'],
+                'movement_type': row['movement__movement_type'],
+                'document_number': row['movement__document_number'],
+                'movement_date': row['movement_date'],
+                'quantity_delta': row['quantity_delta'],
+                'balance': balance,
+            })
+
+        return {
+            'asset': asset_id,
+            'start': start,
+            'end': end,
+            'opening_balance': opening,
+            'closing_balance': balance,
+            'entries': entries,
+        }
+
+    @staticmethod
+    def close_month(company_id: str, year: int, month: int) -> int:
+        """
+        Fechamento mensal: grava o saldo de todos os ativos da empresa no
+        último dia do mês. O saldo é obtido do estoque atual descontando os
+        lançamentos posteriores ao fechamento (normalmente poucos), em uma
+        consulta agregada; o custo médio é o do último lançamento até o
+        fechamento. Reexecutar o fechamento sobrescreve os saldos.
+
+        Returns:
+            int: quantidade de saldos gravados
+        """
+        snapshot_date = date(year, month, calendar.monthrange(year, month)[1])
+
+        later = dict(
+            StockLedgerEntry.objects.filter(
+                company_id=company_id,
+                movement_date__gt=snapshot_date
+            ).order_by().values('asset_id').annotate(
+                total=Sum('quantity_delta')
+            ).values_list('asset_id', 'total')
+        )
+
+        snapshots = [
+            StockBalanceSnapshot(
+                company_id=company_id,
+                asset_id=asset_id,
+                snapshot_date=snapshot_date,
+                balance=quantity - later.get(asset_id, Decimal('0')),
+                average_cost=average_cost
+            )
+            for asset_id, quantity, average_cost in Asset.objects.filter(
+                company_id=company_id,
+                enabled=True
+            ).annotate(
+                cost=ValuationService.cost_at(snapshot_date)
+            ).values_list('pk', 'quantity', 'cost').iterator(chunk_size=SNAPSHOT_BATCH_SIZE)
+        ]
+
+        StockBalanceSnapshot.objects.bulk_create(
+            snapshots,
+            batch_size=SNAPSHOT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['asset', 'snapshot_date'],
+            update_fields=['balance', 'average_cost', 'updated']
+        )
+        return len(snapshots)
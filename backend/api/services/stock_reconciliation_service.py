@@ -0,0 +1,176 @@
+# services/stock_reconciliation_service.py
+from decimal import Decimal
+from typing import Iterable, List
+
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Abs, Coalesce
+from django.utils import timezone
+
+from core.utils.bulk import bulk_update_values
+from ..models.asset_model import Asset
+from ..models.asset_movement_model import AssetMovement
+from ..models.stock_ledger_model import StockLedgerEntry
+from .asset_dashboard_service import AssetDashboardService
+from .asset_scan_service import AssetScanService
+from .asset_stock_service import AssetStockService
+from .low_stock_service import LowStockService
+from .stock_ledger_service import StockLedgerService
+
+RECONCILE_BATCH_SIZE = 1000
+REPORT_DEFAULT_LIMIT = 100
+REPORT_MAX_LIMIT = 1000
+
+QUANTITY_FIELD = DecimalField(max_digits=15, decimal_places=3)
+
+
+class StockReconciliationService:
+    """
+    Conciliação do estoque dos ativos com o histórico de movimentações.
+
+    O saldo esperado (saldo inicial do razão + entradas - saídas aprovadas)
+    é calculado pelo banco em uma única agregação agrupada por ativo e
+    comparado com a quantidade gravada na própria consulta (HAVING): apenas
+    os ativos divergentes são lidos para o Python.
+    """
+
+    @staticmethod
+    def _approved(prefix: str = 'movements__') -> Q:
+        return Q(**{f'{prefix}status': AssetMovement.APPROVED, f'{prefix}enabled': True})
+
+    @classmethod
+    def drift_queryset(cls, company_id: str, asset_ids: Iterable[int] = None):
+        """
+        Ativos da empresa cuja quantidade difere do saldo inicial mais o saldo
+        das movimentações, anotados com `opening`, `expected`, `drift`
+        (gravado - esperado) e `movement_count`
+        """
+        opening = Coalesce(
+            Subquery(
+                StockLedgerEntry.objects.filter(
+                    asset_id=OuterRef('pk'),
+                    entry_type=StockLedgerEntry.OPENING
+                ).order_by().values('asset_id').annotate(
+                    total=Sum('quantity_delta')
+                ).values('total')
+            ),
+            Value(Decimal('0')),
+            output_field=QUANTITY_FIELD
+        )
+        movements = Coalesce(
+            Sum(
+                Case(
+                    When(movements__movement_type=AssetMovement.ENTRY, then=F('movements__quantity')),
+                    When(movements__movement_type=AssetMovement.EXIT, then=-F('movements__quantity')),
+                    default=Value(Decimal('0')),
+                    output_field=QUANTITY_FIELD
+                ),
+                filter=cls._approved()
+            ),
+            Value(Decimal('0')),
+            output_field=QUANTITY_FIELD
+        )
+
+        queryset = Asset.objects.filter(company_id=company_id, enabled=True)
+        if asset_ids is not None:
+            queryset = queryset.filter(pk__in=list(asset_ids))
+
+        return queryset.order_by().annotate(
+            opening=opening,
+            expected=F('opening') + movements,
+            movement_count=Count('movements', filter=cls._approved())
+        ).exclude(
+            quantity=F('expected')
+        ).annotate(
+            drift=F('quantity') - F('expected')
+        )
+
+    @classmethod
+    def report(cls, company_id: str, limit: int = REPORT_DEFAULT_LIMIT) -> dict:
+        """
+        Relatório de divergências: totais e os `limit` ativos de maior divergência
+        """
+        limit = max(1, min(limit, REPORT_MAX_LIMIT))
+        drifted = cls.drift_queryset(company_id)
+
+        rows = drifted.annotate(abs_drift=Abs('drift')).order_by('-abs_drift', 'pk').values(
+            'asset_id', 'asset_code', 'name', 'quantity', 'opening', 'expected', 'drift', 'movement_count'
+        )[:limit]
+
+        return {
+            'checked_at': timezone.now(),
+            'checked': Asset.objects.filter(company_id=company_id, enabled=True).count(),
+            'drifted': drifted.count(),
+            'negative_expected': drifted.filter(expected__lt=0).count(),
+            'results': list(rows),
+        }
+
+    @classmethod
+    def fix(cls, company_id: str, batch_size: int = RECONCILE_BATCH_SIZE) -> int:
+        """
+        Corrige a quantidade dos ativos divergentes para o saldo esperado.
+        Cada lote bloqueia os ativos antes de recalcular o saldo
+        (movimentações em andamento concluem antes). A correção é lançada no
+        razão como ajuste e os saldos por local voltam ao saldo esperado de
+        cada local, de modo que razão, saldos por local e Asset.quantity
+        continuam consistentes. Ativos cujo saldo esperado, total ou em algum
+        local, seria negativo não são corrigidos (o histórico precisa ser
+        revisto).
+
+        Returns:
+            int: quantidade de ativos corrigidos
+        """
+        candidates = list(
+            cls.drift_queryset(company_id).filter(expected__gte=0).order_by('pk').values_list('pk', flat=True)
+        )
+        fixed = 0
+        for start in range(0, len(candidates), batch_size):
+            with transaction.atomic():
+                states = LowStockService.lock(candidates[start:start + batch_size])
+                locked = list(states)
+                rows = list(
+                    cls.drift_queryset(company_id, locked).filter(expected__gte=0).values_list(
+                        'pk', 'expected', 'drift'
+                    )
+                )
+                expected_stock = AssetStockService.expected_balances(company_id, [row[0] for row in rows])
+                refused = {asset_id for (asset_id, _), quantity in expected_stock.items() if quantity < 0}
+                rows = [row for row in rows if row[0] not in refused]
+                if not rows:
+                    continue
+
+                asset_ids = [asset_id for asset_id, _, _ in rows]
+                current_stock = AssetStockService.current_balances(asset_ids)
+                stock_deltas = {
+                    key: expected_stock.get(key, Decimal('0')) - current_stock.get(key, Decimal('0'))
+                    for key in set(expected_stock) | set(current_stock)
+                    if key[0] not in refused
+                }
+
+                bulk_update_values(
+                    Asset,
+                    'quantity',
+                    [(asset_id, expected) for asset_id, expected, _ in rows],
+                    updated=timezone.now()
+                )
+                StockLedgerService.record_adjustments(
+                    company_id,
+                    StockLedgerEntry.ADJUSTMENT,
+                    [(asset_id, None, -drift, timezone.localdate()) for asset_id, _, drift in rows]
+                )
+                # Os saldos esperados por local não são negativos: nenhuma saída é recusada
+                AssetStockService.apply(company_id, stock_deltas)
+                cls._refresh_low_stock(asset_ids)
+                LowStockService.record_transitions(states, {asset_id: -drift for asset_id, _, drift in rows})
+                fixed += len(rows)
+
+        if fixed:
+            AssetDashboardService.invalidate(company_id)
+            AssetScanService.invalidate(company_id)
+        return fixed
+
+    @staticmethod
+    def _refresh_low_stock(asset_ids: List[int]) -> None:
+        Asset.objects.filter(pk__in=asset_ids).update(
+            is_low_stock=Q(minimum_quantity__gte=F('quantity'))
+        )
@@ -0,0 +1,484 @@
+# services/stock_service.py
+from decimal import Decimal
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.utils.bulk import bulk_update_values
+
+from ..models.asset_model import Asset
+from ..models.asset_movement_model import AssetMovement
+from ..models.location_model import Location
+from ..models.stock_ledger_model import StockLedgerEntry
+from .stock_ledger_service import StockLedgerService
+from .asset_dashboard_service import AssetDashboardService
+from .asset_scan_service import AssetScanService
+from .low_stock_service import LowStockService
+from .asset_location_service import AssetLocationService
+from .asset_stock_service import AssetStockService
+from .valuation_service import ValuationService
+from .movement_rollup_service import MovementRollupService
+
+
+INSUFFICIENT_STOCK_MESSAGE = 'Quantidade insuficiente em estoque.'
+
+
+class InsufficientStockError(ValidationError):
+    """Estoque do ativo insuficiente para a movimentação"""
+
+
+class StockBatchError(ValidationError):
+    """Lote de movimentações rejeitado; `line_errors` traz os erros por linha"""
+
+    def __init__(self, line_errors: Dict[int, dict]):
+        super().__init__('Lote de movimentações rejeitado.')
+        self.line_errors = line_errors
+
+
+class StockService:
+    """
+    Aplicação de movimentações ao estoque dos ativos.
+
+    Cada alteração é um único UPDATE condicional (quantity >= n) com F(),
+    sem ler a quantidade para o Python: concorrência entre leitores de
+    código de barras não perde atualizações nem deixa o estoque negativo,
+    e apenas as colunas afetadas são gravadas. O saldo do local de origem
+    é verificado da mesma forma na linha do AssetStock. Entradas e saídas
+    bloqueiam o ativo antes do UPDATE apenas para registrar a transição de
+    estoque baixo (ver LowStockService.lock).
+    """
+
+    @staticmethod
+    def signed_quantity(movement_type: str, quantity: Decimal) -> Decimal:
+        """
+        Variação da quantidade global do ativo causada pela movimentação.
+        Transferências mudam apenas a localização.
+        """
+        if movement_type == AssetMovement.ENTRY:
+            return quantity
+        if movement_type == AssetMovement.EXIT:
+            return -quantity
+        return Decimal('0')
+
+    @staticmethod
+    def apply_delta(asset_id: int, delta: Decimal, **extra) -> bool:
+        """
+        Aplica uma variação ao estoque do ativo. Saídas só são aplicadas se
+        houver quantidade disponível (a condição é avaliada pelo banco junto
+        com o UPDATE).
+
+        Returns:
+            bool: False quando o estoque é insuficiente
+        """
+        queryset = Asset.objects.filter(pk=asset_id)
+        if delta < 0:
+            queryset = queryset.filter(quantity__gte=-delta)
+
+        return queryset.update(
+            quantity=F('quantity') + delta,
+            is_low_stock=LowStockService.flag_after(delta),
+            updated=timezone.now(),
+            **extra
+        ) == 1
+
+    @classmethod
+    def apply(
+        cls,
+        asset_id: int,
+        movement_type: str,
+        quantity: Decimal,
+        to_location: Optional[Location] = None,
+        unit_value: Optional[Decimal] = None
+    ) -> None:
+        """
+        Aplica uma movimentação ao ativo. Entradas com valor unitário
+        atualizam o custo médio no mesmo UPDATE.
+
+        Raises:
+            InsufficientStockError: quando não há quantidade disponível
+        """
+        if movement_type == AssetMovement.TRANSFER:
+            # Transferência exige a quantidade disponível, mas não altera o total
+            extra = {'location': to_location.name} if to_location is not None else {}
+            applied = Asset.objects.filter(pk=asset_id, quantity__gte=quantity).update(
+                updated=timezone.now(), **extra
+            ) == 1
+        else:
+            delta = cls.signed_quantity(movement_type, quantity)
+            extra = {}
+            if movement_type == AssetMovement.ENTRY and unit_value is not None:
+                extra['average_cost'] = ValuationService.average_cost_after(quantity, quantity * unit_value)
+            with transaction.atomic():
+                states = LowStockService.lock([asset_id])
+                applied = cls.apply_delta(asset_id, delta, **extra)
+                if applied:
+                    LowStockService.record_transitions(states, {asset_id: delta})
+
+        if not applied:
+            raise InsufficientStockError(INSUFFICIENT_STOCK_MESSAGE)
+
+    @classmethod
+    def post(cls, movement: AssetMovement) -> None:
+        """
+        Aplica ao estoque uma movimentação já gravada e registra o lançamento
+        no razão de estoque. Deve ser chamado dentro de uma transação.
+
+        Raises:
+            InsufficientStockError: quando não há quantidade disponível no
+                ativo ou no local de origem
+        """
+        cls.apply(
+            movement.asset_id,
+            movement.movement_type,
+            movement.quantity,
+            movement.to_location,
+            movement.unit_value
+        )
+        if not AssetStockService.apply(movement.company_id, AssetStockService.movement_deltas(movement)):
+            raise InsufficientStockError(INSUFFICIENT_STOCK_MESSAGE)
+        StockLedgerService.record(
+            movement, cls.signed_quantity(movement.movement_type, movement.quantity)
+        )
+        MovementRollupService.record(movement.company_id, [movement])
+        cls._record_transfers(movement.company_id, [movement])
+
+    @staticmethod
+    def record_opening(company_id: str, assets: List[Asset]) -> None:
+        """
+        Local e saldo inicial de ativos recém-criados (ainda sem saldos por
+        local nem histórico de localização). Todo ativo recebe o intervalo
+        atual no local indicado pelo campo `location`, ou no local padrão, a
+        partir da data de aquisição (se anterior a hoje). Os ativos com
+        quantidade recebem também o lançamento de saldo inicial no razão, na
+        mesma data, e o saldo nesse local. Asset.quantity já contém a
+        quantidade inicial; o valor de compra, quando informado, é o custo
+        unitário do saldo inicial e passa a ser o custo médio do ativo.
+        """
+        if not assets:
+            return
+
+        today = timezone.localdate()
+        opening_dates = {asset.pk: min(asset.acquisition_date or today, today) for asset in assets}
+        stocked = [asset for asset in assets if asset.quantity]
+        with transaction.atomic():
+            locations = AssetStockService.resolve_locations(
+                company_id, {asset.pk: asset.location for asset in assets}
+            )
+            AssetLocationService.move_many(
+                company_id,
+                {asset.pk: (locations[asset.pk], opening_dates[asset.pk]) for asset in assets},
+                notes=AssetLocationService.OPENING_NOTES
+            )
+            if not stocked:
+                return
+
+            seeded = [asset for asset in stocked if asset.purchase_value is not None and not asset.average_cost]
+            for asset in seeded:
+                asset.average_cost = Decimal(asset.purchase_value)
+            bulk_update_values(Asset, 'average_cost', [(asset.pk, asset.average_cost) for asset in seeded])
+
+            StockLedgerService.record_adjustments(
+                company_id,
+                StockLedgerEntry.OPENING,
+                [
+                    (asset.pk, locations[asset.pk], Decimal(asset.quantity), opening_dates[asset.pk])
+                    for asset in stocked
+                ]
+            )
+            AssetStockService.create_openings(
+                company_id,
+                {(asset.pk, locations[asset.pk]): Decimal(asset.quantity) for asset in stocked}
+            )
+
+    @classmethod
+    def _apply_grouped(
+        cls,
+        company_id: str,
+        items: List[Tuple[int, int, str, Decimal, Optional[int], Optional[Location], Decimal]],
+        now
+    ) -> Tuple[List[int], Dict[int, Decimal], List[int]]:
+        """
+        Aplica movimentações agrupadas por ativo: um único UPDATE condicional
+        por ativo com a variação agregada, em ordem de id (evita deadlocks
+        entre lotes concorrentes), seguido das variações agregadas por local.
+        Saídas líquidas e a maior transferência exigem saldo disponível no
+        ativo, e as saídas líquidas de cada local exigem saldo no local (um
+        savepoint desfaz o ativo cujo local não tem saldo); o custo médio
+        considera as saídas do grupo antes das entradas. Os ativos são
+        bloqueados antes dos UPDATEs e as transições de estoque baixo são
+        registradas a partir do estado lido nesse bloqueio.
+
+        Args:
+            items: tuplas (chave, asset_id, tipo, quantidade, origem, destino,
+                valor unitário)
+
+        Returns:
+            (chaves aplicadas, variação por ativo, chaves rejeitadas por
+            falta de saldo)
+        """
+        by_asset = defaultdict(list)
+        for item in items:
+            by_asset[item[1]].append(item)
+
+        applied, rejected = [], []
+        deltas = {}
+        states = LowStockService.lock(by_asset)
+        for asset_id in sorted(by_asset):
+            group = by_asset[asset_id]
+            delta = sum(
+                (cls.signed_quantity(item[2], item[3]) for item in group),
+                Decimal('0')
+            )
+            transfers = [item for item in group if item[2] == AssetMovement.TRANSFER]
+            required = max([-delta] + [item[3] for item in transfers])
+            destination = transfers[-1][5] if transfers else None
+
+            location_deltas = defaultdict(Decimal)
+            for item in group:
+                for location_id, location_delta in AssetStockService.location_deltas(
+                    item[2], item[3], item[4], item[5].pk if item[5] is not None else None
+                ):
+                    location_deltas[(asset_id, location_id)] += location_delta
+
+            extra = {'location': destination.name} if destination is not None else {}
+            entries = [item for item in group if item[2] == AssetMovement.ENTRY]
+            average_cost = ValuationService.average_cost_after(
+                sum((item[3] for item in entries), Decimal('0')),
+                sum((item[3] * item[6] for item in entries), Decimal('0')),
+                sum((item[3] for item in group if item[2] == AssetMovement.EXIT), Decimal('0'))
+            )
+            if average_cost is not None:
+                extra['average_cost'] = average_cost
+
+            queryset = Asset.objects.filter(pk=asset_id)
+            if required > 0:
+                queryset = queryset.filter(quantity__gte=required)
+
+            savepoint = transaction.savepoint()
+            if queryset.update(
+                quantity=F('quantity') + delta,
+                is_low_stock=LowStockService.flag_after(delta),
+                updated=now,
+                **extra
+            ) == 1 and AssetStockService.apply(company_id, location_deltas):
+                transaction.savepoint_commit(savepoint)
+                applied.extend(item[0] for item in group)
+                deltas[asset_id] = delta
+            else:
+                transaction.savepoint_rollback(savepoint)
+                rejected.extend(item[0] for item in group)
+
+        LowStockService.record_transitions(states, deltas)
+        return applied, deltas, rejected
+
+    @classmethod
+    def _record_applied(
+        cls,
+        company_id: str,
+        movements: List[AssetMovement],
+        deltas: Dict[int, Decimal]
+    ) -> None:
+        """
+        Efeitos derivados de movimentações aplicadas em lote: razão, totais
+        por período, localização, dashboard e leituras de código
+        """
+        StockLedgerService.record_batch(
+            movements,
+            [cls.signed_quantity(movement.movement_type, movement.quantity) for movement in movements]
+        )
+        MovementRollupService.record(company_id, movements)
+
+        cls._record_transfers(company_id, movements)
+        # bulk_create e update() não disparam sinais
+        AssetDashboardService.invalidate(company_id)
+        AssetScanService.invalidate(company_id)
+
+    @staticmethod
+    def _record_transfers(company_id: str, movements: List[AssetMovement]) -> None:
+        """
+        Histórico de localização das transferências, na data de cada
+        movimentação: a primeira de cada ativo em um único lote, as demais
+        (mais de uma transferência do mesmo ativo) em sequência
+        """
+        transfers = defaultdict(list)
+        for movement in movements:
+            if movement.movement_type == AssetMovement.TRANSFER and movement.to_location_id:
+                transfers[movement.asset_id].append((movement.to_location_id, movement.movement_date))
+
+        AssetLocationService.move_many(company_id, {asset_id: moves[0] for asset_id, moves in transfers.items()})
+        for asset_id, moves in transfers.items():
+            for location_id, day in moves[1:]:
+                AssetLocationService.move(company_id, asset_id, location_id, day)
+
+    @staticmethod
+    def _build_movements(lines: List[Tuple[int, dict]], company_id: str, user, **fields) -> List[AssetMovement]:
+        return [
+            AssetMovement(
+                company_id=company_id,
+                created_by=user,
+                total_value=(data['quantity'] * data['unit_value']).quantize(Decimal('0.01')),
+                **fields,
+                **data
+            )
+            for _, data in lines
+        ]
+
+    @classmethod
+    def post_batch(
+        cls,
+        lines: List[Tuple[int, dict]],
+        company_id: str,
+        user,
+        atomic: bool = True
+    ) -> Tuple[List[AssetMovement], Dict[int, dict]]:
+        """
+        Aplica um lote de movimentações já validadas em uma única transação.
+        Cada ativo recebe um único UPDATE com a variação agregada; as
+        movimentações e os lançamentos do razão são gravados com bulk_create.
+
+        Args:
+            lines: pares (índice da linha no lote, dados validados com objetos
+                asset/from_location/to_location)
+            atomic: True rejeita o lote inteiro se algum ativo não tiver saldo;
+                False aplica os ativos com saldo e reporta os demais
+
+        Returns:
+            (movimentações criadas, erros por índice de linha)
+
+        Raises:
+            StockBatchError: em modo atômico, quando algum ativo não tem saldo
+        """
+        with transaction.atomic():
+            now = timezone.now()
+            applied, deltas, rejected = cls._apply_grouped(
+                company_id,
+                [
+                    (
+                        index, data['asset'].pk, data['movement_type'], data['quantity'],
+                        data['from_location'].pk, data.get('to_location'), data['unit_value']
+                    )
+                    for index, data in lines
+                ],
+                now
+            )
+            errors = {index: {'quantity': [INSUFFICIENT_STOCK_MESSAGE]} for index in rejected}
+            if errors and atomic:
+                raise StockBatchError(errors)
+
+            applied = set(applied)
+            movements = AssetMovement.objects.bulk_create(cls._build_movements(
+                [(index, data) for index, data in lines if index in applied],
+                company_id,
+                user,
+                status=AssetMovement.APPROVED,
+                approved_by=user,
+                approved_at=now
+            ))
+            cls._record_applied(company_id, movements, deltas)
+
+        return movements, errors
+
+    @classmethod
+    def create_pending_batch(cls, lines: List[Tuple[int, dict]], company_id: str, user) -> List[AssetMovement]:
+        """
+        Grava um lote de movimentações pendentes de aprovação, sem efeito no estoque
+        """
+        return AssetMovement.objects.bulk_create(
+            cls._build_movements(lines, company_id, user, status=AssetMovement.PENDING)
+        )
+
+    @classmethod
+    def approve_batch(
+        cls,
+        movement_ids: List[int],
+        company_id: str,
+        user,
+        atomic: bool = True
+    ) -> Tuple[List[int], Dict[int, dict]]:
+        """
+        Aprova movimentações pendentes em lote: os efeitos no estoque são
+        aplicados com um UPDATE agregado por ativo e o status é gravado com
+        um único UPDATE, sem full_clean() por registro. As movimentações são
+        bloqueadas (select_for_update) para que não sejam aprovadas duas vezes;
+        o bloqueio vale só para a própria tabela, pois o PostgreSQL não aceita
+        FOR UPDATE no lado anulável do LEFT JOIN com o local de destino.
+
+        Returns:
+            (ids aprovados, erros por id)
+
+        Raises:
+            StockBatchError: em modo atômico, quando algum ativo não tem saldo
+        """
+        with transaction.atomic():
+            now = timezone.now()
+            movements = {
+                movement.pk: movement
+                for movement in AssetMovement.objects.select_for_update(of=('self',)).filter(
+                    company_id=company_id,
+                    pk__in=movement_ids,
+                    status=AssetMovement.PENDING,
+                    enabled=True
+                ).select_related('to_location').order_by('pk')
+            }
+            errors = {
+                movement_id: {'status': ['Movimentação não encontrada ou não está pendente.']}
+                for movement_id in movement_ids if movement_id not in movements
+            }
+            if errors and atomic:
+                raise StockBatchError(errors)
+
+            applied, deltas, rejected = cls._apply_grouped(
+                company_id,
+                [
+                    (
+                        movement.pk, movement.asset_id, movement.movement_type, movement.quantity,
+                        movement.from_location_id, movement.to_location, movement.unit_value
+                    )
+                    for movement in movements.values()
+                ],
+                now
+            )
+            errors.update({movement_id: {'quantity': [INSUFFICIENT_STOCK_MESSAGE]} for movement_id in rejected})
+            if errors and atomic:
+                raise StockBatchError(errors)
+
+            applied.sort()
+            AssetMovement.objects.filter(pk__in=applied).update(
+                status=AssetMovement.APPROVED,
+                approved_by=user,
+                approved_at=now,
+                updated_by=user,
+                updated=now
+            )
+            cls._record_applied(company_id, [movements[pk] for pk in applied], deltas)
+
+        return applied, errors
+
+    @staticmethod
+    def reject_batch(movement_ids: List[int], company_id: str, user) -> int:
+        """
+        Rejeita movimentações pendentes com um único UPDATE (sem efeito no
+        estoque). Quem decidiu e quando ficam em approved_by/approved_at,
+        como na aprovação.
+
+        Returns:
+            int: quantidade de movimentações rejeitadas
+        """
+        now = timezone.now()
+        rejected = AssetMovement.objects.filter(
+            company_id=company_id,
+            pk__in=movement_ids,
+            status=AssetMovement.PENDING,
+            enabled=True
+        ).update(
+            status=AssetMovement.REJECTED,
+            approved_by=user,
+            approved_at=now,
+            updated_by=user,
+            updated=now
+        )
+        return rejected
@@ -1,10 +1,32 @@
 # services/usersession.py
+import atexit
+import threading
+import time
 import uuid
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
+from core.utils.bulk import bulk_update_values
+from core.utils.cache import TTLCache
 from ..models.usersession_model import UserSession
-from typing import Optional
+from typing import Iterable, Optional
+
+SESSION_CACHE_KEY = 'user_session:{session_id}'
+
 
 class UserSessionService:
+    # Sessões ativas por session_id, no processo (e opcionalmente no cache do Django)
+    _sessions = TTLCache(
+        maxsize=getattr(settings, 'USER_SESSION_CACHE_MAX_ENTRIES', 2048),
+        ttl=getattr(settings, 'USER_SESSION_CACHE_TTL', 30)
+    )
+
+    # Atividade das sessões acumulada no processo (pk -> instante), gravada em lotes
+    _activity = {}
+    _activity_lock = threading.Lock()
+    _activity_flushed_at = time.monotonic()
+
     @staticmethod
     def create_session(user, token: str, refresh_token: str, request=None) -> UserSession:
         """
@@ -39,27 +61,79 @@ class UserSessionService:
             raise
 
     @staticmethod
-    def get_active_session(session_id: str) -> Optional[UserSession]:
+    def _shared_cache_enabled() -> bool:
+        return getattr(settings, 'USER_SESSION_CACHE_SHARED', False)
+
+    @classmethod
+    def get_active_session(cls, session_id: str) -> Optional[UserSession]:
         """
         Retorna uma sessão ativa pelo ID
 
+        A sessão fica em cache no processo por USER_SESSION_CACHE_TTL segundos
+        e, com USER_SESSION_CACHE_SHARED, também no cache do Django. O
+        encerramento da sessão (end_session, end_all_user_sessions, logout)
+        remove a entrada local e a compartilhada; em outros processos a
+        sessão encerrada pode ser aceita até o fim do TTL local. O cache do
+        Django só é compartilhado entre processos com CACHE_REDIS_URL: com
+        LocMemCache, USER_SESSION_CACHE_SHARED não reduz consultas entre
+        workers e a sessão encerrada vale em cada um até
+        USER_SESSION_SHARED_CACHE_TTL.
+
         Args:
             session_id: ID da sessão a ser buscada
 
         Returns:
             UserSession ou None: Sessão encontrada ou None se não existir
         """
-        try:
-            return UserSession.objects.get(
-                session_id=session_id,
-                is_active=True,
-                date_end__isnull=True
-            )
-        except UserSession.DoesNotExist:
-            return None
+        key = str(session_id)
+        session = cls._sessions.get(key)
+        if session is not None:
+            return session
 
-    @staticmethod
-    def end_all_user_sessions(user) -> None:
+        shared = cls._shared_cache_enabled()
+        if shared:
+            session = cache.get(SESSION_CACHE_KEY.format(session_id=key))
+
+        if session is None:
+            try:
+                session = UserSession.objects.get(
+                    session_id=session_id,
+                    is_active=True,
+                    date_end__isnull=True
+                )
+            except UserSession.DoesNotExist:
+                return None
+            if shared:
+                cache.set(
+                    SESSION_CACHE_KEY.format(session_id=key),
+                    session,
+                    getattr(settings, 'USER_SESSION_SHARED_CACHE_TTL', 300)
+                )
+
+        cls._sessions.set(key, session)
+        return session
+
+    @classmethod
+    def invalidate(cls, session_ids: Iterable) -> None:
+        """
+        Remove as sessões do cache (local e compartilhado)
+        """
+        keys = [str(session_id) for session_id in session_ids]
+        for key in keys:
+            cls._sessions.delete(key)
+        if keys and cls._shared_cache_enabled():
+            cache.delete_many([SESSION_CACHE_KEY.format(session_id=key) for key in keys])
+
+    @classmethod
+    def end_session(cls, session: UserSession) -> None:
+        """
+        Encerra a sessão e a remove do cache
+        """
+        session.end_session()
+        cls.invalidate([session.session_id])
+
+    @classmethod
+    def end_all_user_sessions(cls, user) -> None:
         """
         Encerra todas as sessões ativas do usuário
 
@@ -67,13 +141,87 @@ class UserSessionService:
             user: Instância do modelo User
         """
         try:
-            UserSession.objects.filter(
+            sessions = UserSession.objects.filter(
                 user=user,
                 is_active=True
-            ).update(
+            )
+            session_ids = list(sessions.values_list('session_id', flat=True))
+            sessions.update(
                 is_active=False,
                 date_end=timezone.now()
             )
+            cls.invalidate(session_ids)
         except Exception as e:
             print(f"Erro ao encerrar sessões: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    @staticmethod
+    def _activity_threshold() -> timedelta:
+        return timedelta(seconds=getattr(settings, 'USER_SESSION_ACTIVITY_THRESHOLD', 60))
+
+    @classmethod
+    def last_activity(cls, session: UserSession) -> Optional[datetime]:
+        """
+        Última atividade da sessão, incluindo a ainda não gravada no banco
+        """
+        pending = cls._activity.get(session.pk)
+        if pending and (not session.last_activity or pending > session.last_activity):
+            return pending
+        return session.last_activity
+
+    @classmethod
+    def touch(cls, session: UserSession) -> bool:
+        """
+        Registra atividade na sessão. Só há escrita quando a última atividade
+        conhecida é mais antiga que USER_SESSION_ACTIVITY_THRESHOLD; mesmo
+        assim ela é acumulada no processo e gravada em lote (apenas a coluna
+        last_activity) a cada USER_SESSION_ACTIVITY_FLUSH_INTERVAL segundos ou
+        USER_SESSION_ACTIVITY_FLUSH_SIZE sessões.
+
+        Returns:
+            bool: True se a atividade foi registrada para gravação
+        """
+        now = timezone.now()
+        last = cls.last_activity(session)
+        if last and now - last < cls._activity_threshold():
+            return False
+
+        # A instância pode estar no cache de sessões: mantém o valor atual
+        session.last_activity = now
+        with cls._activity_lock:
+            cls._activity[session.pk] = now
+            due = (
+                len(cls._activity) >= getattr(settings, 'USER_SESSION_ACTIVITY_FLUSH_SIZE', 500)
+                or time.monotonic() - cls._activity_flushed_at >= getattr(settings, 'USER_SESSION_ACTIVITY_FLUSH_INTERVAL', 30)
+            )
+        if due:
+            cls.flush_activity()
+        return True
+
+    @classmethod
+    def flush_activity(cls) -> int:
+        """
+        Grava a atividade acumulada das sessões em um UPDATE por lote
+
+        Returns:
+            int: quantidade de sessões gravadas
+        """
+        with cls._activity_lock:
+            pending, cls._activity = cls._activity, {}
+            cls._activity_flushed_at = time.monotonic()
+        if not pending:
+            return 0
+
+        try:
+            bulk_update_values(UserSession, 'last_activity', pending.items())
+        except Exception as e:
+            print(f"Erro ao gravar atividade das sessões: {str(e)}")
+            # Volta para a próxima tentativa (atividades mais novas prevalecem)
+            with cls._activity_lock:
+                for pk, moment in pending.items():
+                    cls._activity.setdefault(pk, moment)
+            return 0
+        return len(pending)
+
+
+atexit.register(UserSessionService.flush_activity)
@@ -0,0 +1,296 @@
+# services/valuation_service.py
+import heapq
+from collections import deque
+from datetime import date
+from decimal import Decimal
+from operator import itemgetter
+from typing import Iterable, Iterator, Optional, Tuple
+
+from django.db.models import (
+    Case, DecimalField, F, Func, OuterRef, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.utils.bulk import bulk_update_values
+
+from ..models.asset_model import Asset
+from ..models.asset_movement_model import AssetMovement
+from ..models.stock_ledger_model import StockLedgerEntry, StockBalanceSnapshot
+from .asset_scan_service import AssetScanService
+
+COST_FIELD = DecimalField(max_digits=15, decimal_places=4)
+VALUE_FIELD = DecimalField(max_digits=28, decimal_places=7)
+RECOMPUTE_CHUNK_SIZE = 5000
+
+
+class DecimalDivide(Func):
+    """
+    Divisão decimal em expressões de UPDATE. No SQLite os operandos decimais
+    são convertidos com CAST AS NUMERIC, que vira inteiro para valores
+    exatos (divisão inteira); o numerador é convertido para REAL.
+    """
+    arg_joiner = ' / '
+    template = '(%(expressions)s)'
+    output_field = COST_FIELD
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        numerator, denominator = self.get_source_expressions()
+        numerator_sql, numerator_params = compiler.compile(numerator)
+        denominator_sql, denominator_params = compiler.compile(denominator)
+        return (
+            f'(CAST({numerator_sql} AS REAL) / {denominator_sql})',
+            (*numerator_params, *denominator_params)
+        )
+
+
+class ValuationService:
+    """
+    Valorização do estoque.
+
+    O custo médio móvel é mantido no próprio UPDATE condicional que aplica a
+    movimentação (custo médio gravado no ativo e no lançamento do razão), de
+    modo que o valor do estoque em uma data é uma agregação sobre saldos e
+    custos já calculados. Camadas PEPS (FIFO) são calculadas sob demanda.
+    """
+    SOURCE_CURRENT = 'current'
+    SOURCE_SNAPSHOT = 'snapshot'
+    SOURCE_LEDGER = 'ledger'
+
+    @staticmethod
+    def average_cost_after(
+        entry_quantity: Decimal,
+        entry_value: Decimal,
+        exit_quantity: Decimal = Decimal('0')
+    ) -> Optional[Case]:
+        """
+        Expressão do custo médio para um UPDATE que aplica entradas
+        (quantidade e valor totais) e saídas ao ativo. As saídas saem pelo
+        custo médio anterior; sem saldo remanescente, o custo passa a ser o
+        das entradas. Sem entradas o custo não muda (retorna None).
+        """
+        if not entry_quantity:
+            return None
+
+        return Case(
+            When(
+                quantity__gt=exit_quantity,
+                then=DecimalDivide(
+                    (F('quantity') - exit_quantity) * F('average_cost') + entry_value,
+                    F('quantity') - exit_quantity + entry_quantity
+                )
+            ),
+            default=Value((entry_value / entry_quantity).quantize(Decimal('0.0001'))),
+            output_field=COST_FIELD
+        )
+
+    @staticmethod
+    def cost_at(on_date: date) -> Coalesce:
+        """
+        Custo médio do ativo (OuterRef 'pk') ao final da data: custo do último
+        lançamento até a data (o saldo inicial é o primeiro lançamento) ou
+        zero quando o ativo ainda não tinha custo
+        """
+        last_cost = StockLedgerEntry.objects.filter(
+            asset_id=OuterRef('pk'),
+            movement_date__lte=on_date,
+            unit_cost__isnull=False
+        ).order_by('-movement_date', '-stockledgerentry_id').values('unit_cost')[:1]
+        return Coalesce(Subquery(last_cost), Value(Decimal('0')), output_field=COST_FIELD)
+
+    @staticmethod
+    def _summary(rows: Iterable[Tuple[str, Decimal, Decimal]]) -> dict:
+        by_group = {}
+        total_quantity = total_value = Decimal('0')
+        for group, quantity, value in rows:
+            quantity = quantity or Decimal('0')
+            value = (value or Decimal('0')).quantize(Decimal('0.01'))
+            entry = by_group.setdefault(group, {'asset_group__name': group, 'quantity': Decimal('0'), 'value': Decimal('0')})
+            entry['quantity'] += quantity
+            entry['value'] += value
+            total_quantity += quantity
+            total_value += value
+
+        return {
+            'total_quantity': total_quantity,
+            'total_value': total_value,
+            'by_group': sorted(by_group.values(), key=lambda item: item['asset_group__name'] or ''),
+        }
+
+    @classmethod
+    def report(cls, company_id: str, on_date: Optional[date] = None) -> dict:
+        """
+        Valor do estoque da empresa ao final da data, por grupo de ativo.
+
+        Data atual: quantidade x custo médio dos ativos (uma agregação).
+        Fechamento mensal existente: saldos e custos do fechamento (uma
+        agregação). Demais datas: saldo atual descontando os lançamentos
+        posteriores e custo do último lançamento até a data.
+        """
+        today = timezone.localdate()
+        if on_date is None or on_date >= today:
+            rows = Asset.objects.filter(
+                company_id=company_id,
+                enabled=True
+            ).order_by().values('asset_group__name').annotate(
+                total_quantity=Sum('quantity'),
+                total_value=Sum(F('quantity') * F('average_cost'), output_field=VALUE_FIELD)
+            ).values_list('asset_group__name', 'total_quantity', 'total_value')
+            return {'date': on_date or today, 'source': cls.SOURCE_CURRENT, **cls._summary(rows)}
+
+        snapshots = StockBalanceSnapshot.objects.filter(company_id=company_id, snapshot_date=on_date)
+        if snapshots.exists():
+            rows = snapshots.order_by().values('asset__asset_group__name').annotate(
+                total_quantity=Sum('balance'),
+                total_value=Sum(F('balance') * F('average_cost'), output_field=VALUE_FIELD)
+            ).values_list('asset__asset_group__name', 'total_quantity', 'total_value')
+            return {'date': on_date, 'source': cls.SOURCE_SNAPSHOT, **cls._summary(rows)}
+
+        later = dict(
+            StockLedgerEntry.objects.filter(
+                company_id=company_id,
+                movement_date__gt=on_date
+            ).order_by().values('asset_id').annotate(
+                total=Sum('quantity_delta')
+            ).values_list('asset_id', 'total')
+        )
+        assets = Asset.objects.filter(
+            company_id=company_id,
+            enabled=True
+        ).annotate(cost=cls.cost_at(on_date)).values_list('pk', 'asset_group__name', 'quantity', 'cost')
+
+        def rows():
+            for asset_id, group, quantity, cost in assets.iterator(chunk_size=RECOMPUTE_CHUNK_SIZE):
+                balance = quantity - later.get(asset_id, Decimal('0'))
+                yield group, balance, balance * (cost or Decimal('0'))
+
+        return {'date': on_date, 'source': cls.SOURCE_LEDGER, **cls._summary(rows())}
+
+    @staticmethod
+    def _history(chunk_size: int = RECOMPUTE_CHUNK_SIZE, on_date: Optional[date] = None, **filters) -> Iterator[
+        Tuple[int, date, Decimal, Decimal]
+    ]:
+        """
+        Histórico de estoque em ordem de ativo e data: saldo inicial do razão
+        seguido das entradas e saídas aprovadas. Ajustes de conciliação não
+        entram: eles trazem o estoque de volta a este histórico.
+
+        Returns:
+            tuplas (ativo, data, variação, custo unitário)
+        """
+        movements = AssetMovement.objects.filter(
+            status=AssetMovement.APPROVED,
+            movement_type__in=[AssetMovement.ENTRY, AssetMovement.EXIT],
+            enabled=True,
+            **filters
+        )
+        entries = StockLedgerEntry.objects.filter(entry_type=StockLedgerEntry.OPENING, **filters)
+        if on_date is not None:
+            movements = movements.filter(movement_date__lte=on_date)
+            entries = entries.filter(movement_date__lte=on_date)
+
+        movement_rows = (
+            (
+                asset_id, movement_date, 1, pk,
+                quantity if movement_type == AssetMovement.ENTRY else -quantity, unit_value
+            )
+            for asset_id, movement_date, pk, movement_type, quantity, unit_value in movements.order_by(
+                'asset_id', 'movement_date', 'assetmovement_id'
+            ).values_list(
+                'asset_id', 'movement_date', 'assetmovement_id', 'movement_type', 'quantity', 'unit_value'
+            ).iterator(chunk_size=chunk_size)
+        )
+        entry_rows = (
+            (asset_id, movement_date, 0, pk, delta, unit_cost or Decimal('0'))
+            for asset_id, movement_date, pk, delta, unit_cost in entries.order_by(
+                'asset_id', 'movement_date', 'stockledgerentry_id'
+            ).values_list(
+                'asset_id', 'movement_date', 'stockledgerentry_id', 'quantity_delta', 'unit_cost'
+            ).iterator(chunk_size=chunk_size)
+        )
+
+        for row in heapq.merge(movement_rows, entry_rows, key=itemgetter(0, 1, 2, 3)):
+            yield row[0], row[1], row[4], row[5]
+
+    @classmethod
+    def fifo_layers(cls, asset_id: int, on_date: Optional[date] = None) -> dict:
+        """
+        Camadas PEPS do ativo ao final da data: percorre o saldo inicial e as
+        entradas e saídas aprovadas em ordem de data; cada saída consome as
+        entradas mais antigas. Saídas sem entrada correspondente são
+        informadas em `uncovered_quantity`.
+        """
+        layers = deque()
+        uncovered = Decimal('0')
+        for _, movement_date, delta, unit_cost in cls._history(on_date=on_date, asset_id=asset_id):
+            if delta > 0:
+                layers.append([movement_date, delta, unit_cost])
+                continue
+
+            remaining = -delta
+            while remaining and layers:
+                consumed = min(remaining, layers[0][1])
+                layers[0][1] -= consumed
+                remaining -= consumed
+                if not layers[0][1]:
+                    layers.popleft()
+            uncovered += remaining
+
+        quantity = sum((layer[1] for layer in layers), Decimal('0'))
+        value = sum((layer[1] * layer[2] for layer in layers), Decimal('0')).quantize(Decimal('0.01'))
+        return {
+            'asset': asset_id,
+            'date': on_date,
+            'quantity': quantity,
+            'value': value,
+            'uncovered_quantity': uncovered,
+            'layers': [
+                {'entry_date': entry_date, 'quantity': layer_quantity, 'unit_value': unit_value}
+                for entry_date, layer_quantity, unit_value in layers
+            ],
+        }
+
+    @classmethod
+    def recompute_average_costs(cls, company_id: str, chunk_size: int = RECOMPUTE_CHUNK_SIZE) -> int:
+        """
+        Recalcula o custo médio de todos os ativos da empresa a partir do
+        saldo inicial e do histórico de entradas e saídas aprovadas, com as
+        mesmas regras do custo médio mantido a cada movimentação. O histórico
+        é lido em streaming, por ativo e em ordem de data, mantendo em memória
+        apenas o ativo corrente e um lote de custos a gravar.
+
+        Returns:
+            int: quantidade de ativos recalculados
+        """
+        now = timezone.now()
+        pending = []
+        count = 0
+        current_asset, quantity, average = None, Decimal('0'), Decimal('0')
+
+        def flush():
+            bulk_update_values(Asset, 'average_cost', pending, updated=now)
+            pending.clear()
+
+        for asset_id, _, delta, unit_cost in cls._history(chunk_size, company_id=company_id):
+            if asset_id != current_asset:
+                if current_asset is not None:
+                    pending.append((current_asset, average.quantize(Decimal('0.0001'))))
+                    count += 1
+                    if len(pending) >= chunk_size:
+                        flush()
+                current_asset, quantity, average = asset_id, Decimal('0'), Decimal('0')
+
+            if delta > 0:
+                total = quantity + delta
+                average = (quantity * average + delta * unit_cost) / total
+                quantity = total
+            else:
+                quantity = max(quantity + delta, Decimal('0'))
+
+        if current_asset is not None:
+            pending.append((current_asset, average.quantize(Decimal('0.0001'))))
+            count += 1
+        flush()
+        if count:
+            AssetScanService.invalidate(company_id)
+        return count
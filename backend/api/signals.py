@@ -0,0 +1,72 @@
+# api/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .auth_custom.authentication_auth_custom import CustomJWTAuthentication
+from .models import (
+    Holiday, Tax, SuppliesPriceList, CustomerPriceList, Asset, AssetMovement, AssetGroup, AssetCategory,
+    User, Company
+)
+from .services.asset_dashboard_service import AssetDashboardService
+from .services.asset_scan_service import AssetScanService
+from .services.calendar_service import CalendarService
+from .services.contract_service import ContractService
+from .services.price_resolver_service import PriceResolverService
+from .services.stock_service import StockService
+
+
+@receiver([post_save, post_delete], sender=Holiday)
+def invalidate_company_calendar(sender, instance, **kwargs):
+    """Feriados alterados invalidam os calendários pré-calculados da empresa"""
+    CalendarService.invalidate(instance.company_id)
+
+
+@receiver([post_save, post_delete], sender=Tax)
+@receiver([post_save, post_delete], sender=SuppliesPriceList)
+@receiver([post_save, post_delete], sender=CustomerPriceList)
+def invalidate_resolved_prices(sender, instance, **kwargs):
+    """Qualquer alteração de preço ou imposto invalida os preços resolvidos da empresa"""
+    PriceResolverService.invalidate(instance.company_id)
+
+
+# Registrado após a invalidação de preços para recalcular já com a nova versão
+@receiver(post_save, sender=Tax)
+def reprice_contracts_for_tax(sender, instance, created, **kwargs):
+    """Alteração de imposto recalcula em lote os contratos em rascunho afetados"""
+    if not created:
+        ContractService.reprice_for_tax(instance)
+
+
+@receiver(post_save, sender=Asset)
+def record_asset_opening_stock(sender, instance, created, **kwargs):
+    """Ativo criado recebe o local inicial e, com quantidade, o saldo inicial no razão e no local"""
+    if created:
+        StockService.record_opening(instance.company_id, [instance])
+
+
+@receiver([post_save, post_delete], sender=Asset)
+@receiver([post_save, post_delete], sender=AssetMovement)
+def invalidate_asset_dashboard(sender, instance, **kwargs):
+    """Ativos e movimentações alterados invalidam o dashboard da empresa"""
+    AssetDashboardService.invalidate(instance.company_id)
+
+
+@receiver([post_save, post_delete], sender=Asset)
+@receiver([post_save, post_delete], sender=AssetMovement)
+@receiver([post_save, post_delete], sender=AssetGroup)
+@receiver([post_save, post_delete], sender=AssetCategory)
+def invalidate_asset_scan(sender, instance, **kwargs):
+    """Ativos, movimentações, grupos e categorias alterados invalidam as leituras de código da empresa"""
+    AssetScanService.invalidate(instance.company_id)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_authenticated_user(sender, instance, **kwargs):
+    """Usuário alterado ou desativado invalida o usuário autenticado em cache"""
+    CustomJWTAuthentication.invalidate_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_authenticated_company(sender, instance, **kwargs):
+    """Empresa alterada invalida os usuários autenticados em cache da empresa"""
+    CustomJWTAuthentication.invalidate_company(instance.company_id)
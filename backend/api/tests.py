@@ -1,3 +1,863 @@
-from django.test import TestCase
+from datetime import date, time, timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.utils.cache import bump_version, get_version
+
+from .benchmarks.stock_benchmark import OPERATIONS, THREADS, run_concurrent_movements
+from .models import (
+    Company, User, AssetGroup, AssetCategory, Asset, AssetMovement, Location, LowStockEvent,
+    Customer, Supply, SuppliesPriceList, CustomerPriceList, Contract, ContractLine, AssetCodeSequence,
+    MaintenancePlan, MaintenanceRecord, StockLedgerEntry, MovementRollup, UserSession, WorkSchedule, Holiday
+)
+from .services.asset_code_service import AssetCodeService
+from .services.asset_dashboard_service import AssetDashboardService
+from .services.asset_import_service import AssetImportService
+from .services.asset_location_service import AssetLocationService
+from .services.asset_scan_service import AssetScanService
+from .services.asset_stock_service import AssetStockService
+from .services.calendar_service import CalendarService
+from .services.contract_service import ContractService
+from .services.low_stock_service import LowStockService
+from .services.maintenance_service import MaintenanceService
+from .services.movement_rollup_service import MovementRollupService
+from .services.stock_ledger_service import StockLedgerService
+from .services.stock_reconciliation_service import StockReconciliationService
+from .services.stock_service import StockService, InsufficientStockError, StockBatchError
+from .services.usersession_service import UserSessionService
+from .services.valuation_service import ValuationService
+from .serializers.asset_serializer import AssetSerializer
+
+
+def create_stock_fixture(quantity, **fields):
+    company = Company.objects.create(company_id='STOCK', name='Estoque')
+    group = AssetGroup.objects.create(company=company, name='Grupo', code='G1')
+    category = AssetCategory.objects.create(company=company, name='Categoria', code='C1', asset_group=group)
+    asset = Asset.objects.create(
+        company=company,
+        name='Rádio',
+        asset_group=group,
+        category=category,
+        asset_code='RAD-001',
+        unit_measure='UN',
+        quantity=quantity,
+        **fields
+    )
+    return company, asset
+
+
+def create_pricing_fixture():
+    company = Company.objects.create(company_id='PRICE', name='Preços')
+    customer = Customer.objects.create(company=company, name='Cliente', celphone='0')
+    supplies = [
+        Supply.objects.create(
+            company=company, name=name, unit_measure=Supply.UnitMeasure.UNIT, type=Supply.SupplyType.MATERIAL
+        )
+        for name in ('Cimento', 'Areia')
+    ]
+    for supply in supplies:
+        SuppliesPriceList.objects.create(company=company, supply=supply, value=Decimal('10'), sequence=1)
+    return company, customer, supplies
+
+
+def movement_data(asset, movement_type, quantity, movement_date):
+    """Linha validada de lote de movimentações, saindo do local padrão"""
+    return {
+        'asset': asset,
+        'movement_type': movement_type,
+        'quantity': Decimal(quantity),
+        'unit_value': Decimal('1'),
+        'movement_date': movement_date,
+        'from_location': Location.objects.get(company_id=asset.company_id, name=settings.STOCK_DEFAULT_LOCATION_NAME),
+        'to_location': None,
+    }
+
+
+class ContractSnapshotTests(TestCase):
+    def test_snapshot_records_price_source_and_override(self):
+        company, customer, (cement, sand) = create_pricing_fixture()
+        override = CustomerPriceList.objects.create(company=company, customer=customer, supply=cement, value=Decimal('7'))
+        contract = Contract.objects.create(company=company, number='C-1', customer=customer, start_date=date(2026, 1, 1))
+        for sequence, supply, price in ((1, cement, '7'), (2, sand, '10')):
+            ContractLine.objects.create(
+                company=company, contract=contract, supply=supply, unit_price=Decimal(price), sequence=sequence
+            )
+
+        lines = ContractService.confirm(contract).price_snapshot.data['lines']
+
+        self.assertEqual([line['price_source'] for line in lines], ['customer', 'company'])
+        self.assertEqual(lines[0]['customer_price']['customer_price_id'], override.pk)
+        self.assertEqual(Decimal(lines[0]['customer_price']['value']), Decimal('7'))
+        self.assertIsNone(lines[1]['customer_price'])
+
+
+class ContractLineTotalsTests(TestCase):
+    def setUp(self):
+        self.company, customer, (self.cement, _) = create_pricing_fixture()
+        self.first, self.second = [
+            Contract.objects.create(company=self.company, number=number, customer=customer, start_date=date(2026, 1, 1))
+            for number in ('C-1', 'C-2')
+        ]
+
+    def add_line(self, quantity, unit_price):
+        return ContractLine.objects.create(
+            company=self.company, contract=self.first, supply=self.cement,
+            quantity=Decimal(quantity), unit_price=Decimal(unit_price)
+        )
+
+    def totals(self):
+        return [contract.total_value for contract in Contract.objects.order_by('number')]
+
+    def test_header_follows_line_changes(self):
+        line = self.add_line('2', '10')
+        self.add_line('1', '5')
+        self.assertEqual(self.totals(), [Decimal('25'), Decimal('0')])
+
+        line = ContractLine.objects.get(pk=line.pk)
+        line.quantity = Decimal('3')
+        line.save()
+        self.assertEqual(self.totals(), [Decimal('35'), Decimal('0')])
+
+        line.enabled = False
+        line.save()
+        self.assertEqual(self.totals(), [Decimal('5'), Decimal('0')])
+
+        line.delete()
+        self.assertEqual(self.totals(), [Decimal('5'), Decimal('0')])
+
+    def test_moved_line_leaves_previous_header(self):
+        line = self.add_line('2', '10')
+
+        line = ContractLine.objects.get(pk=line.pk)
+        line.contract = self.second
+        line.save()
+        self.assertEqual(self.totals(), [Decimal('0'), Decimal('20')])
+
+        # Sem o valor carregado, o total contado é desconhecido
+        line = ContractLine.objects.only('pk', 'quantity', 'unit_price').get(pk=line.pk)
+        line.contract = self.first
+        line.quantity = Decimal('1')
+        line.save()
+        self.assertEqual(self.totals(), [Decimal('10'), Decimal('0')])
+
+        ContractLine.objects.defer('total_value').get(pk=line.pk).delete()
+        self.assertEqual(self.totals(), [Decimal('0'), Decimal('0')])
+
+
+class QuotePricingTests(TestCase):
+    def setUp(self):
+        self.company, self.customer, (self.cement, self.sand) = create_pricing_fixture()
+        self.gravel = Supply.objects.create(
+            company=self.company, name='Brita', unit_measure=Supply.UnitMeasure.UNIT, type=Supply.SupplyType.MATERIAL
+        )
+        self.override = CustomerPriceList.objects.create(
+            company=self.company, customer=self.customer, supply=self.cement, value=Decimal('7')
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create(
+            login='orcamento', user_name='Orçamento', email='orcamento@example.com', company=self.company
+        ))
+
+    def quote(self, customer=None):
+        response = self.client.post('/api/pricing/quote/', {
+            'customer': customer,
+            'items': [{'supply': supply.pk, 'quantity': '2'} for supply in (self.cement, self.sand, self.gravel)],
+        }, format='json')
+        self.assertEqual(response.status_code, 200, response.data)
+        return [(item['price_source'], item['base_price']) for item in response.data['items']]
+
+    def test_customer_override_takes_precedence(self):
+        self.assertEqual(self.quote(self.customer.pk), [
+            ('customer', Decimal('7')), ('company', Decimal('10')), ('missing', None)
+        ])
+        self.assertEqual(self.quote(), [
+            ('company', Decimal('10')), ('company', Decimal('10')), ('missing', None)
+        ])
+
+    def test_disabled_override_falls_back_to_company_price(self):
+        self.quote(self.customer.pk)
+        self.override.enabled = False
+        self.override.save()
+
+        self.assertEqual(self.quote(self.customer.pk)[0], ('company', Decimal('10')))
+
+
+class StockServiceTests(TestCase):
+
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+
+    def test_exit_beyond_stock_is_rejected_without_changes(self):
+        with self.assertRaises(InsufficientStockError):
+            StockService.apply(self.asset.pk, AssetMovement.EXIT, Decimal('11'))
+
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('10'))
+
+    def test_entry_exit_and_transfer(self):
+        location = Location.objects.create(company=self.company, name='Depósito B', address='-')
+
+        StockService.apply(self.asset.pk, AssetMovement.ENTRY, Decimal('5'))
+        StockService.apply(self.asset.pk, AssetMovement.EXIT, Decimal('3'))
+        StockService.apply(self.asset.pk, AssetMovement.TRANSFER, Decimal('12'), location)
+
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('12'))
+        self.assertEqual(self.asset.location, 'Depósito B')
+
+        with self.assertRaises(InsufficientStockError):
+            StockService.apply(self.asset.pk, AssetMovement.TRANSFER, Decimal('13'), location)
+
+
+class StockBatchTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+        self.other = Asset.objects.create(
+            company=self.company, name='Antena', asset_group=self.asset.asset_group, category=self.asset.category,
+            asset_code='ANT-001', unit_measure='UN', quantity=Decimal('4')
+        )
+        self.user = User.objects.create(
+            login='lote', user_name='Lote', email='lote@example.com', company=self.company
+        )
+        today = timezone.localdate()
+        self.lines = [
+            (0, movement_data(self.asset, AssetMovement.EXIT, '4', today)),
+            (1, movement_data(self.other, AssetMovement.EXIT, '5', today)),
+        ]
+
+    def quantities(self):
+        return list(Asset.objects.order_by('asset_code').values_list('quantity', flat=True))
+
+    def test_insufficient_stock_rejects_whole_batch(self):
+        with self.assertRaises(StockBatchError) as raised:
+            StockService.post_batch(self.lines, self.company.company_id, self.user)
+
+        self.assertEqual(list(raised.exception.line_errors), [1])
+        self.assertEqual(self.quantities(), [Decimal('4'), Decimal('10')])
+        self.assertFalse(AssetMovement.objects.exists())
+
+    def test_non_atomic_batch_reports_rejected_lines(self):
+        movements, errors = StockService.post_batch(self.lines, self.company.company_id, self.user, atomic=False)
+
+        self.assertEqual([movement.asset_id for movement in movements], [self.asset.pk])
+        self.assertEqual(list(errors), [1])
+        self.assertEqual(self.quantities(), [Decimal('4'), Decimal('6')])
+
+
+class StockReconciliationTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+        self.user = User.objects.create(
+            login='conferente', user_name='Conferente', email='conferente@example.com', company=self.company
+        )
+        StockService.post_batch(
+            [(0, movement_data(self.asset, AssetMovement.EXIT, '3', timezone.localdate()))],
+            self.company.company_id,
+            self.user
+        )
+        # Divergência: quantidade gravada fora das movimentações
+        Asset.objects.filter(pk=self.asset.pk).update(quantity=Decimal('12'))
+
+        # Saldo esperado negativo: saída aprovada gravada sem baixa do estoque
+        self.other = Asset.objects.create(
+            company=self.company, name='Antena', asset_group=self.asset.asset_group, category=self.asset.category,
+            asset_code='ANT-001', unit_measure='UN', quantity=Decimal('2')
+        )
+        AssetMovement.objects.create(
+            company=self.company, created_by=self.user, status=AssetMovement.APPROVED,
+            **movement_data(self.other, AssetMovement.EXIT, '5', timezone.localdate())
+        )
+
+    def test_fix_restores_expected_balance(self):
+        report = StockReconciliationService.report(self.company.company_id)
+        self.assertEqual((report['drifted'], report['negative_expected']), (2, 1))
+
+        self.assertEqual(StockReconciliationService.fix(self.company.company_id), 1)
+
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('7'))
+        self.assertEqual(sum(AssetStockService.current_balances([self.asset.pk]).values()), Decimal('7'))
+        adjustment = StockLedgerEntry.objects.get(asset=self.asset, entry_type=StockLedgerEntry.ADJUSTMENT)
+        self.assertEqual((adjustment.quantity_delta, adjustment.balance), (Decimal('-5'), Decimal('7')))
+
+        # O ativo com saldo esperado negativo continua divergente
+        report = StockReconciliationService.report(self.company.company_id)
+        self.assertEqual([row['asset_id'] for row in report['results']], [self.other.pk])
+        self.assertEqual(StockReconciliationService.fix(self.company.company_id), 0)
+
+
+class MovementRollupTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+        self.user = User.objects.create(
+            login='relatorio', user_name='Relatório', email='relatorio@example.com', company=self.company
+        )
+        destination = Location.objects.create(company=self.company, name='Depósito B', address='-')
+        entry = movement_data(self.asset, AssetMovement.ENTRY, '5', date(2026, 3, 2))
+        entry['to_location'] = destination
+        lines = [
+            entry,
+            movement_data(self.asset, AssetMovement.EXIT, '2', date(2026, 3, 2)),
+            movement_data(self.asset, AssetMovement.EXIT, '1', date(2026, 3, 15)),
+            movement_data(self.asset, AssetMovement.EXIT, '4', date(2026, 4, 1)),
+        ]
+        for line in lines:
+            StockService.post_batch([(0, line)], self.company.company_id, self.user)
+
+    def rollups(self):
+        return sorted(MovementRollup.objects.values_list(
+            'period', 'period_start', 'asset_group_id', 'location_id', 'movement_type',
+            'quantity', 'total_value', 'movement_count'
+        ))
+
+    def test_rebuild_matches_recorded_totals(self):
+        recorded = self.rollups()
+        march = MovementRollup.objects.filter(
+            period=MovementRollup.PERIOD_MONTH, period_start=date(2026, 3, 1), movement_type=AssetMovement.EXIT
+        ).get()
+        self.assertEqual((march.quantity, march.movement_count), (Decimal('3'), 2))
+
+        self.assertEqual(MovementRollupService.rebuild(self.company.company_id), len(recorded))
+        self.assertEqual(self.rollups(), recorded)
+
+        # Reconstrução parcial mantém os demais meses
+        self.assertEqual(
+            MovementRollupService.rebuild(self.company.company_id, date(2026, 4, 10), date(2026, 4, 10)), 2
+        )
+        self.assertEqual(self.rollups(), recorded)
+
+
+class MovementSearchTests(TestCase):
+    def setUp(self):
+        self.company, asset = create_stock_fixture(Decimal('10'))
+        user = User.objects.create(
+            login='consulta', user_name='Consulta', email='consulta@example.com', company=self.company
+        )
+        for document_number, description in (
+            ('NF-100', 'Compra de rádios'),
+            ('NF-1001', 'Reposição'),
+            ('NF-200', 'Troca de antena'),
+            (None, 'Ajuste de antena NF-100'),
+        ):
+            AssetMovement.objects.create(
+                company=self.company, created_by=user, document_number=document_number, description=description,
+                **movement_data(asset, AssetMovement.ENTRY, '1', date(2026, 3, 2))
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def search(self, term):
+        response = self.client.get('/api/asset-movements/', {'search': term})
+        self.assertEqual(response.status_code, 200)
+        return sorted(
+            (row['document_number'] or '', row['description']) for row in response.data['results']
+        )
+
+    def test_document_prefix_and_description(self):
+        self.assertEqual(self.search('NF-100'), [
+            ('', 'Ajuste de antena NF-100'), ('NF-100', 'Compra de rádios'), ('NF-1001', 'Reposição')
+        ])
+        self.assertEqual(self.search('antena'), [('', 'Ajuste de antena NF-100'), ('NF-200', 'Troca de antena')])
+        self.assertEqual(self.search('NF-3'), [])
+
+
+class StockLedgerTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'), acquisition_date=date(2026, 1, 10))
+        self.user = User.objects.create(
+            login='estoquista', user_name='Estoquista', email='estoquista@example.com', company=self.company
+        )
+
+    def post(self, movement_type, quantity, movement_date):
+        StockService.post_batch(
+            [(0, movement_data(self.asset, movement_type, quantity, movement_date))],
+            self.company.company_id,
+            self.user
+        )
+
+    def balance_at(self, on_date):
+        result = StockLedgerService.balance_at(self.asset.pk, on_date)
+        return result['balance'], result['snapshot_date']
+
+    def test_balance_at_across_month_close(self):
+        self.post(AssetMovement.EXIT, '3', date(2026, 1, 20))
+        self.assertEqual(StockLedgerService.close_month(self.company.company_id, 2026, 1), 1)
+        self.post(AssetMovement.ENTRY, '5', date(2026, 2, 5))
+        # Lançamento retroativo corrige o fechamento já gravado
+        self.post(AssetMovement.EXIT, '2', date(2026, 1, 25))
+
+        self.assertEqual(self.balance_at(date(2026, 1, 15)), (Decimal('10'), None))
+        self.assertEqual(self.balance_at(date(2026, 1, 31)), (Decimal('5'), date(2026, 1, 31)))
+        self.assertEqual(self.balance_at(date(2026, 2, 10)), (Decimal('10'), date(2026, 1, 31)))
+
+        history = StockLedgerService.history(self.asset.pk, date(2026, 2, 1), date(2026, 2, 28))
+        self.assertEqual((history['opening_balance'], history['closing_balance']), (Decimal('5'), Decimal('10')))
+        self.assertEqual([entry['quantity_delta'] for entry in history['entries']], [Decimal('5')])
+
+
+class LowStockTransitionTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'), minimum_quantity=Decimal('5'))
+
+    def transitions(self):
+        return list(
+            LowStockEvent.objects.filter(asset=self.asset).order_by('pk').values_list('is_low_stock', 'quantity')
+        )
+
+    def test_threshold_crossings_are_recorded_once(self):
+        StockService.apply(self.asset.pk, AssetMovement.EXIT, Decimal('6'))
+        StockService.apply(self.asset.pk, AssetMovement.ENTRY, Decimal('1'))
+        StockService.apply(self.asset.pk, AssetMovement.ENTRY, Decimal('5'))
+
+        self.assertEqual(self.transitions(), [(True, Decimal('4')), (False, Decimal('10'))])
+        self.asset.refresh_from_db()
+        self.assertFalse(self.asset.is_low_stock)
+
+    def test_transition_compares_stored_flag(self):
+        # Flag gravado divergente da quantidade: a transição parte do flag, não da quantidade anterior
+        Asset.objects.filter(pk=self.asset.pk).update(is_low_stock=True)
+
+        StockService.apply(self.asset.pk, AssetMovement.ENTRY, Decimal('1'))
+
+        self.assertEqual(self.transitions(), [(False, Decimal('11'))])
+
+    def test_feed_waits_for_settle_delay(self):
+        StockService.apply(self.asset.pk, AssetMovement.EXIT, Decimal('6'))
+        company_id = self.company.company_id
+
+        self.assertEqual(LowStockService.feed(company_id)['events'], [])
+        with override_settings(LOW_STOCK_FEED_SETTLE_SECONDS=0):
+            page = LowStockService.feed(company_id)
+            self.assertEqual([event['is_low_stock'] for event in page['events']], [True])
+            self.assertEqual(LowStockService.feed(company_id, page['next_cursor'])['events'], [])
+
+
+class MovementApprovalTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+        self.user = User.objects.create(
+            login='aprovador', user_name='Aprovador', email='aprovador@example.com', company=self.company
+        )
+        self.origin = Location.objects.get(company=self.company, name=settings.STOCK_DEFAULT_LOCATION_NAME)
+        self.destination = Location.objects.create(company=self.company, name='Depósito B', address='-')
+
+    def pending(self, movement_type, quantity, to_location=None):
+        return AssetMovement.objects.create(
+            company=self.company,
+            asset=self.asset,
+            movement_type=movement_type,
+            movement_date=timezone.localdate(),
+            quantity=Decimal(quantity),
+            unit_value=Decimal('1'),
+            from_location=self.origin,
+            to_location=to_location,
+            created_by=self.user
+        ).pk
+
+    def test_approve_batch_applies_movements(self):
+        ids = [self.pending(AssetMovement.ENTRY, '5'), self.pending(AssetMovement.TRANSFER, '4', self.destination)]
+
+        approved, errors = StockService.approve_batch(ids, self.company.company_id, self.user)
+
+        self.assertEqual((approved, errors), (sorted(ids), {}))
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('15'))
+        self.assertEqual(self.asset.location, 'Depósito B')
+        self.assertFalse(
+            AssetMovement.objects.filter(pk__in=ids).exclude(
+                status=AssetMovement.APPROVED, approved_by=self.user
+            ).exists()
+        )
+
+    def test_atomic_approve_batch_rejects_without_changes(self):
+        ids = [self.pending(AssetMovement.ENTRY, '5'), self.pending(AssetMovement.EXIT, '16')]
+
+        with self.assertRaises(StockBatchError) as raised:
+            StockService.approve_batch(ids, self.company.company_id, self.user)
+
+        self.assertIn(ids[1], raised.exception.line_errors)
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('10'))
+        self.assertEqual(
+            AssetMovement.objects.filter(pk__in=ids, status=AssetMovement.PENDING).count(), 2
+        )
+
+    def test_reject_batch_records_decision(self):
+        movement_id = self.pending(AssetMovement.EXIT, '3')
+
+        self.assertEqual(StockService.reject_batch([movement_id], self.company.company_id, self.user), 1)
+        self.assertEqual(StockService.approve_batch([movement_id], self.company.company_id, self.user, atomic=False)[0], [])
+
+        movement = AssetMovement.objects.get(pk=movement_id)
+        self.assertEqual((movement.status, movement.approved_by), (AssetMovement.REJECTED, self.user))
+        self.assertIsNotNone(movement.approved_at)
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.quantity, Decimal('10'))
+
+
+class AssetLocationServiceTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'), acquisition_date=date(2026, 1, 10))
+        self.origin = Location.objects.get(company=self.company, name=settings.STOCK_DEFAULT_LOCATION_NAME)
+        self.destination = Location.objects.create(company=self.company, name='Depósito B', address='-')
+
+    def location_at(self, day):
+        row = AssetLocationService.location_at(self.asset.pk, AssetLocationService.start_of(day))
+        return row and row['location']
+
+    def test_asset_never_transferred_is_at_opening_location(self):
+        self.assertIsNone(self.location_at(date(2026, 1, 9)))
+        self.assertEqual(self.location_at(date(2026, 1, 10)), self.origin.pk)
+        self.assertEqual(
+            AssetLocationService.location_at(self.asset.pk, timezone.now())['location'], self.origin.pk
+        )
+
+    def test_transfers_start_at_movement_date(self):
+        company_id = self.company.company_id
+        AssetLocationService.move(company_id, self.asset.pk, self.destination.pk, date(2026, 3, 1))
+        # Retroativa: fica entre o local inicial e a transferência de março
+        AssetLocationService.move(company_id, self.asset.pk, self.destination.pk, date(2026, 2, 1))
+        AssetLocationService.move(company_id, self.asset.pk, self.origin.pk, date(2026, 2, 15))
+
+        self.assertEqual(self.location_at(date(2026, 1, 31)), self.origin.pk)
+        self.assertEqual(self.location_at(date(2026, 2, 1)), self.destination.pk)
+        self.assertEqual(self.location_at(date(2026, 2, 20)), self.origin.pk)
+        self.assertEqual(self.location_at(date(2026, 3, 2)), self.destination.pk)
+        current = [row for row in AssetLocationService.history(self.asset.pk) if row['current']]
+        self.assertEqual([row['location'] for row in current], [self.destination.pk])
+
+
+class AssetCodeAllocationTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('1'))
+        AssetCodeService._blocks.clear()
+
+    def create_asset(self, name):
+        serializer = AssetSerializer(data={
+            'name': name, 'asset_group': self.asset.asset_group_id, 'category': self.asset.category_id,
+            'unit_measure': 'UN', 'quantity': '1'
+        })
+        serializer.is_valid(raise_exception=True)
+        return serializer.save(company=self.company).asset_code
+
+    def test_new_sequence_starts_after_existing_codes(self):
+        Asset.objects.create(
+            company=self.company, name='Manual', asset_group=self.asset.asset_group,
+            category=self.asset.category, asset_code='at000007', unit_measure='UN'
+        )
+        self.assertEqual(self.create_asset('Primeiro'), 'AT000008')
+
+    def test_collision_retries_with_new_block(self):
+        AssetCodeSequence.objects.create(company=self.company, block_size=5)
+        self.assertEqual(self.create_asset('Primeiro'), 'AT000001')
+        Asset.objects.create(
+            company=self.company, name='Manual', asset_group=self.asset.asset_group,
+            category=self.asset.category, asset_code='AT000002', unit_measure='UN'
+        )
+
+        self.assertEqual(self.create_asset('Segundo'), 'AT000006')
+        self.assertEqual(self.create_asset('Terceiro'), 'AT000007')
+        self.assertEqual(AssetCodeSequence.objects.get(company=self.company).next_value, 11)
+
+
+class AssetImportTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('1'))
+        # Blocos de códigos ficam em memória no processo, entre os testes
+        AssetCodeService._blocks.clear()
+
+    def import_rows(self, count):
+        return AssetImportService.import_rows(self.company.company_id, [
+            {'Nome': f'Ativo {index}', 'Grupo': 'G1', 'Categoria': 'C1', 'Unidade de Medida': 'UN', 'Quantidade': '2'}
+            for index in range(count)
+        ])
+
+    def test_failed_chunk_releases_reserved_codes(self):
+        AssetCodeSequence.objects.create(company=self.company, block_size=5)
+        Asset.objects.create(
+            company=self.company, name='Manual', asset_group=self.asset.asset_group,
+            category=self.asset.category, asset_code='AT000002', unit_measure='UN'
+        )
+
+        result = self.import_rows(2)
+
+        self.assertEqual(result['created'], 0)
+        self.assertIn('Lote não importado', result['errors'][0]['error'])
+        self.assertEqual(AssetCodeSequence.objects.get(company=self.company).next_value, 1)
+
+        self.assertEqual(self.import_rows(1)['created'], 1)
+        self.assertTrue(Asset.objects.filter(company=self.company, asset_code='AT000001', quantity=2).exists())
+        self.assertEqual(AssetCodeSequence.objects.get(company=self.company).next_value, 6)
+
+
+class AssetScanTests(TestCase):
+    def setUp(self):
+        AssetScanService._cache.clear()
+        self.company, self.asset = create_stock_fixture(Decimal('10'), patrimony_code='PAT-77')
+        self.user = User.objects.create(
+            login='leitor', user_name='Leitor', email='leitor@example.com', company=self.company
+        )
+
+    def lookup(self, code):
+        return AssetScanService.lookup(self.company.company_id, code, lambda asset: AssetSerializer(asset).data)
+
+    def test_cached_lookup_skips_database(self):
+        data, field = self.lookup(' pat-77 ')
+        self.assertEqual((data['asset_id'], data['category_name'], field), (self.asset.pk, 'Categoria', 'patrimony_code'))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.lookup('PAT-77'), (data, 'patrimony_code'))
+        self.assertIsNone(self.lookup('PAT-78'))
+
+    def test_changes_invalidate_cached_lookup(self):
+        self.lookup('RAD-001')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.category.name = 'Rádios'
+            self.asset.category.save()
+        self.assertEqual(self.lookup('RAD-001')[0]['category_name'], 'Rádios')
+
+        # A aprovação grava o estoque com update(), sem sinais do ativo
+        movement = AssetMovement.objects.create(
+            company=self.company,
+            asset=self.asset,
+            movement_type=AssetMovement.ENTRY,
+            movement_date=timezone.localdate(),
+            quantity=Decimal('5'),
+            unit_value=Decimal('1'),
+            from_location=Location.objects.get(company=self.company, name=settings.STOCK_DEFAULT_LOCATION_NAME),
+            created_by=self.user
+        )
+        self.assertEqual(Decimal(self.lookup('RAD-001')[0]['quantity']), Decimal('10'))
+        with self.captureOnCommitCallbacks(execute=True):
+            StockService.approve_batch([movement.pk], self.company.company_id, self.user)
+        self.assertEqual(Decimal(self.lookup('RAD-001')[0]['quantity']), Decimal('15'))
+
+
+class MaintenanceRollForwardTests(TestCase):
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('1'), status='maintenance')
+        MaintenancePlan.objects.create(
+            company=self.company, category=self.asset.category, name='Revisão', interval_days=30
+        )
+
+    def complete(self, performed_at):
+        MaintenanceService.complete(self.company.company_id, [self.asset.pk], performed_at)
+        self.asset.refresh_from_db()
+        return self.asset.next_maintenance
+
+    def test_late_older_record_does_not_move_schedule_back(self):
+        self.assertEqual(self.complete(date(2026, 3, 1)), date(2026, 3, 31))
+        self.assertEqual(self.asset.status, 'available')
+
+        self.assertEqual(self.complete(date(2026, 2, 1)), date(2026, 3, 31))
+        self.assertEqual(self.complete(date(2026, 4, 1)), date(2026, 5, 1))
+        self.assertFalse(MaintenanceRecord.objects.filter(applied=False).exists())
+
+
+class ValuationServiceTests(TestCase):
+    """
+    Custo médio mantido a cada movimentação x recálculo em lote e camadas
+    PEPS, a partir do saldo inicial valorizado pelo valor de compra
+    """
+
+    def setUp(self):
+        self.company, self.asset = create_stock_fixture(Decimal('10'), purchase_value=Decimal('8'))
+        self.user = User.objects.create(
+            login='estoque', user_name='Estoque', email='estoque@example.com', company=self.company
+        )
+        # Saldo inicial lançado no local padrão (o ativo não informa local)
+        self.location = Location.objects.get(company=self.company, name=settings.STOCK_DEFAULT_LOCATION_NAME)
+
+    def post(self, movement_type, quantity, unit_value):
+        movement = AssetMovement.objects.create(
+            company=self.company,
+            asset=self.asset,
+            movement_type=movement_type,
+            movement_date=timezone.localdate(),
+            quantity=Decimal(quantity),
+            unit_value=Decimal(unit_value),
+            from_location=self.location,
+            status=AssetMovement.APPROVED,
+            created_by=self.user
+        )
+        StockService.post(movement)
+
+    def test_batch_recompute_matches_incremental_average(self):
+        self.post(AssetMovement.ENTRY, '5', '20')
+        self.post(AssetMovement.EXIT, '6', '0')
+        self.post(AssetMovement.ENTRY, '3', '3')
+
+        self.asset.refresh_from_db()
+        incremental = self.asset.average_cost
+        self.assertEqual(incremental, Decimal('9.75'))
+
+        Asset.objects.filter(pk=self.asset.pk).update(average_cost=0)
+        ValuationService.recompute_average_costs(self.company.company_id)
+        self.asset.refresh_from_db()
+        self.assertEqual(self.asset.average_cost, incremental)
+
+        layers = ValuationService.fifo_layers(self.asset.pk)
+        self.assertEqual(layers['quantity'] + layers['uncovered_quantity'], self.asset.quantity)
+        self.assertEqual(layers['value'], Decimal('141.00'))
+
+    def test_cost_before_opening_is_zero(self):
+        yesterday = timezone.localdate() - timedelta(days=1)
+        cost = Asset.objects.filter(pk=self.asset.pk).annotate(
+            cost=ValuationService.cost_at(yesterday)
+        ).values_list('cost', flat=True).get()
+        self.assertEqual(cost, Decimal('0'))
+
+
+@override_settings(USER_SESSION_ACTIVITY_FLUSH_SIZE=2, USER_SESSION_ACTIVITY_FLUSH_INTERVAL=3600)
+class SessionActivityTests(TestCase):
+    def setUp(self):
+        UserSessionService._activity.clear()
+        company = Company.objects.create(company_id='SESSION', name='Sessões')
+        self.user = User.objects.create(login='sessao', user_name='Sessão', email='sessao@example.com', company=company)
+        for index in range(2):
+            UserSessionService.create_session(self.user, f'token-{index}', 'refresh')
+        # last_activity é auto_now: update() grava uma atividade antiga
+        UserSession.objects.update(last_activity=timezone.now() - timedelta(hours=1))
+        self.sessions = list(UserSession.objects.order_by('pk'))
+
+    def stored_activity(self):
+        return dict(UserSession.objects.values_list('pk', 'last_activity'))
+
+    def test_activity_is_coalesced_and_flushed_in_batch(self):
+        first, second = self.sessions
+        before = self.stored_activity()
+
+        self.assertTrue(UserSessionService.touch(first))
+        self.assertFalse(UserSessionService.touch(first))
+        self.assertEqual(self.stored_activity(), before)
+        self.assertEqual(UserSessionService.last_activity(first), first.last_activity)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(UserSessionService.touch(second))
+        self.assertEqual(UserSessionService._activity, {})
+        stored = self.stored_activity()
+        self.assertEqual((stored[first.pk], stored[second.pk]), (first.last_activity, second.last_activity))
+
+
+@override_settings(USER_SESSION_CACHE_SHARED=True)
+class SessionCacheTests(TestCase):
+    def setUp(self):
+        UserSessionService._sessions.clear()
+        caches['default'].clear()
+        company = Company.objects.create(company_id='SESSION', name='Sessões')
+        self.user = User.objects.create(login='sessao', user_name='Sessão', email='sessao@example.com', company=company)
+        self.sessions = [
+            UserSessionService.create_session(self.user, f'token-{index}', 'refresh') for index in range(2)
+        ]
+
+    def test_cached_session_skips_database(self):
+        session_id = self.sessions[0].session_id
+        self.assertEqual(UserSessionService.get_active_session(session_id), self.sessions[0])
+        with self.assertNumQueries(0):
+            self.assertEqual(UserSessionService.get_active_session(session_id), self.sessions[0])
+
+        # Outro processo: cache local vazio, sessão no cache compartilhado
+        UserSessionService._sessions.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(UserSessionService.get_active_session(session_id), self.sessions[0])
+
+    def test_ended_sessions_are_invalidated(self):
+        first, second = [session.session_id for session in self.sessions]
+        for session_id in (first, second):
+            UserSessionService.get_active_session(session_id)
+
+        UserSessionService.end_session(UserSessionService.get_active_session(first))
+        self.assertIsNone(UserSessionService.get_active_session(first))
+        self.assertIsNotNone(UserSessionService.get_active_session(second))
+
+        UserSessionService.end_all_user_sessions(self.user)
+        UserSessionService._sessions.clear()
+        self.assertIsNone(UserSessionService.get_active_session(second))
+
+
+class CalendarServiceTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(company_id='CALENDAR', name='Calendário')
+
+    def schedule(self, **fields):
+        return WorkSchedule.objects.create(company=self.company, **fields)
+
+    @staticmethod
+    def march(schedule):
+        summary = CalendarService.month_summary(schedule, 2026, 3)[0]
+        return summary['business_days'], summary['worked_days'], summary['hours'], summary['night_hours']
+
+    def test_weekly_schedule_skips_holidays(self):
+        office = self.schedule(name='Comercial', code='5X2', start_time=time(8))
+        self.assertEqual(self.march(office), (22, 22, 176.0, 0.0))
+
+        # Feriados alterados invalidam o calendário (sinal); o recorrente vale em todos os anos
+        Holiday.objects.create(company=self.company, date=date(2026, 3, 19), description='Padroeiro')
+        Holiday.objects.create(company=self.company, date=date(2020, 3, 10), description='Fundação', recurring=True)
+        self.assertEqual(self.march(office), (20, 20, 160.0, 0.0))
+
+    def test_cycle_schedule_counts_night_hours(self):
+        night = self.schedule(
+            name='Plantão', code='12X36', schedule_type=WorkSchedule.ScheduleType.CYCLE,
+            cycle_work_hours=12, cycle_rest_hours=36, cycle_start_date=date(2026, 3, 1),
+            start_time=time(19), works_holidays=True
+        )
+        self.assertEqual(self.march(night), (22, 16, 192.0, 112.0))
+
+
+class AssetDashboardTests(TestCase):
+    def setUp(self):
+        caches['default'].clear()
+        self.company, self.asset = create_stock_fixture(Decimal('10'))
+
+    def dashboard(self, **kwargs):
+        data = AssetDashboardService.get(self.company.company_id, **kwargs)
+        return data['cached'], data['total_assets'], data['by_status']
+
+    def test_dashboard_is_cached_until_assets_change(self):
+        self.assertEqual(self.dashboard(), (False, 1, [{'status': 'available', 'count': 1}]))
+        self.assertEqual(self.dashboard()[:2], (True, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.asset.status = 'maintenance'
+            self.asset.save()
+        self.assertEqual(self.dashboard(), (False, 1, [{'status': 'maintenance', 'count': 1}]))
+
+
+class VersionCacheTests(TestCase):
+    def test_evicted_version_does_not_repeat(self):
+        key = 'test_version:evicted'
+        initial = get_version(key)
+        self.assertEqual(get_version(key), initial)
+
+        bump_version(key)
+        bumped = get_version(key)
+        self.assertNotEqual(bumped, initial)
+
+        caches[settings.VERSION_CACHE_ALIAS].delete(key)
+        self.assertNotIn(get_version(key), (initial, bumped))
+
+
+class StockConcurrencyTests(TransactionTestCase):
+    """
+    Vários leitores movimentando o mesmo ativo em paralelo: nenhuma
+    atualização pode ser perdida e o estoque nunca fica negativo. No SQLite
+    os leitores são serializados (ver stock_benchmark.writer_lock); o piso
+    de vazão fica no benchmark.
+    """
+
+    def test_concurrent_movements_do_not_drift(self):
+        _, asset = create_stock_fixture(Decimal('100'))
+
+        results = run_concurrent_movements(asset.pk, THREADS, OPERATIONS)
+
+        asset.refresh_from_db()
+        self.assertEqual(sum(results.values()), THREADS * OPERATIONS)
+        self.assertGreaterEqual(asset.quantity, 0)
+        self.assertEqual(asset.quantity, Decimal('100') + results['entries'] - results['exits'])
@@ -16,6 +16,13 @@ from .views import (
     AssetCategoryViewSet,
     AssetMovementViewSet,
     UserSessionViewSet,
+    WorkScheduleViewSet,
+    HolidayViewSet,
+    ContractViewSet,
+    ContractLineViewSet,
+    CustomerPriceListViewSet,
+    QuoteView,
+    MaintenancePlanViewSet,
 )
 from .auth_custom.views_auth_custom import (
     LoginView,
@@ -35,13 +42,23 @@ router.register(r'customers', CustomerViewSet, basename='customer')
 router.register(r'taxes', TaxViewSet, basename='tax')
 router.register(r'supplies', SupplyViewSet, basename='supply')
 router.register(r'supplies-prices', SuppliesPriceListViewSet, basename='supplies-price-list')  # Nova rota
+router.register(r'customer-prices', CustomerPriceListViewSet, basename='customer-price-list')
 router.register(r'users', UserViewSet, basename='user')
 
+# Preço
+router.register(r'work-schedules', WorkScheduleViewSet, basename='work-schedule')
+router.register(r'holidays', HolidayViewSet, basename='holiday')
+
+# Comercial
+router.register(r'contracts', ContractViewSet, basename='contract')
+router.register(r'contract-lines', ContractLineViewSet, basename='contract-line')
+
 # Assets
 router.register(r'assets', AssetViewSet, basename='asset')
 router.register(r'asset-groups', AssetGroupViewSet, basename='asset-group')
 router.register(r'asset-categories', AssetCategoryViewSet, basename='asset-category')
 router.register(r'asset-movements', AssetMovementViewSet, basename='asset-movement')
+router.register(r'maintenance-plans', MaintenancePlanViewSet, basename='maintenance-plan')
 
 # Sessions
 router.register(r'sessions', UserSessionViewSet, basename='session')
@@ -79,6 +96,11 @@ specific_urls = [
     path('supplies-prices/by-supply/', 
          SuppliesPriceListViewSet.as_view({'get': 'by_supply'}), 
          name='supplies-prices-by-supply'),
+
+    # Precificação de orçamentos
+    path('pricing/quote/',
+         QuoteView.as_view(),
+         name='pricing-quote'),
 ]
 
 # Combining all URLs
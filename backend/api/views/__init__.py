@@ -12,6 +12,10 @@ from .user_view import UserViewSet
 from .login_view import LoginView, LogoutView, ValidateTokenView
 from .usersession_view import UserSessionViewSet
 from .supplies_price_list_view import SuppliesPriceListViewSet
+from .work_schedule_view import WorkScheduleViewSet, HolidayViewSet
+from .contract_view import ContractViewSet, ContractLineViewSet
+from .pricing_view import CustomerPriceListViewSet, QuoteView
+from .maintenance_view import MaintenancePlanViewSet
 
 __all__ = [
     'BaseViewSet',
@@ -30,8 +34,18 @@ __all__ = [
     
     'TaxViewSet',
 
+    'WorkScheduleViewSet',
+    'HolidayViewSet',
+
+    'ContractViewSet',
+    'ContractLineViewSet',
+
+    'CustomerPriceListViewSet',
+    'QuoteView',
+
     'AssetViewSet',
     'AssetGroupViewSet',
     'AssetCategoryViewSet',
     'AssetMovementViewSet',
+    'MaintenancePlanViewSet',
 ]
\ No newline at end of file
@@ -1,14 +1,82 @@
 
 # apps/assets/views/asset_movement_views.py
 from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import transaction
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
 from ..models import AssetMovement, Asset
 from ..serializers import AssetMovementSerializer
+from ..serializers.asset_movement_serializer import (
+    AssetMovementBatchSerializer,
+    AssetMovementDecisionSerializer,
+    MovementReportQuerySerializer,
+)
+from ..services.stock_service import StockService, InsufficientStockError, StockBatchError
+from ..services.movement_rollup_service import MovementRollupService
 #from utils.mixins import BaseViewSetMixin
 from core.utils.mixins import BaseViewSetMixin  # Import atualizado
+import django_filters
+
+PENDING_QUEUE_DEFAULT_LIMIT = 100
+PENDING_QUEUE_MAX_LIMIT = 1000
+
+
+# Configuração do índice de texto completo da descrição (migração 0023)
+SEARCH_CONFIG = 'portuguese'
+
+
+def approval_required():
+    return getattr(settings, 'ASSET_MOVEMENT_REQUIRE_APPROVAL', False)
+
+
+class AssetMovementFilter(django_filters.FilterSet):
+    """
+    Filtro customizado para movimentações
+    """
+    movement_date_after = django_filters.DateFilter(field_name="movement_date", lookup_expr='gte')
+    movement_date_before = django_filters.DateFilter(field_name="movement_date", lookup_expr='lte')
+
+    class Meta:
+        model = AssetMovement
+        fields = ['movement_type', 'asset', 'movement_date', 'status']
+
+
+class AssetMovementSearchFilter(filters.SearchFilter):
+    """
+    Busca por número do documento (exato ou prefixo) ou pela descrição.
+
+    No PostgreSQL a descrição usa texto completo (índice GIN) e o prefixo do
+    documento o índice varchar_pattern_ops; nos demais bancos o prefixo é uma
+    faixa sobre o índice (empresa, documento) e a descrição usa icontains.
+    """
+    search_description = 'Número do documento (ou início dele) ou termos da descrição'
+
+    def filter_queryset(self, request, queryset, view):
+        term = request.query_params.get(self.search_param, '').strip()
+        if not term:
+            return queryset
+
+        if connection.vendor == 'postgresql':
+            return queryset.annotate(
+                description_search=SearchVector('description', config=SEARCH_CONFIG)
+            ).filter(
+                Q(document_number__startswith=term)
+                | Q(description_search=SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch'))
+            )
+
+        # LIKE com ESCAPE (startswith) não usa índice no SQLite
+        return queryset.filter(
+            Q(document_number__gte=term, document_number__lt=term + '\U0010ffff')
+            | Q(description__icontains=term)
+        )
+
+
 
 class AssetMovementViewSet(BaseViewSetMixin, viewsets.ModelViewSet):
     """
@@ -17,17 +85,20 @@ class AssetMovementViewSet(BaseViewSetMixin, viewsets.ModelViewSet):
     queryset = AssetMovement.objects.all()
     serializer_class = AssetMovementSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['movement_type', 'asset', 'movement_date']
-    search_fields = ['reference_document', 'notes']
+    filter_backends = [DjangoFilterBackend, AssetMovementSearchFilter, filters.OrderingFilter]
+    filterset_class = AssetMovementFilter
+    search_fields = ['document_number', 'description']
     ordering_fields = ['movement_date', 'created']
-    ordering = ['-movement_date']
+    ordering = ['-movement_date', '-created']
 
     def get_queryset(self):
         """
-        Customiza o queryset base
+        Customiza o queryset base (movimentações da empresa do usuário,
+        atendidas pelos índices que começam pela empresa)
         """
-        return super().get_queryset().select_related(
+        return super().get_queryset().filter(
+            company=self.request.user.company
+        ).select_related(
             'asset',
             'created_by'
         )
@@ -35,48 +106,224 @@ class AssetMovementViewSet(BaseViewSetMixin, viewsets.ModelViewSet):
     @transaction.atomic
     def perform_create(self, serializer):
         """
-        Sobrescreve o método de criação para atualizar o estoque do ativo
-        """
-        movement = serializer.save()
-        asset = movement.asset
-        
-        # Atualiza a quantidade do ativo baseado no tipo de movimento
-        if movement.movement_type == 'in':
-            asset.quantity += movement.quantity
-        elif movement.movement_type in ['out', 'transfer']:
-            asset.quantity -= movement.quantity
-        elif movement.movement_type == 'adjustment':
-            asset.quantity = movement.quantity
-            
-        # Atualiza a localização para transferências
-        if movement.movement_type == 'transfer' and movement.to_location:
-            asset.location = movement.to_location
-            
-        asset.save()
+        Sobrescreve o método de criação para atualizar o estoque do ativo.
+        O estoque é alterado por um UPDATE condicional e a movimentação é
+        lançada no razão; sem saldo suficiente a transação é desfeita.
+        Com ASSET_MOVEMENT_REQUIRE_APPROVAL a movimentação fica pendente e
+        o estoque só é alterado na aprovação.
+        """
+        if approval_required():
+            serializer.save(company=self.request.user.company, status=AssetMovement.PENDING)
+            return
+
+        movement = serializer.save(
+            company=self.request.user.company,
+            status=AssetMovement.APPROVED,
+            approved_by=self.request.user,
+            approved_at=timezone.now()
+        )
+        StockService.post(movement)
 
     def create(self, request, *args, **kwargs):
         """
-        Sobrescreve o método create para adicionar validações adicionais
+        Sobrescreve o método create para retornar erro de estoque insuficiente
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        
-        # Validações adicionais de negócio
-        asset = serializer.validated_data['asset']
-        quantity = serializer.validated_data['quantity']
-        movement_type = serializer.validated_data['movement_type']
-        
-        if movement_type in ['out', 'transfer']:
-            if asset.quantity < quantity:
-                return Response(
-                    {"detail": "Quantidade insuficiente em estoque."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-        
-        self.perform_create(serializer)
+
+        try:
+            self.perform_create(serializer)
+        except InsufficientStockError:
+            return Response(
+                {"detail": "Quantidade insuficiente em estoque."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
         headers = self.get_success_headers(serializer.data)
         return Response(
             serializer.data, 
             status=status.HTTP_201_CREATED, 
             headers=headers
-        )
\ No newline at end of file
+        )
+
+    @action(detail=False, methods=['post'])
+    def batch(self, request):
+        """
+        Lança um lote de movimentações em uma única transação.
+
+        Body: {"mode": "atomic" | "best_effort", "movements": [...]}
+        - atomic: qualquer erro rejeita o lote inteiro
+        - best_effort: grava as linhas válidas e reporta os erros das demais
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = AssetMovementBatchSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        atomic = data['mode'] == AssetMovementBatchSerializer.MODE_ATOMIC
+        errors = data['errors']
+
+        movements = []
+        if approval_required() and not (atomic and errors):
+            movements = StockService.create_pending_batch(
+                data['lines'], request.user.company.company_id, request.user
+            )
+        elif not (atomic and errors):
+            try:
+                movements, stock_errors = StockService.post_batch(
+                    data['lines'],
+                    request.user.company.company_id,
+                    request.user,
+                    atomic=atomic
+                )
+                errors.update(stock_errors)
+            except StockBatchError as exc:
+                errors.update(exc.line_errors)
+
+        return Response(
+            {
+                'mode': data['mode'],
+                'created': len(movements),
+                'movements': [movement.pk for movement in movements],
+                'errors': [
+                    {'index': index, 'errors': errors[index]}
+                    for index in sorted(errors)
+                ],
+            },
+            status=status.HTTP_201_CREATED if movements else status.HTTP_400_BAD_REQUEST
+        )
+
+    @action(detail=False, methods=['get'])
+    def pending(self, request):
+        """
+        Fila de movimentações pendentes em ordem de criação, paginada por
+        cursor: ?after=<next_cursor>&limit=<até 1000>
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            after = int(request.query_params.get('after') or 0)
+            limit = int(request.query_params.get('limit') or PENDING_QUEUE_DEFAULT_LIMIT)
+        except ValueError:
+            return Response(
+                {"detail": "Cursor e limite devem ser números inteiros."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, PENDING_QUEUE_MAX_LIMIT))
+
+        movements = list(
+            AssetMovement.objects.filter(
+                company=request.user.company,
+                status=AssetMovement.PENDING,
+                enabled=True,
+                assetmovement_id__gt=after
+            ).select_related('asset', 'created_by').order_by('assetmovement_id')[:limit + 1]
+        )
+        has_more = len(movements) > limit
+        movements = movements[:limit]
+
+        return Response({
+            'results': self.get_serializer(movements, many=True).data,
+            'next_cursor': movements[-1].pk if movements else after,
+            'has_more': has_more,
+        })
+
+    def _decision_data(self, request):
+        serializer = AssetMovementDecisionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data
+
+    @action(detail=False, methods=['post'])
+    def approve(self, request):
+        """
+        Aprova movimentações pendentes em lote e aplica seus efeitos no estoque.
+
+        Body: {"ids": [...], "mode": "atomic" | "best_effort"}
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = self._decision_data(request)
+        approved, errors = [], {}
+        try:
+            approved, errors = StockService.approve_batch(
+                data['ids'],
+                request.user.company.company_id,
+                request.user,
+                atomic=data['mode'] == AssetMovementDecisionSerializer.MODE_ATOMIC
+            )
+        except StockBatchError as exc:
+            errors = exc.line_errors
+
+        return Response(
+            {
+                'mode': data['mode'],
+                'approved': approved,
+                'errors': [
+                    {'id': movement_id, 'errors': errors[movement_id]}
+                    for movement_id in sorted(errors)
+                ],
+            },
+            status=status.HTTP_200_OK if approved else status.HTTP_400_BAD_REQUEST
+        )
+
+    @action(detail=False, methods=['post'])
+    def reject(self, request):
+        """
+        Rejeita movimentações pendentes em lote. Body: {"ids": [...]}
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        data = self._decision_data(request)
+        rejected = StockService.reject_batch(
+            data['ids'], request.user.company.company_id, request.user
+        )
+        return Response({'rejected': rejected, 'ignored': len(data['ids']) - rejected})
+
+    @action(detail=False, methods=['get'])
+    def report(self, request):
+        """
+        Entradas, saídas e transferências aprovadas por período, a partir dos
+        totais diários/mensais: ?period=month|day&start=&end=
+        &group_by=asset_group,location&movement_type=
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        query = MovementReportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        return Response({
+            'period': params['period'],
+            'start': params['start'],
+            'end': params['end'],
+            'group_by': params['group_by'],
+            'results': MovementRollupService.report(
+                request.user.company.company_id,
+                params['period'],
+                params['start'],
+                params['end'],
+                params['group_by'],
+                params.get('movement_type')
+            ),
+        })
+
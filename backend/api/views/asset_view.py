@@ -3,14 +3,38 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q, Count, F
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.http import HttpResponse, StreamingHttpResponse
+from datetime import date, datetime, time, timedelta
+import csv
+import io
+from openpyxl import Workbook
 from ..models import Asset
+from ..services.stock_ledger_service import StockLedgerService
+from ..services.asset_dashboard_service import AssetDashboardService
+from ..services.low_stock_service import LowStockService, FEED_DEFAULT_LIMIT
+from ..services.asset_location_service import AssetLocationService
+from ..services.asset_stock_service import AssetStockService
+from ..services.valuation_service import ValuationService
+from ..services.stock_reconciliation_service import StockReconciliationService, REPORT_DEFAULT_LIMIT
+from ..services.maintenance_service import MaintenanceService, QUEUE_DEFAULT_DAYS, QUEUE_DEFAULT_LIMIT
+from ..services.asset_import_service import AssetImportService, AssetImportError
+from ..services.asset_scan_service import AssetScanService
+from ..serializers.maintenance_serializer import MaintenanceCompletionSerializer
 from ..serializers.asset_serializer import AssetSerializer, AssetListSerializer  # Caminho correto para os serializers
 from core.utils.mixins import BaseViewSetMixin
 import django_filters
 
+
+class _Echo:
+    """Buffer de escrita para o csv.writer em respostas em streaming"""
+    def write(self, value):
+        return value
+
+
 class AssetFilter(django_filters.FilterSet):
     """
     Filtro customizado para ativos
@@ -59,41 +83,391 @@ class AssetViewSet(BaseViewSetMixin, viewsets.ModelViewSet):
         queryset = super().get_queryset()
         queryset = queryset.select_related('asset_group', 'category')
         
-        # Filtro por quantidade mínima
+        # Filtro por quantidade mínima (flag mantido a cada movimentação, com índice parcial)
         low_stock = self.request.query_params.get('low_stock', None)
         if low_stock:
-            queryset = queryset.filter(quantity__lte=F('minimum_quantity'))
+            queryset = queryset.filter(is_low_stock=True)
         
         return queryset
 
     @action(detail=False, methods=['get'])
     def dashboard(self, request):
         """
-        Endpoint para dados do dashboard
+        Endpoint para dados do dashboard (em cache por empresa).
+        ?max_staleness=<segundos> força o recálculo se o cache for mais antigo.
         """
-        queryset = self.get_queryset()
-        
-        total_assets = queryset.count()
-        low_stock = queryset.filter(quantity__lte=F('minimum_quantity')).count()
-        maintenance_needed = queryset.filter(
-            Q(next_maintenance__lte=timezone.now()) & 
-            Q(status='available')
-        ).count()
-        
-        by_status = queryset.values('status').annotate(
-            count=Count('id')
-        ).order_by('status')
-        
-        by_group = queryset.values(
-            'asset_group__name'
-        ).annotate(
-            count=Count('id')
-        ).order_by('asset_group__name')
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_staleness = request.query_params.get('max_staleness')
+        if max_staleness is not None:
+            try:
+                max_staleness = float(max_staleness)
+            except ValueError:
+                raise ValidationError({'max_staleness': 'Informe um número de segundos.'})
+            if max_staleness < 0:
+                raise ValidationError({'max_staleness': 'Informe um número de segundos.'})
+
+        return Response(AssetDashboardService.get(request.user.company.company_id, max_staleness))
+
+    @action(detail=False, methods=['get'], url_path=r'scan/(?P<code>[^/]+)')
+    def scan(self, request, code=None):
+        """
+        Localiza o ativo pelo código lido (código do ativo, patrimonial ou
+        número de série), sem diferenciar maiúsculas
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        found = AssetScanService.lookup(
+            request.user.company.company_id, code, lambda asset: AssetSerializer(asset).data
+        )
+        if found is None:
+            return Response(
+                {"detail": "Nenhum ativo encontrado para o código informado."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        data, matched_by = found
+        return Response({**data, 'matched_by': matched_by})
+
+    @action(detail=False, methods=['get'], url_path='low-stock-feed')
+    def low_stock_feed(self, request):
+        """
+        Transições de estoque baixo desde o cursor informado:
+        ?cursor=<next_cursor da chamada anterior>&limit=<até 1000>
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            cursor = int(request.query_params.get('cursor') or 0)
+            limit = int(request.query_params.get('limit') or FEED_DEFAULT_LIMIT)
+        except ValueError:
+            raise ValidationError({'cursor': 'Cursor e limite devem ser números inteiros.'})
+
+        return Response(LowStockService.feed(request.user.company.company_id, cursor, limit))
+
+    def _parse_date(self, name, default=None):
+        value = self.request.query_params.get(name)
+        if not value:
+            return default
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValidationError({name: 'Data inválida. Use o formato AAAA-MM-DD.'})
+
+    def _parse_datetime(self, name):
+        """
+        Instante informado como data-hora ISO ou data (considera o final do dia)
+        """
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+
+        try:
+            parsed = datetime.combine(date.fromisoformat(value), time.max)
+        except ValueError:
+            try:
+                parsed = parse_datetime(value)
+            except ValueError:
+                parsed = None
+        if parsed is None:
+            raise ValidationError({name: 'Data inválida. Use AAAA-MM-DD ou AAAA-MM-DDTHH:MM.'})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    @action(detail=True, methods=['get'], url_path='location-history')
+    def location_history(self, request, pk=None):
+        """
+        Histórico de localização do ativo; com ?at= retorna o local naquele instante
+        """
+        asset = self.get_object()
+        at = self._parse_datetime('at')
+        if at is None:
+            return Response(AssetLocationService.history(asset.pk))
+        return Response({'at': at, 'location': AssetLocationService.location_at(asset.pk, at)})
+
+    @action(detail=False, methods=['get'], url_path='at-location')
+    def at_location(self, request):
+        """
+        Ativos em um local: ?location=<id> (atuais) e opcionalmente ?at=<instante>
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        location = request.query_params.get('location')
+        if not location or not location.isdigit():
+            raise ValidationError({'location': 'Informe o id do local.'})
+
+        rows = AssetLocationService.assets_at(
+            request.user.company.company_id, int(location), self._parse_datetime('at')
+        )
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(rows))
+
+    @action(detail=False, methods=['get'], url_path='stock-by-location')
+    def stock_by_location(self, request):
+        """
+        Saldos por local: ?location=<id> e/ou ?asset=<id>
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        params = {}
+        for name in ('location', 'asset'):
+            value = request.query_params.get(name)
+            if value and not value.isdigit():
+                raise ValidationError({name: 'Informe um id numérico.'})
+            params[f'{name}_id'] = int(value) if value else None
+
+        rows = AssetStockService.by_location(request.user.company.company_id, **params)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(rows))
+
+    @action(detail=False, methods=['get'])
+    def valuation(self, request):
+        """
+        Valor do estoque por grupo ao final de ?date=AAAA-MM-DD (padrão: hoje),
+        pelo custo médio móvel
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(ValuationService.report(request.user.company.company_id, self._parse_date('date')))
+
+    @action(detail=True, methods=['get'])
+    def fifo(self, request, pk=None):
+        """
+        Camadas PEPS do ativo ao final de ?date=AAAA-MM-DD (padrão: hoje)
+        """
+        asset = self.get_object()
+        return Response(ValuationService.fifo_layers(asset.pk, self._parse_date('date')))
+
+    @action(detail=False, methods=['get', 'post'])
+    def reconciliation(self, request):
+        """
+        Divergências entre a quantidade dos ativos e o saldo das movimentações
+        aprovadas (?limit=<até 1000>). POST {"fix": true} corrige as quantidades.
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        company_id = request.user.company.company_id
+        try:
+            limit = int(request.query_params.get('limit') or REPORT_DEFAULT_LIMIT)
+        except ValueError:
+            raise ValidationError({'limit': 'Informe um número inteiro.'})
+
+        fixed = 0
+        if request.method == 'POST' and request.data.get('fix') is True:
+            fixed = StockReconciliationService.fix(company_id)
+
+        return Response({**StockReconciliationService.report(company_id, limit), 'fixed': fixed})
+
+    @action(detail=True, methods=['get'], url_path='balance-at')
+    def balance_at(self, request, pk=None):
+        """
+        Saldo do ativo ao final de uma data: ?date=AAAA-MM-DD (padrão: hoje)
+        """
+        asset = self.get_object()
+        on_date = self._parse_date('date', timezone.localdate())
+        return Response(StockLedgerService.balance_at(asset.pk, on_date))
+
+    @action(detail=True, methods=['get'], url_path='stock-history')
+    def stock_history(self, request, pk=None):
+        """
+        Extrato de estoque do ativo: ?start=AAAA-MM-DD&end=AAAA-MM-DD
+        (padrão: mês corrente)
+        """
+        asset = self.get_object()
+        today = timezone.localdate()
+        start = self._parse_date('start', today.replace(day=1))
+        end = self._parse_date('end', today)
+        if start > end:
+            raise ValidationError({'start': 'A data inicial deve ser anterior à data final.'})
+        return Response(StockLedgerService.history(asset.pk, start, end))
+
+    @action(detail=False, methods=['get'], url_path='maintenance-queue')
+    def maintenance_queue(self, request):
+        """
+        Manutenções previstas nos próximos ?days=<N> dias (inclui atrasadas),
+        agrupadas por localização: ?cursor=<next_cursor>&limit=<até 1000>
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            days = int(request.query_params.get('days') or QUEUE_DEFAULT_DAYS)
+            limit = int(request.query_params.get('limit') or QUEUE_DEFAULT_LIMIT)
+        except ValueError:
+            raise ValidationError({'days': 'Dias e limite devem ser números inteiros.'})
+        if days < 0:
+            raise ValidationError({'days': 'Informe um número de dias positivo.'})
+
+        try:
+            return Response(MaintenanceService.queue(
+                request.user.company.company_id,
+                timezone.localdate() + timedelta(days=days),
+                request.query_params.get('cursor'),
+                limit
+            ))
+        except ValueError:
+            raise ValidationError({'cursor': 'Cursor inválido.'})
+
+    @action(detail=False, methods=['post'], url_path='maintenance-complete')
+    def maintenance_complete(self, request):
+        """
+        Registra a conclusão da manutenção dos ativos e agenda a próxima
+        pelo plano da categoria. Body: {"assets": [...], "performed_at": "AAAA-MM-DD"}
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = MaintenanceCompletionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        records, not_found = MaintenanceService.complete(
+            request.user.company.company_id,
+            data['assets'],
+            data.get('performed_at') or timezone.localdate(),
+            request.user,
+            data.get('notes')
+        )
+        next_dates = dict(
+            Asset.objects.filter(pk__in=[record.asset_id for record in records]).values_list('pk', 'next_maintenance')
+        )
+        return Response(
+            {
+                'completed': [
+                    {
+                        'asset_id': record.asset_id,
+                        'plan': record.plan_id,
+                        'next_maintenance': next_dates.get(record.asset_id),
+                    }
+                    for record in records
+                ],
+                'not_found': not_found,
+            },
+            status=status.HTTP_201_CREATED if records else status.HTTP_400_BAD_REQUEST
+        )
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Exporta os ativos filtrados no layout da importação.
+        Parâmetro file_format: csv (padrão, em streaming) ou xlsx.
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file_format = request.query_params.get('file_format', 'csv').lower()
+        if file_format not in ('csv', 'xlsx'):
+            raise ValidationError({'file_format': 'Use csv ou xlsx.'})
+
+        queryset = self.filter_queryset(self.get_queryset()).filter(company=request.user.company)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        company_name = request.user.company.name.lower().replace(' ', '_')
+        filename = f'ativos_{company_name}_{timestamp}.{file_format}'
+        headers = {
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'Access-Control-Expose-Headers': 'Content-Disposition'
+        }
+
+        if file_format == 'csv':
+            writer = csv.writer(_Echo(), delimiter=';', quoting=csv.QUOTE_ALL)
+            content = (
+                ('\ufeff' if index == 0 else '') + writer.writerow(row)
+                for index, row in enumerate(AssetImportService.export_rows(queryset))
+            )
+            return StreamingHttpResponse(content, content_type='text/csv', headers=headers)
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet('Ativos')
+        for row in AssetImportService.export_rows(queryset, as_text=False):
+            sheet.append(row)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+        return HttpResponse(
+            buffer.getvalue(),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            headers=headers
+        )
+
+    @action(detail=False, methods=['post'])
+    def import_assets(self, request):
+        """
+        Importa ativos de arquivo CSV (separado por ';') ou XLSX no layout da
+        exportação. Ativos existentes são atualizados pelo código; linhas sem
+        código recebem o próximo código da empresa.
+        """
+        if not request.user.company:
+            return Response(
+                {"detail": "Usuário não está associado a uma empresa"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if 'file' not in request.FILES:
+            return Response(
+                {'error': 'Nenhum arquivo foi enviado'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file = request.FILES['file']
+        try:
+            result = AssetImportService.import_rows(
+                request.user.company.company_id,
+                AssetImportService.read_rows(file, file.name)
+            )
+        except (AssetImportError, UnicodeDecodeError, csv.Error) as e:
+            return Response(
+                {'error': f'Erro ao ler arquivo: {str(e)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        message = f'{result["created"]} ativos criados e {result["updated"]} atualizados.'
+        if result['errors']:
+            message += f' {len(result["errors"])} erros encontrados.'
 
         return Response({
-            'total_assets': total_assets,
-            'low_stock': low_stock,
-            'maintenance_needed': maintenance_needed,
-            'by_status': by_status,
-            'by_group': by_group
-        })
\ No newline at end of file
+            'success': True,
+            'message': message,
+            'created': result['created'],
+            'updated': result['updated'],
+            'errors': result['errors'] or None
+        })
@@ -0,0 +1,192 @@
+# api/views/contract_view.py
+from rest_framework import status, filters
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
+from ..models import Contract, ContractLine
+from ..serializers.contract_serializer import (
+    ContractSerializer,
+    ContractListSerializer,
+    ContractLineSerializer,
+)
+from ..services.contract_service import ContractService
+from .base_view import BaseViewSet
+
+
+class ContractViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento de contratos.
+    """
+    queryset = Contract.objects.filter(enabled=True)
+    serializer_class = ContractSerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'contract_id'
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['number', 'description', 'customer__name']
+    ordering_fields = ['number', 'start_date', 'total_value', 'created']
+    ordering = ['-start_date', 'number']
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ContractListSerializer
+        return ContractSerializer
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled
+        """
+        if not self.request.user.company:
+            return Contract.objects.none()
+
+        queryset = Contract.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        ).select_related('customer', 'price_snapshot')
+
+        status_param = self.request.query_params.get('status')
+        if status_param:
+            queryset = queryset.filter(status=status_param)
+
+        if self.action not in ('list', 'snapshot'):
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'lines',
+                    queryset=ContractLine.objects.filter(enabled=True).select_related(
+                        'supply', 'work_schedule'
+                    )
+                )
+            )
+        return queryset
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company automaticamente
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        serializer.save(company=self.request.user.company)
+
+    @action(detail=True, methods=['POST'])
+    def recalculate(self, request, contract_id=None):
+        """
+        Recalcula o total do contrato a partir dos itens
+        """
+        contract = self.get_object()
+        ContractService.recalculate_totals([contract.contract_id])
+        contract.refresh_from_db(fields=['total_value'])
+        return Response({'contract_id': contract.contract_id, 'total_value': contract.total_value})
+
+    @action(detail=True, methods=['POST'])
+    def confirm(self, request, contract_id=None):
+        """
+        Confirma a proposta e congela a composição de preços em um snapshot
+        """
+        try:
+            contract = ContractService.confirm(self.get_object())
+        except ValidationError as e:
+            return Response({'detail': e.messages}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(self.get_serializer(contract).data)
+
+    @action(detail=True, methods=['GET'])
+    def snapshot(self, request, contract_id=None):
+        """
+        Composição de preços congelada na confirmação.
+        Não consulta as tabelas de preço vigentes.
+        """
+        contract = self.get_object()
+        if not contract.price_snapshot_id:
+            return Response(
+                {'detail': 'Contrato ainda não confirmado.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response({
+            'contract_id': contract.contract_id,
+            'number': contract.number,
+            'confirmed_at': contract.confirmed_at,
+            'content_hash': contract.price_snapshot.content_hash,
+            'breakdown': contract.price_snapshot.data,
+        })
+
+
+class ContractLineViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento dos itens de contrato.
+    O total do contrato é atualizado apenas com a diferença de cada item.
+    """
+    queryset = ContractLine.objects.filter(enabled=True)
+    serializer_class = ContractLineSerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'contractline_id'
+    filter_backends = [filters.OrderingFilter]
+    ordering_fields = ['sequence', 'total_value', 'created']
+    ordering = ['sequence', 'contractline_id']
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled, com filtro opcional por contrato
+        """
+        if not self.request.user.company:
+            return ContractLine.objects.none()
+
+        queryset = ContractLine.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        ).select_related('contract', 'supply', 'work_schedule')
+
+        contract_id = self.request.query_params.get('contract_id')
+        if contract_id:
+            queryset = queryset.filter(contract_id=contract_id)
+
+        return queryset
+
+    def _save_line(self, serializer, **kwargs):
+        """
+        Calcula o preço do item antes de salvar, para que o total do contrato
+        receba um único delta por alteração
+        """
+        data = serializer.validated_data
+        instance = serializer.instance
+
+        if not data.get('manual_price', getattr(instance, 'manual_price', False)):
+            line = ContractLine(
+                company=self.request.user.company,
+                contract=data.get('contract') or instance.contract,
+                supply=data.get('supply') or instance.supply,
+                work_schedule=data['work_schedule'] if 'work_schedule' in data
+                else getattr(instance, 'work_schedule', None),
+            )
+            kwargs['unit_price'] = ContractService.line_price(line)
+
+        serializer.save(**kwargs)
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company e calcular o preço do item
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        self._save_line(serializer, company=self.request.user.company)
+
+    def perform_update(self, serializer):
+        self._save_line(serializer)
+
+    def perform_destroy(self, instance):
+        """
+        Soft delete do item; o valor é retirado do total do contrato
+        """
+        if not instance.contract.is_editable:
+            raise ValidationError('Itens só podem ser removidos de contratos em rascunho.')
+        instance.soft_delete()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, ValidationError):
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return super().handle_exception(exc)
@@ -134,7 +134,7 @@ class ValidateTokenView(APIView):
                 'user': user_data,
                 'session': {
                     'id': str(session.session_id),
-                    'last_activity': session.last_activity
+                    'last_activity': UserSessionService.last_activity(session)
                 }
             })
 
@@ -0,0 +1,49 @@
+# api/views/maintenance_view.py
+from rest_framework import filters
+from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
+from ..models import MaintenancePlan
+from ..serializers.maintenance_serializer import MaintenancePlanSerializer
+from .base_view import BaseViewSet
+
+
+class MaintenancePlanViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento de planos de manutenção por categoria.
+    """
+    queryset = MaintenancePlan.objects.filter(enabled=True)
+    serializer_class = MaintenancePlanSerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'maintenanceplan_id'
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['name', 'category__name']
+    ordering_fields = ['name', 'category__name', 'interval_days', 'created']
+    ordering = ['category__name', 'name']
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled, com filtro opcional por categoria
+        """
+        if not self.request.user.company:
+            return MaintenancePlan.objects.none()
+
+        queryset = MaintenancePlan.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        ).select_related('category')
+
+        category_id = self.request.query_params.get('category_id')
+        if category_id:
+            queryset = queryset.filter(category_id=category_id)
+
+        return queryset
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company automaticamente
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        serializer.save(company=self.request.user.company)
@@ -0,0 +1,118 @@
+# api/views/pricing_view.py
+from datetime import date
+from decimal import Decimal
+from rest_framework import status, filters
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from django.core.exceptions import ValidationError
+from ..models import CustomerPriceList
+from ..serializers.pricing_serializer import CustomerPriceListSerializer, QuoteSerializer
+from ..services.price_resolver_service import PriceResolverService
+from ..services.pricing_service import PricingService
+from .base_view import BaseViewSet
+
+
+class CustomerPriceListViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento de preços negociados por cliente.
+    """
+    queryset = CustomerPriceList.objects.filter(enabled=True)
+    serializer_class = CustomerPriceListSerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'customerpricelist_id'
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['customer__name', 'supply__name']
+    ordering_fields = ['customer__name', 'supply__name', 'value', 'created']
+    ordering = ['customer__name', 'supply__name']
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled, com filtro opcional por cliente
+        """
+        if not self.request.user.company:
+            return CustomerPriceList.objects.none()
+
+        queryset = CustomerPriceList.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        ).select_related('customer', 'supply')
+
+        customer_id = self.request.query_params.get('customer_id')
+        if customer_id:
+            queryset = queryset.filter(customer_id=customer_id)
+
+        return queryset
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company automaticamente
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        serializer.save(company=self.request.user.company)
+
+
+class QuoteView(APIView):
+    """
+    Precificação de orçamentos: resolve o preço de todos os insumos do
+    orçamento de uma vez (cliente -> empresa) e converte unidades de tempo
+    pela escala informada
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs) -> Response:
+        company = request.user.company
+        if not company:
+            return Response(
+                {'error': 'Usuário não está associado a uma empresa'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = QuoteSerializer(data=request.data, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        reference = data.get('reference_date') or date.today()
+        supplies = data['supplies']
+        schedules = data['schedules']
+        prices = PriceResolverService.resolve(
+            company.company_id,
+            [item['supply'] for item in data['items']],
+            data.get('customer')
+        )
+
+        items = []
+        total = Decimal('0')
+        for item in data['items']:
+            supply = supplies[item['supply']]
+            resolved = prices[supply.pk]
+            unit_price = PricingService.monthly_value(
+                resolved.value or Decimal('0'),
+                supply.unit_measure,
+                schedules.get(item.get('work_schedule')),
+                reference.year,
+                reference.month
+            )
+            line_total = (unit_price * item['quantity']).quantize(Decimal('0.0001'))
+            total += line_total
+            items.append({
+                'supply': supply.pk,
+                'supply_name': supply.name,
+                'unit_measure': supply.unit_measure,
+                'quantity': item['quantity'],
+                'work_schedule': item.get('work_schedule'),
+                'base_price': resolved.value,
+                'price_source': resolved.source,
+                'unit_price': unit_price,
+                'total_value': line_total,
+            })
+
+        return Response({
+            'customer': data.get('customer'),
+            'reference_date': reference,
+            'items': items,
+            'total_value': total,
+        })
@@ -4,13 +4,13 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.http import HttpResponse
-import csv
 import io
 from datetime import datetime
 from django.core.exceptions import ValidationError
 from django.db.models import Q
-from ..models import SuppliesPriceList, Supply, Tax
+from ..models import SuppliesPriceList
 from ..serializers.supplies_price_list_serializer import SuppliesPriceListSerializer
+from ..services.price_list_service import PriceListService, PriceListImportError
 from .base_view import BaseViewSet
 
 class SuppliesPriceListViewSet(BaseViewSet):
@@ -85,31 +85,7 @@ class SuppliesPriceListViewSet(BaseViewSet):
             )
 
             response.write('\ufeff')  # UTF-8 BOM
-            writer = csv.writer(response, delimiter=';', quoting=csv.QUOTE_ALL)
-            
-            writer.writerow([
-                'Insumo',
-                'Código Insumo',
-                'Imposto',
-                'Sigla Imposto',
-                'Valor',
-                'Sequência',
-                'Data de Cadastro',
-                'Última Atualização'
-            ])
-
-            price_lists = self.get_queryset()
-            for price in price_lists:
-                writer.writerow([
-                    price.supply.name,
-                    price.supply.supply_id,
-                    price.tax.description if price.tax else '',
-                    price.tax.acronym if price.tax else '',
-                    price.value,
-                    price.sequence,
-                    price.created.strftime('%d/%m/%Y %H:%M:%S'),
-                    price.updated.strftime('%d/%m/%Y %H:%M:%S')
-                ])
+            PriceListService.export_csv(self.get_queryset(), response)
 
             return response
             
@@ -140,88 +116,17 @@ class SuppliesPriceListViewSet(BaseViewSet):
 
             # Decodificar o arquivo
             decoded_file = file.read().decode('utf-8-sig')
-            io_string = io.StringIO(decoded_file)
-            reader = csv.DictReader(io_string, delimiter=';')
-            
-            # Verificar cabeçalhos obrigatórios
-            required_headers = {'Código Insumo', 'Valor'}
-            headers = set(reader.fieldnames) if reader.fieldnames else set()
-            if not required_headers.issubset(headers):
+            try:
+                success_count, error_rows = PriceListService.import_csv(
+                    request.user.company.company_id,
+                    io.StringIO(decoded_file)
+                )
+            except PriceListImportError as e:
                 return Response(
-                    {'error': f'Cabeçalhos obrigatórios faltando. Necessários: {required_headers}'},
+                    {'error': str(e)},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            success_count = 0
-            error_rows = []
-            
-            company = request.user.company
-
-            for row in reader:
-                try:
-                    # Extrair e validar dados
-                    supply_code = row.get('Código Insumo', '').strip()
-                    tax_acronym = row.get('Sigla Imposto', '').strip()
-                    
-                    try:
-                        value = float(row.get('Valor', '0').replace(',', '.'))
-                    except ValueError:
-                        raise ValidationError('Valor inválido')
-                    
-                    try:
-                        sequence = int(row.get('Sequência', '1'))
-                    except ValueError:
-                        sequence = 1
-                    
-                    # Validações básicas
-                    if not supply_code:
-                        raise ValidationError('Código do insumo é obrigatório')
-                    
-                    if value <= 0:
-                        raise ValidationError('Valor deve ser maior que zero')
-                    
-                    # Buscar supply pelo código
-                    try:
-                        supply = Supply.objects.get(
-                            supply_id=supply_code,
-                            company=company,
-                            enabled=True
-                        )
-                    except Supply.DoesNotExist:
-                        raise ValidationError(f'Insumo não encontrado: {supply_code}')
-                    
-                    # Buscar tax pela sigla (se fornecido)
-                    tax = None
-                    if tax_acronym:
-                        try:
-                            tax = Tax.objects.get(
-                                acronym=tax_acronym,
-                                company=company,
-                                enabled=True
-                            )
-                        except Tax.DoesNotExist:
-                            raise ValidationError(f'Imposto não encontrado: {tax_acronym}')
-                    
-                    # Verificar se já existe um registro para este supply+tax na mesma empresa
-                    price_list, created = SuppliesPriceList.objects.update_or_create(
-                        supply=supply,
-                        tax=tax,
-                        company=company,
-                        defaults={
-                            'value': value,
-                            'sequence': sequence,
-                            'enabled': True
-                        }
-                    )
-                    
-                    success_count += 1
-                    
-                except Exception as e:
-                    error_rows.append({
-                        'row': row,
-                        'error': str(e)
-                    })
-
             message = f'{success_count} preços importados com sucesso.'
             if error_rows:
                 message += f' {len(error_rows)} erros encontrados.'
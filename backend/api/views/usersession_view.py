@@ -26,7 +26,7 @@ class UserSessionViewSet(viewsets.ModelViewSet):
     def end_session(self, request, pk=None):
         """Encerra uma sessão específica"""
         session = self.get_object()
-        session.end_session()
+        UserSessionService.end_session(session)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=False, methods=['get'])
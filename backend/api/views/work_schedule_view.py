@@ -0,0 +1,118 @@
+# api/views/work_schedule_view.py
+from datetime import date
+from rest_framework import status, filters
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from django.core.exceptions import ValidationError
+from ..models import WorkSchedule, Holiday
+from ..serializers.work_schedule_serializer import WorkScheduleSerializer, HolidaySerializer
+from ..services.calendar_service import CalendarService
+from .base_view import BaseViewSet
+
+
+class WorkScheduleViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento de escalas de trabalho (Escalas).
+    """
+    queryset = WorkSchedule.objects.filter(enabled=True)
+    serializer_class = WorkScheduleSerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'workschedule_id'
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['name', 'code']
+    ordering_fields = ['name', 'code', 'created', 'updated']
+    ordering = ['name']
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled
+        """
+        if not self.request.user.company:
+            return WorkSchedule.objects.none()
+
+        return WorkSchedule.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        )
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company automaticamente
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        serializer.save(company=self.request.user.company)
+
+    @action(detail=True, methods=['GET'])
+    def calendar(self, request, workschedule_id=None):
+        """
+        Endpoint com o resumo mensal da escala (mês padrão):
+        dias úteis, feriados, dias/horas trabalhadas e horas noturnas
+        """
+        schedule = self.get_object()
+        try:
+            year = int(request.query_params.get('year', date.today().year))
+            month = request.query_params.get('month')
+            month = int(month) if month else None
+        except ValueError:
+            return Response(
+                {'error': 'Parâmetros year/month inválidos'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if month is not None and not 1 <= month <= 12:
+            return Response(
+                {'error': 'O mês deve estar entre 1 e 12'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            'workschedule_id': schedule.workschedule_id,
+            'code': schedule.code,
+            'months': CalendarService.month_summary(schedule, year, month)
+        })
+
+
+class HolidayViewSet(BaseViewSet):
+    """
+    ViewSet para gerenciamento de feriados da empresa.
+    """
+    queryset = Holiday.objects.filter(enabled=True)
+    serializer_class = HolidaySerializer
+
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'holiday_id'
+    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    search_fields = ['description']
+    ordering_fields = ['date', 'description']
+    ordering = ['date']
+
+    def get_queryset(self):
+        """
+        Retorna queryset filtrado por company e enabled, com filtro opcional por ano
+        """
+        if not self.request.user.company:
+            return Holiday.objects.none()
+
+        queryset = Holiday.objects.filter(
+            company=self.request.user.company,
+            enabled=True
+        )
+
+        year = self.request.query_params.get('year')
+        if year and year.isdigit():
+            queryset = queryset.filter(date__year=int(year))
+
+        return queryset
+
+    def perform_create(self, serializer):
+        """
+        Sobrescreve criação para incluir company automaticamente
+        """
+        if not self.request.user.company:
+            raise ValidationError('Usuário não está associado a uma empresa')
+
+        serializer.save(company=self.request.user.company)
@@ -169,7 +169,8 @@ REST_FRAMEWORK = {
 
     
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',  # Mudamos para usar a classe base do JWT
+        # Usuário e empresa em uma consulta, com cache por processo (ver CustomJWTAuthentication)
+        'api.auth_custom.authentication_auth_custom.CustomJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -246,4 +247,81 @@ SPECTACULAR_SETTINGS = {
 }
 
 # Em settings.py
-APPEND_SLASH = False
\ No newline at end of file
+APPEND_SLASH = False
+
+# Cache do Django. As versões de invalidação (core.utils.cache: usuário
+# autenticado, dashboard, preços, calendários) e o cache compartilhado de
+# sessões só valem entre processos se o cache for compartilhado: com mais de
+# um worker, defina CACHE_REDIS_URL. Sem ela, LocMemCache fica restrito ao
+# processo e serve apenas para um único processo (runserver, testes): em
+# outros workers a invalidação só vale ao fim do TTL de cada cache local.
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+        },
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'versions',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'default',
+        },
+        # Separado do default para que entradas do dashboard não provoquem o
+        # descarte das versões
+        'versions': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'versions',
+            'OPTIONS': {'MAX_ENTRIES': 100000},
+        },
+    }
+
+# Alias do cache que guarda as versões de invalidação
+VERSION_CACHE_ALIAS = 'versions'
+
+# Cache de preços resolvidos (cliente -> empresa), por processo
+PRICE_CACHE_TTL = 300  # segundos
+PRICE_CACHE_MAX_ENTRIES = 512
+
+# Cache do dashboard de ativos, por empresa (invalidado a cada alteração)
+ASSET_DASHBOARD_CACHE_TTL = 300  # segundos
+
+# Cache de códigos lidos por scanner (empresa, código -> ativo), por processo
+ASSET_SCAN_CACHE_TTL = 300  # segundos
+ASSET_SCAN_CACHE_MAX_ENTRIES = 4096
+
+# Cache de sessões ativas por session_id (local; compartilhado via cache do Django
+# se habilitado, o que exige CACHE_REDIS_URL com mais de um processo)
+USER_SESSION_CACHE_TTL = 30  # segundos
+USER_SESSION_CACHE_MAX_ENTRIES = 2048
+USER_SESSION_CACHE_SHARED = False
+USER_SESSION_SHARED_CACHE_TTL = 300  # segundos
+
+# Cache do usuário autenticado (com a empresa), por processo; invalidado ao salvar usuário/empresa
+AUTH_USER_CACHE_TTL = 60  # segundos
+AUTH_USER_CACHE_MAX_ENTRIES = 1024
+
+# Atividade das sessões (X-Session-ID): gravada só se a última for mais antiga
+# que o limite, acumulada no processo e gravada em lote
+USER_SESSION_ACTIVITY_THRESHOLD = 60  # segundos
+USER_SESSION_ACTIVITY_FLUSH_INTERVAL = 30  # segundos
+USER_SESSION_ACTIVITY_FLUSH_SIZE = 500
+
+# Feed de estoque baixo: só entrega eventos criados há pelo menos este tempo,
+# para que o cursor não passe por eventos de transações ainda não confirmadas
+# (deve ser maior que a duração das transações de movimentação)
+LOW_STOCK_FEED_SETTLE_SECONDS = 30
+
+# Movimentações de ativos criadas como pendentes, aplicadas ao estoque só após aprovação
+ASSET_MOVEMENT_REQUIRE_APPROVAL = False
+
+# Local do saldo inicial dos ativos cujo campo `location` não corresponde a
+# nenhum local cadastrado (criado sob demanda por empresa)
+STOCK_DEFAULT_LOCATION_NAME = 'Estoque Geral'
\ No newline at end of file
@@ -0,0 +1,94 @@
+# core/utils/bulk.py
+from typing import Iterable, Sequence, Tuple
+
+from django.db import connection
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def supports_update_from() -> bool:
+    """
+    Banco suporta UPDATE ... FROM (PostgreSQL; SQLite a partir da 3.33)
+    """
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.Database.sqlite_version_info >= (3, 33)
+
+
+def bulk_update_values(
+    model,
+    field_name: str,
+    rows: Iterable[Tuple[object, object]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **constant_fields
+) -> None:
+    """
+    Grava valores distintos de uma coluna por chave primária, com um
+    UPDATE ... FROM (VALUES ...) por lote. Campos em `constant_fields`
+    recebem o mesmo valor em todas as linhas.
+
+    O bulk_update do Django monta em Python um CASE WHEN por registro, o que
+    domina o tempo em lotes grandes; ele é usado apenas nos bancos sem
+    suporte a UPDATE ... FROM.
+
+    Args:
+        rows: pares (pk, valor)
+    """
+    bulk_update_rows(model, [field_name], rows, batch_size, **constant_fields)
+
+
+def bulk_update_rows(
+    model,
+    field_names: Sequence[str],
+    rows: Iterable[Sequence[object]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **constant_fields
+) -> None:
+    """
+    Como bulk_update_values, para várias colunas: cada linha é
+    (pk, valor do 1º campo, valor do 2º campo, ...).
+    """
+    rows = list(rows)
+    if not rows:
+        return
+
+    if not supports_update_from():
+        model.objects.bulk_update(
+            [model(pk=row[0], **dict(zip(field_names, row[1:])), **constant_fields) for row in rows],
+            [*field_names, *constant_fields],
+            batch_size=batch_size
+        )
+        return
+
+    opts = model._meta
+    quote = connection.ops.quote_name
+    table = quote(opts.db_table)
+    fields = [opts.get_field(name) for name in field_names]
+
+    assignments = []
+    for index, field in enumerate(fields, start=2):
+        value = f'new_values.column{index}'
+        if connection.vendor == 'postgresql':
+            # Colunas de VALUES só com parâmetros/NULL são inferidas como texto
+            value = f'CAST({value} AS {field.db_type(connection)})'
+        assignments.append(f'{quote(field.column)} = {value}')
+    constant_params = []
+    for name, value in constant_fields.items():
+        constant = opts.get_field(name)
+        assignments.append(f'{quote(constant.column)} = %s')
+        constant_params.append(constant.get_db_prep_save(value, connection))
+
+    placeholder = f"({', '.join(['%s'] * (len(fields) + 1))})"
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            params = list(constant_params)
+            for pk, *values in batch:
+                params.append(pk)
+                params.extend(field.get_db_prep_save(value, connection) for field, value in zip(fields, values))
+            cursor.execute(
+                f"UPDATE {table} SET {', '.join(assignments)} "
+                f"FROM (VALUES {', '.join([placeholder] * len(batch))}) AS new_values "
+                f"WHERE {table}.{quote(opts.pk.column)} = new_values.column1",
+                params
+            )
@@ -0,0 +1,98 @@
+# core/utils/cache.py
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+class TTLCache:
+    """
+    Cache LRU em memória (por processo) com expiração por tempo.
+    Seguro para uso entre threads.
+    """
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, self._MISSING)
+            if item is self._MISSING:
+                return default
+
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def _versions_cache():
+    return caches[getattr(settings, 'VERSION_CACHE_ALIAS', 'default')]
+
+
+def _new_version() -> int:
+    # Aleatória: não se repete entre processos nem após o descarte da chave
+    return secrets.randbits(63)
+
+
+def get_versions(keys) -> list:
+    """
+    Versões compartilhadas (via cache do Django) usadas para invalidar caches locais.
+
+    Uma chave ausente (nunca incrementada ou descartada pelo cache) recebe uma
+    versão nova em vez de 0: se a versão incrementada for descartada, as
+    entradas locais antigas não voltam a valer. A invalidação só alcança
+    outros processos se o cache de VERSION_CACHE_ALIAS for compartilhado
+    (ver CACHES em settings); com LocMemCache ela vale apenas no processo.
+    """
+    cache = _versions_cache()
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    for key in missing:
+        cache.add(key, _new_version(), timeout=None)
+    if missing:
+        versions.update(cache.get_many(missing))
+    return [versions.get(key, 0) for key in keys]
+
+
+def get_version(key: str) -> int:
+    """
+    Versão compartilhada de uma chave (ver get_versions)
+    """
+    return get_versions([key])[0]
+
+
+def bump_version(key: str) -> None:
+    """
+    Troca a versão compartilhada, invalidando os caches que dependem dela
+    """
+    _versions_cache().set(key, _new_version(), timeout=None)